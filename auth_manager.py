@@ -1,15 +1,21 @@
 import hashlib
 import secrets
+import time
 import jwt
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Dict
 import sqlite3
 from pathlib import Path
 
 class AuthManager:
+    # Maximum number of verified tokens remembered by verify_token
+    TOKEN_CACHE_MAX_ENTRIES = 1024
+    
     def __init__(self, db_path: str = "data/albums.db"):
         self.db_path = db_path
         self.secret_key = self._get_or_create_secret_key()
+        # sha256(token) -> expiry timestamp of tokens that already passed verification
+        self._verified_tokens: Dict[str, float] = {}
         self._init_auth_table()
     
     def _get_or_create_secret_key(self) -> str:
@@ -149,14 +155,32 @@ class AuthManager:
         return jwt.encode(payload, self.secret_key, algorithm='HS256')
     
     def verify_token(self, token: str) -> bool:
-        """Verify a JWT token"""
+        """Verify a JWT token
+        
+        Valid admin tokens are remembered until they expire, so repeated calls
+        with the same token skip the JWT decode and signature check.
+        """
+        token_hash = hashlib.sha256(token.encode('utf-8')).hexdigest()
+        expires_at = self._verified_tokens.get(token_hash)
+        if expires_at is not None:
+            if time.time() < expires_at:
+                return True
+            del self._verified_tokens[token_hash]
+        
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=['HS256'])
-            return payload.get('admin', False)
         except jwt.ExpiredSignatureError:
             return False
         except jwt.InvalidTokenError:
             return False
+        
+        is_admin = payload.get('admin', False)
+        if is_admin and 'exp' in payload:
+            # Evict the oldest entry (dicts keep insertion order) when full
+            if len(self._verified_tokens) >= self.TOKEN_CACHE_MAX_ENTRIES:
+                self._verified_tokens.pop(next(iter(self._verified_tokens)))
+            self._verified_tokens[token_hash] = float(payload['exp'])
+        return is_admin
     
     def get_auth_status(self) -> dict:
         """Get authentication status information"""
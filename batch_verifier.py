@@ -6,7 +6,9 @@ Verifies YouTube and Bandcamp links for multiple albums efficiently
 
 import asyncio
 import logging
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional
+import config
+from browser_pool import BrowserContextPool
 from db_manager import AlbumsDatabase
 from scraper import MetalArchivesScraper
 from platform_verifier import PlatformVerifier
@@ -14,16 +16,28 @@ from platform_verifier import PlatformVerifier
 logger = logging.getLogger(__name__)
 
 class BatchVerifier:
-    """Batch verify playable URLs for albums."""
+    """
+    Batch verify playable URLs for albums.
+    
+    Without a pool, albums are verified one at a time on a single scraper page.
+    With a BrowserContextPool, up to `concurrency` albums are verified at once,
+    each on its own page in a pooled context of the shared browser.
+    """
     
-    def __init__(self, db: AlbumsDatabase, headless: bool = True):
+    def __init__(self, db: AlbumsDatabase, headless: bool = True,
+                 pool: Optional[BrowserContextPool] = None,
+                 concurrency: int = config.VERIFY_CONCURRENCY):
         self.db = db
         self.headless = headless
+        self.pool = pool
+        self.concurrency = max(1, concurrency)
         self.scraper = None
         self.verifier = None
     
     async def initialize(self):
-        """Initialize scraper and verifier."""
+        """Initialize scraper and verifier (nothing to do when using a pool)."""
+        if self.pool is not None:
+            return
         self.scraper = MetalArchivesScraper(headless=self.headless)
         await self.scraper.initialize()
         self.verifier = PlatformVerifier(self.scraper.page)
@@ -53,6 +67,77 @@ class BatchVerifier:
             except Exception as e:
                 logger.warning(f"Error closing batch verifier: {e}")
     
+    @staticmethod
+    def _is_connection_error(e: Exception) -> bool:
+        """Whether an error means the page/browser is gone (worth a retry on a fresh one)"""
+        error_msg = str(e)
+        return (
+            'Target page, context or browser has been closed' in error_msg or
+            'Connection closed' in error_msg or
+            'AttributeError' in str(type(e)) or
+            '_object' in error_msg
+        )
+    
+    async def _verify_on_page(self, verifier: PlatformVerifier, album: Dict, result: Dict):
+        """
+        One verification attempt with the given page verifier.
+        Fills `result` and updates the database; connection errors propagate.
+        """
+        album_name = album['album_name']
+        band_name = album['band_name']
+        
+        # NOTE: We no longer depend on Metal Archives related links for
+        # YouTube or Bandcamp. Instead we always perform our own
+        # full-text searches using album and band names.
+
+        # Verify YouTube via global search with strict 90%+ similarity
+        try:
+            youtube_result = await verifier.search_youtube_directly(
+                album_name=album_name,
+                band_name=band_name,
+                min_similarity=90,
+            )
+            if youtube_result.get('found'):
+                result['youtube'] = youtube_result
+                logger.info(f"  ✓ YouTube verified (score: {youtube_result['match_score']})")
+            else:
+                logger.warning("  ✗ YouTube not found with ≥90% similarity")
+        except Exception as e:
+            error_msg = str(e)
+            if 'Target page, context or browser has been closed' in error_msg or 'Connection closed' in error_msg:
+                raise  # Re-raise connection errors to trigger retry
+            logger.error(f"  ✗ YouTube verification error: {e}")
+
+        # Verify Bandcamp via global Bandcamp search (albums only) with 90%+ similarity
+        try:
+            bandcamp_result = await verifier.verify_bandcamp_from_search(
+                album_name=album_name,
+                band_name=band_name,
+                min_similarity=90,
+            )
+            if bandcamp_result.get('found'):
+                result['bandcamp'] = bandcamp_result
+                logger.info(f"  ✓ Bandcamp verified (score: {bandcamp_result['match_score']})")
+            else:
+                logger.warning("  ✗ Bandcamp not found with ≥90% similarity")
+        except Exception as e:
+            error_msg = str(e)
+            if 'Target page, context or browser has been closed' in error_msg or 'Connection closed' in error_msg:
+                raise  # Re-raise connection errors to trigger retry
+            logger.error(f"  ✗ Bandcamp verification error: {e}")
+        
+        # Mark as success if at least one platform verified
+        result['success'] = result['youtube'] is not None or result['bandcamp'] is not None
+        
+        # Update database
+        if result['success']:
+            self.db.update_album_playable_urls(
+                album_id=album['album_id'],
+                youtube_result=result['youtube'],
+                bandcamp_result=result['bandcamp']
+            )
+            logger.info(f"  ✓ Database updated")
+    
     async def verify_album(self, album: Dict, min_similarity: int = 75, max_retries: int = 2) -> Dict:
         """
         Verify a single album's playable URLs with retry logic.
@@ -72,10 +157,8 @@ class BatchVerifier:
             }
         """
         album_id = album['album_id']
-        album_name = album['album_name']
-        band_name = album['band_name']
         
-        logger.info(f"Verifying: {band_name} - {album_name}")
+        logger.info(f"Verifying: {album['band_name']} - {album['album_name']}")
         
         result = {
             'album_id': album_id,
@@ -87,71 +170,26 @@ class BatchVerifier:
         
         for attempt in range(max_retries + 1):
             try:
-                # NOTE: We no longer depend on Metal Archives related links for
-                # YouTube or Bandcamp. Instead we always perform our own
-                # full-text searches using album and band names.
-
-                # Verify YouTube via global search with strict 90%+ similarity
-                try:
-                    youtube_result = await self.verifier.search_youtube_directly(
-                        album_name=album_name,
-                        band_name=band_name,
-                        min_similarity=90,
-                    )
-                    if youtube_result.get('found'):
-                        result['youtube'] = youtube_result
-                        logger.info(f"  ✓ YouTube verified (score: {youtube_result['match_score']})")
-                    else:
-                        logger.warning("  ✗ YouTube not found with ≥90% similarity")
-                except Exception as e:
-                    error_msg = str(e)
-                    if 'Target page, context or browser has been closed' in error_msg or 'Connection closed' in error_msg:
-                        raise  # Re-raise connection errors to trigger retry
-                    logger.error(f"  ✗ YouTube verification error: {e}")
-
-                # Verify Bandcamp via global Bandcamp search (albums only) with 90%+ similarity
-                try:
-                    bandcamp_result = await self.verifier.verify_bandcamp_from_search(
-                        album_name=album_name,
-                        band_name=band_name,
-                        min_similarity=90,
-                    )
-                    if bandcamp_result.get('found'):
-                        result['bandcamp'] = bandcamp_result
-                        logger.info(f"  ✓ Bandcamp verified (score: {bandcamp_result['match_score']})")
-                    else:
-                        logger.warning("  ✗ Bandcamp not found with ≥90% similarity")
-                except Exception as e:
-                    error_msg = str(e)
-                    if 'Target page, context or browser has been closed' in error_msg or 'Connection closed' in error_msg:
-                        raise  # Re-raise connection errors to trigger retry
-                    logger.error(f"  ✗ Bandcamp verification error: {e}")
-                
-                # Mark as success if at least one platform verified
-                result['success'] = result['youtube'] is not None or result['bandcamp'] is not None
-                
-                # Update database
-                if result['success']:
-                    self.db.update_album_playable_urls(
-                        album_id=album_id,
-                        youtube_result=result['youtube'],
-                        bandcamp_result=result['bandcamp']
-                    )
-                    logger.info(f"  ✓ Database updated")
+                if self.pool is not None:
+                    # A context that raises is discarded by the pool, so a retry gets a fresh one
+                    async with self.pool.context() as context:
+                        page = await context.new_page()
+                        try:
+                            await self._verify_on_page(PlatformVerifier(page), album, result)
+                        finally:
+                            await page.close()
+                else:
+                    await self._verify_on_page(self.verifier, album, result)
                 
                 # Success - break retry loop
                 break
                 
             except Exception as e:
-                error_msg = str(e)
-                is_connection_error = (
-                    'Target page, context or browser has been closed' in error_msg or
-                    'Connection closed' in error_msg or
-                    'AttributeError' in str(type(e)) or
-                    '_object' in error_msg
-                )
-                
-                if is_connection_error and attempt < max_retries:
+                if self._is_connection_error(e) and attempt < max_retries:
+                    if self.pool is not None:
+                        logger.warning(f"  ⚠️  Connection error (attempt {attempt + 1}/{max_retries + 1}), retrying in a fresh context...")
+                        await asyncio.sleep(2)
+                        continue
                     logger.warning(f"  ⚠️  Connection error (attempt {attempt + 1}/{max_retries + 1}), restarting browser...")
                     try:
                         await self.restart_browser()
@@ -167,12 +205,29 @@ class BatchVerifier:
         
         return result
     
+    @staticmethod
+    def _record_result(stats: Dict, result: Dict):
+        """Add one album's result to the batch statistics"""
+        stats['results'].append(result)
+        if result['success']:
+            stats['verified'] += 1
+            if result['youtube']:
+                stats['youtube_count'] += 1
+            if result['bandcamp']:
+                stats['bandcamp_count'] += 1
+        else:
+            stats['failed'] += 1
+            if result.get('error'):
+                stats['errors'] += 1
+    
     async def verify_albums_batch(
         self,
         albums: List[Dict],
         min_similarity: int = 75,
         delay_between: float = 2.0,
-        restart_every: int = 50
+        restart_every: int = 50,
+        progress_callback: Optional[Callable[[Dict], None]] = None,
+        progress_every: int = 10
     ) -> Dict:
         """
         Verify multiple albums with delay between requests.
@@ -180,8 +235,11 @@ class BatchVerifier:
         Args:
             albums: List of album dictionaries
             min_similarity: Minimum fuzzy match score
-            delay_between: Seconds to wait between albums
+            delay_between: Seconds to wait between albums (per concurrent worker when pooled)
             restart_every: Restart browser every N albums to prevent connection issues
+                (unused when pooled; the pool recycles worn-out contexts itself)
+            progress_callback: Called with the running stats every `progress_every` albums
+            progress_every: How often to log progress and call `progress_callback`
         
         Returns:
             {
@@ -204,6 +262,31 @@ class BatchVerifier:
             'results': []
         }
         
+        def report_progress(done: int):
+            if done % progress_every == 0 or done == len(albums):
+                logger.info(f"Progress: {done}/{len(albums)} albums processed, {stats['verified']} verified")
+                if progress_callback:
+                    progress_callback(stats)
+        
+        if self.pool is not None:
+            semaphore = asyncio.Semaphore(self.concurrency)
+            done = 0
+            
+            async def verify_one(album: Dict):
+                nonlocal done
+                async with semaphore:
+                    result = await self.verify_album(album, min_similarity)
+                    # No await between here and the callback, so no lock is needed
+                    done += 1
+                    self._record_result(stats, result)
+                    report_progress(done)
+                    # Each worker still pauses between its own albums
+                    await asyncio.sleep(delay_between)
+            
+            await asyncio.gather(*(verify_one(album) for album in albums))
+            logger.info(f"Batch verification complete: {stats['verified']}/{stats['total']} verified, {stats['errors']} errors")
+            return stats
+        
         for i, album in enumerate(albums, 1):
             logger.info(f"[{i}/{len(albums)}] Processing album...")
             
@@ -217,22 +300,10 @@ class BatchVerifier:
                     logger.error(f"Preventive restart failed: {e}")
             
             result = await self.verify_album(album, min_similarity)
-            stats['results'].append(result)
-            
-            if result['success']:
-                stats['verified'] += 1
-                if result['youtube']:
-                    stats['youtube_count'] += 1
-                if result['bandcamp']:
-                    stats['bandcamp_count'] += 1
-            else:
-                stats['failed'] += 1
-                if result.get('error'):
-                    stats['errors'] += 1
+            self._record_result(stats, result)
             
             # Show progress
-            if i % 10 == 0 or i == len(albums):
-                logger.info(f"Progress: {i}/{len(albums)} albums processed, {stats['verified']} verified")
+            report_progress(i)
             
             # Delay between requests to avoid rate limiting
             if i < len(albums):
@@ -245,7 +316,8 @@ class BatchVerifier:
         self,
         start_date: str,
         end_date: str,
-        min_similarity: int = 75
+        min_similarity: int = 75,
+        progress_callback: Optional[Callable[[Dict], None]] = None
     ) -> Dict:
         """Verify all albums in a date range."""
         # Get albums without verified playable URLs
@@ -266,7 +338,7 @@ class BatchVerifier:
             return {'total': 0, 'verified': 0}
         
         logger.info(f"Found {len(albums)} albums to verify")
-        return await self.verify_albums_batch(albums, min_similarity)
+        return await self.verify_albums_batch(albums, min_similarity, progress_callback=progress_callback)
 
 
 async def verify_albums_for_date(
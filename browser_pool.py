@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Browser Context Pool
+One shared headless Chromium with a bounded set of reusable contexts,
+for short on-demand page work (Bandcamp track lists, link verification).
+"""
+
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Deque, Dict, List, Optional
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserContextPool:
+    """
+    Hands out at most `size` browser contexts at a time.
+
+    The browser is launched on first use (and relaunched if it disconnects).
+    Contexts are reused across requests and recycled after `max_uses`
+    acquisitions so cookies, cache and memory don't build up forever.
+    """
+
+    def __init__(self, size: int = 4, max_uses: int = 50, launch_args: Optional[List[str]] = None,
+                 context_options: Optional[Dict[str, Any]] = None,
+                 extra_headers: Optional[Dict[str, str]] = None):
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.launch_args = launch_args or ['--no-sandbox', '--disable-dev-shm-usage']
+        self.context_options = context_options or {}
+        self.extra_headers = extra_headers
+
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._launch_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(self.size)
+        self._idle: Deque[BrowserContext] = deque()
+        self._uses: Dict[BrowserContext, int] = {}
+
+    async def _get_browser(self) -> Browser:
+        """Return the shared browser, launching it if needed"""
+        async with self._launch_lock:
+            if self._browser is None or not self._browser.is_connected():
+                # Contexts of a dead browser are useless
+                self._idle.clear()
+                self._uses.clear()
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=True,
+                    args=self.launch_args
+                )
+                logger.info(f"🌐 Launched shared browser ({self.size} context slots)")
+            return self._browser
+
+    async def start(self):
+        """Launch the browser ahead of the first request"""
+        await self._get_browser()
+    
+    async def _new_context(self, browser: Browser) -> BrowserContext:
+        context = await browser.new_context(**self.context_options)
+        if self.extra_headers:
+            await context.set_extra_http_headers(self.extra_headers)
+        return context
+    
+    async def acquire(self) -> BrowserContext:
+        """Wait for a free slot and return an idle or newly created context"""
+        await self._slots.acquire()
+        try:
+            browser = await self._get_browser()
+            context = self._idle.popleft() if self._idle else await self._new_context(browser)
+        except BaseException:
+            self._slots.release()
+            raise
+        self._uses[context] = self._uses.get(context, 0) + 1
+        return context
+
+    async def release(self, context: BrowserContext, discard: bool = False):
+        """Return a context to the pool (closed instead if worn out or discarded)"""
+        try:
+            browser_alive = self._browser is not None and self._browser.is_connected()
+            if discard or not browser_alive or self._uses.get(context, 0) >= self.max_uses:
+                self._uses.pop(context, None)
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.debug(f"Error closing browser context: {e}")
+            else:
+                self._idle.append(context)
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def context(self):
+        """async with pool.context() as context: ... (discarded if the block raises)"""
+        context = await self.acquire()
+        failed = False
+        try:
+            yield context
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            await self.release(context, discard=failed)
+
+    async def close(self):
+        """Close all contexts, the browser and Playwright"""
+        self._idle.clear()
+        self._uses.clear()
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing shared browser: {e}")
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
@@ -40,6 +40,7 @@ HEADERS = {
 # Directory to store downloaded covers
 COVERS_DIR = Path("covers")
 COVERS_DIR.mkdir(exist_ok=True, parents=True)
+COVER_DOWNLOAD_CONCURRENCY = 4  # Covers fetched in parallel per scrape (kept low to avoid rate limiting)
 
 # Request settings
 REQUEST_TIMEOUT = 45  # seconds
@@ -104,3 +105,12 @@ YOUTUBE_CACHE_MAX_SIZE_GB = 5.0  # Maximum cache size in gigabytes (can use deci
 YOUTUBE_PARALLEL_DOWNLOADS = 3  # Maximum number of parallel downloads for real-time player (1-10)
 YOUTUBE_DOWNLOAD_TIMEOUT = 300  # Timeout for individual downloads in seconds (5 minutes)
 YOUTUBE_POST_SCRAPE_DOWNLOADS = 1  # Parallel downloads after scraping completes (1-10, default 1)
+YOUTUBE_QUEUE_HIGH_WATERMARK = 100  # Background playlist tracks are only queued while fewer downloads than this are waiting
+
+# Bandcamp track extraction
+BANDCAMP_BROWSER_CONTEXTS = 4  # Max concurrent extractions sharing one browser (extra requests wait)
+
+# Playable URL verification
+VERIFY_CONCURRENCY = 4  # Albums verified at once, each in its own context of the shared browser
+PLAYLIST_VERIFY_CONCURRENCY = 4  # Playlist item verifications at once (shared browser)
+PLAYLIST_VERIFICATION_CACHE_DAYS = 30  # Reuse an album's platform verification for other playlists this long
@@ -5,30 +5,152 @@ Handles SQLite database creation and JSON data ingestion
 """
 
 import sqlite3
+import copy
 import json
+import re
+import orjson
 import logging
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from datetime import datetime
 import glob
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Per-connection cache of compiled statements (sqlite3 default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Albums removed per transaction by range deletes (also keeps the IN (...)
+# lists under SQLite's default 999 bound-parameter limit)
+DELETE_BATCH_SIZE = 500
+
+# Rows converted per fetchmany() call when a dynamic playlist is materialized
+DYNAMIC_PLAYLIST_FETCH_SIZE = 1000
+
+# Per-connection tuning: memory-mapped reads and a 64 MiB page cache
+CONNECTION_PRAGMAS = (
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA mmap_size = 268435456',
+    'PRAGMA cache_size = -65536',
+)
+
+def rows_as_dicts(cursor: sqlite3.Cursor) -> List[Dict[str, Any]]:
+    """Fetch all remaining rows as dicts (zip over the column names is much faster than dict(Row))"""
+    keys = [column[0] for column in cursor.description]
+    return [dict(zip(keys, row)) for row in cursor.fetchall()]
+
+def iter_rows_as_dicts(cursor: sqlite3.Cursor) -> Iterator[Dict[str, Any]]:
+    """Lazily yield rows as dicts without fetching the whole result"""
+    keys = [column[0] for column in cursor.description]
+    return (dict(zip(keys, row)) for row in cursor)
+
 class AlbumsDatabase:
     def __init__(self, db_path: str = "data/albums.db"):
         self.db_path = db_path
         self.connection = None
+        self.album_search_enabled = False  # Set once albums_fts is available
+        self._batching = False  # Inside transaction(); writers use savepoints instead of committing
+        self._settings: Optional[Dict[str, Any]] = None  # key -> decoded value, loaded on first get_setting
+        self.vacuum_pending = False  # Set after everything was deleted; cleared by vacuum()
     
     def connect(self):
         """Connect to SQLite database"""
-        self.connection = sqlite3.connect(self.db_path)
+        # Keep more compiled statements around than the default 128 so the
+        # fixed endpoint queries never get re-parsed
+        self.connection = sqlite3.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE)
         self.connection.row_factory = sqlite3.Row  # Enable dict-like access
+        # INSERT OR REPLACE only fires DELETE triggers with recursive triggers on;
+        # albums_fts relies on them to drop the replaced row
+        self.connection.execute('PRAGMA recursive_triggers = ON')
+        # WAL lets the worker-thread readers run while a scrape is writing;
+        # NORMAL sync is durable across application crashes in WAL mode
+        self.connection.execute('PRAGMA journal_mode = WAL')
+        self.connection.execute('PRAGMA synchronous = NORMAL')
+        for pragma in CONNECTION_PRAGMAS:
+            self.connection.execute(pragma)
         return self.connection
     
+    def open_reader(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """
+        Open an additional read-only connection (for use from worker threads).
+        Pass check_same_thread=False only for a connection that is used by one
+        task at a time but may hop between threads (e.g. a streamed response).
+        """
+        connection = sqlite3.connect(
+            f"file:{self.db_path}?mode=ro", uri=True, cached_statements=STATEMENT_CACHE_SIZE,
+            check_same_thread=check_same_thread
+        )
+        connection.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            connection.execute(pragma)
+        return connection
+    
+    def get_data_version(self) -> int:
+        """
+        PRAGMA data_version of the main connection. It changes whenever another
+        connection commits, including other processes such as the CLI verifiers
+        (this connection's own commits leave it unchanged).
+        """
+        return self.connection.execute('PRAGMA data_version').fetchone()[0]
+    
+    def reader(self, check_same_thread: bool = True) -> 'AlbumsDatabase':
+        """
+        An AlbumsDatabase on a new read-only connection, so the read methods can
+        run off the event loop thread. Close its .connection when done; writes
+        and settings must still go through the main instance.
+        """
+        reader = AlbumsDatabase(self.db_path)
+        reader.connection = self.open_reader(check_same_thread)
+        reader.album_search_enabled = self.album_search_enabled
+        return reader
+    
+    @contextmanager
+    def transaction(self):
+        """Group several write methods into a single transaction (one commit/fsync)"""
+        if self.connection.in_transaction:
+            self.connection.commit()
+        self.connection.execute('BEGIN IMMEDIATE')
+        self._batching = True
+        try:
+            yield self
+            self.connection.commit()
+        except BaseException:
+            self.connection.rollback()
+            raise
+        finally:
+            self._batching = False
+    
+    def _begin_write(self):
+        """Open a savepoint so a failed write inside transaction() only undoes itself"""
+        if self._batching:
+            self.connection.execute('SAVEPOINT write')
+    
+    def _commit_write(self):
+        """Commit a write, or just release its savepoint inside transaction()"""
+        if self._batching:
+            self.connection.execute('RELEASE write')
+        else:
+            self.connection.commit()
+    
+    def _rollback_write(self):
+        """Undo a failed write without discarding the rest of an enclosing transaction()"""
+        if self._batching:
+            self.connection.execute('ROLLBACK TO write')
+            self.connection.execute('RELEASE write')
+        else:
+            self.connection.rollback()
+    
     def close(self):
         """Close database connection"""
         if self.connection:
+            # Refresh planner statistics where they went stale (e.g. after big
+            # scrapes or range deletes); cheap, and a no-op when nothing changed
+            try:
+                self.connection.execute('PRAGMA optimize')
+            except sqlite3.Error as e:
+                logger.warning(f"PRAGMA optimize failed: {e}")
             self.connection.close()
     
     def create_tables(self):
@@ -197,6 +319,55 @@ class AlbumsDatabase:
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_playlist_items_position ON playlist_items(playlist_id, position)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_playlist_items_album_id ON playlist_items(album_id)')
         
+        # Single-row counter bumped by triggers on every playlist or item write
+        # (timestamps only have one-second resolution, so they can't fingerprint edits)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS playlists_revision (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                revision INTEGER NOT NULL
+            )
+        ''')
+        cursor.execute('INSERT OR IGNORE INTO playlists_revision (id, revision) VALUES (1, 0)')
+        for table in ('playlists', 'playlist_items'):
+            for event in ('INSERT', 'UPDATE', 'DELETE'):
+                cursor.execute(f'''
+                    CREATE TRIGGER IF NOT EXISTS {table}_revision_{event.lower()} AFTER {event} ON {table} BEGIN
+                        UPDATE playlists_revision SET revision = revision + 1 WHERE id = 1;
+                    END
+                ''')
+        
+        # Admin verification runs (state: pending, running, success, failure, canceled)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS verification_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                start_date TEXT NOT NULL,
+                end_date TEXT NOT NULL,
+                min_similarity INTEGER NOT NULL,
+                state TEXT NOT NULL DEFAULT 'pending',
+                stats TEXT,
+                error TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                started_at TIMESTAMP,
+                finished_at TIMESTAMP
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_verification_jobs_state ON verification_jobs(state)')
+        
+        # Playlist item verification outcomes, reused across playlists
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS album_platform_verification (
+                album_id TEXT NOT NULL,
+                platform TEXT NOT NULL,
+                platform_url TEXT NOT NULL,
+                embed_url TEXT NOT NULL,
+                verified_title TEXT,
+                match_score INTEGER,
+                embed_type TEXT,
+                verified_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (album_id, platform)
+            )
+        ''')
+        
         self.connection.commit()
         logger.info("Database tables created successfully")
         
@@ -246,11 +417,81 @@ class AlbumsDatabase:
             logger.info("✓ Database migrations completed successfully")
         else:
             logger.info("✓ Database schema is up to date")
+        
+        # Partial index for playable-only queries (dynamic playlists); needs the
+        # playable columns above, so it is created after they are migrated in.
+        # The WHERE clause must match the one used in _execute_dynamic_playlist_query.
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_albums_playable ON albums(release_date)
+            WHERE playable_verified = 1
+            AND (youtube_embed_url IS NOT NULL OR bandcamp_embed_url IS NOT NULL)
+        ''')
+        self.connection.commit()
+        
+        self._create_album_search_index()
+    
+    def _create_album_search_index(self):
+        """Create the albums_fts full-text index and its sync triggers"""
+        cursor = self.connection.cursor()
+        
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'albums_fts'")
+        exists = cursor.fetchone() is not None
+        
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS albums_fts USING fts5(
+                    album_name, band_name,
+                    content='albums', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            # SQLite built without FTS5: search falls back to LIKE scans
+            logger.warning(f"⚠ Full-text album search unavailable: {e}")
+            return
+        
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS albums_fts_ai AFTER INSERT ON albums BEGIN
+                INSERT INTO albums_fts(rowid, album_name, band_name)
+                VALUES (new.id, new.album_name, new.band_name);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS albums_fts_ad AFTER DELETE ON albums BEGIN
+                INSERT INTO albums_fts(albums_fts, rowid, album_name, band_name)
+                VALUES ('delete', old.id, old.album_name, old.band_name);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS albums_fts_au AFTER UPDATE OF album_name, band_name ON albums BEGIN
+                INSERT INTO albums_fts(albums_fts, rowid, album_name, band_name)
+                VALUES ('delete', old.id, old.album_name, old.band_name);
+                INSERT INTO albums_fts(rowid, album_name, band_name)
+                VALUES (new.id, new.album_name, new.band_name);
+            END
+        ''')
+        
+        if not exists:
+            # Index the albums that were stored before the table existed
+            cursor.execute("INSERT INTO albums_fts(albums_fts) VALUES ('rebuild')")
+            logger.info("  ✓ Built full-text album search index")
+        
+        self.connection.commit()
+        self.album_search_enabled = True
+    
+    @staticmethod
+    def build_search_match(query: str) -> Optional[str]:
+        """Turn free text into an FTS5 MATCH expression of prefix terms (None if no words)"""
+        words = re.findall(r'\w+', query)
+        if not words:
+            return None
+        return ' '.join(f'"{word}"*' for word in words)
     
     def insert_album(self, album_data: Dict[str, Any]) -> bool:
         """Insert album data into database"""
         cursor = self.connection.cursor()
         
+        self._begin_write()
         try:
             # Extract release date from top-level field (not from details)
             release_date = album_data.get('release_date', '')
@@ -320,12 +561,12 @@ class AlbumsDatabase:
                         track.get('lyrics_url', '')
                     ))
             
-            self.connection.commit()
+            self._commit_write()
             return True
             
         except Exception as e:
             logger.error(f"Error inserting album {album_data.get('album_name', 'Unknown')}: {e}")
-            self.connection.rollback()
+            self._rollback_write()
             return False
     
     def get_available_dates(self) -> List[Dict[str, Any]]:
@@ -346,6 +587,29 @@ class AlbumsDatabase:
     
     def get_albums_by_date(self, release_date: str) -> List[Dict[str, Any]]:
         """Get all albums for a specific release date"""
+        return list(self.iter_albums_by_date(release_date))
+    
+    def iter_albums_by_date(self, release_date: str) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield the albums for a release date with tracklists and parsed details.
+        
+        Tracks for the whole date are loaded with one query up front; album rows
+        are then read from the cursor one at a time instead of via fetchall().
+        Both queries run immediately so errors surface to the caller.
+        """
+        tracks_cursor = self.connection.cursor()
+        tracks_cursor.execute('''
+            SELECT t.album_id, t.track_number, t.track_name, t.track_length, t.lyrics_url
+            FROM tracks t
+            JOIN albums a ON a.album_id = t.album_id
+            WHERE a.release_date = ?
+            ORDER BY t.album_id, CAST(t.track_number AS INTEGER)
+        ''', (release_date,))
+        
+        tracks_by_album: Dict[str, List[Dict[str, Any]]] = {}
+        for track in iter_rows_as_dicts(tracks_cursor):
+            tracks_by_album.setdefault(track.pop('album_id'), []).append(track)
+        
         cursor = self.connection.cursor()
         cursor.execute('''
             SELECT * FROM albums 
@@ -353,27 +617,22 @@ class AlbumsDatabase:
             ORDER BY band_name, album_name
         ''', (release_date,))
         
-        albums = [dict(row) for row in cursor.fetchall()]
-        
-        # Add tracks for each album
-        for album in albums:
-            cursor.execute('''
-                SELECT track_number, track_name, track_length, lyrics_url
-                FROM tracks 
-                WHERE album_id = ? 
-                ORDER BY CAST(track_number AS INTEGER)
-            ''', (album['album_id'],))
-            
-            album['tracklist'] = [dict(row) for row in cursor.fetchall()]
+        return self._iter_album_rows(cursor, tracks_by_album)
+    
+    @staticmethod
+    def _iter_album_rows(cursor: sqlite3.Cursor, tracks_by_album: Dict[str, List[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+        """Yield album rows from an executed cursor with tracklist and details attached"""
+        for album in iter_rows_as_dicts(cursor):
+            album['tracklist'] = tracks_by_album.get(album['album_id'], [])
             
             # Parse details JSON
             if album['details']:
                 try:
-                    album['details'] = json.loads(album['details'])
+                    album['details'] = orjson.loads(album['details'])
                 except:
                     album['details'] = {}
-        
-        return albums
+            
+            yield album
     
     def delete_albums_by_date(self, release_date: str) -> int:
         """Delete all albums for a specific release date"""
@@ -400,35 +659,87 @@ class AlbumsDatabase:
         return albums_deleted
     
     def delete_albums_by_date_range(self, start_date: str, end_date: str) -> int:
-        """Delete all albums within a date range (inclusive)"""
-        cursor = self.connection.cursor()
+        """Delete all albums within a date range (inclusive, YYYY-MM-DD)
         
-        # First get album IDs to delete tracks
-        cursor.execute("""
-            SELECT album_id FROM albums 
-            WHERE release_date >= ? AND release_date <= ?
-        """, (start_date, end_date))
-        album_ids = [row['album_id'] for row in cursor.fetchall()]
+        Works in batches of DELETE_BATCH_SIZE albums, committing each one, so a
+        multi-year range never holds the write lock for one huge transaction.
+        A range covering every album is wiped with unfiltered DELETEs instead.
+        """
+        cursor = self.connection.cursor()
         
-        if not album_ids:
+        # MIN/MAX come straight off idx_albums_release_date
+        cursor.execute("SELECT MIN(release_date), MAX(release_date) FROM albums")
+        first_date, last_date = cursor.fetchone()
+        if first_date is None:
             return 0
+        if start_date <= first_date and last_date <= end_date:
+            return self._delete_all_albums()
         
-        # Delete tracks for these albums
-        placeholders = ','.join(['?' for _ in album_ids])
-        cursor.execute(f"DELETE FROM tracks WHERE album_id IN ({placeholders})", album_ids)
-        tracks_deleted = cursor.rowcount
+        albums_deleted = 0
+        tracks_deleted = 0
         
-        # Delete albums
-        cursor.execute("""
-            DELETE FROM albums 
-            WHERE release_date >= ? AND release_date <= ?
-        """, (start_date, end_date))
-        albums_deleted = cursor.rowcount
+        while True:
+            cursor.execute("""
+                SELECT album_id FROM albums 
+                WHERE release_date >= ? AND release_date <= ?
+                LIMIT ?
+            """, (start_date, end_date, DELETE_BATCH_SIZE))
+            album_ids = [row[0] for row in cursor.fetchall()]
+            
+            if not album_ids:
+                break
+            
+            # Delete tracks, then the albums themselves
+            placeholders = ','.join('?' * len(album_ids))
+            cursor.execute(f"DELETE FROM tracks WHERE album_id IN ({placeholders})", album_ids)
+            tracks_deleted += cursor.rowcount
+            cursor.execute(f"DELETE FROM albums WHERE album_id IN ({placeholders})", album_ids)
+            albums_deleted += cursor.rowcount
+            
+            self.connection.commit()
         
-        self.connection.commit()
         logger.info(f"Deleted {albums_deleted} albums and {tracks_deleted} tracks for date range {start_date} to {end_date}")
         return albums_deleted
     
+    def _delete_all_albums(self) -> int:
+        """Remove every album and track (sets vacuum_pending so the space can be given back)"""
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT COUNT(*) FROM albums")
+        albums_deleted = cursor.fetchone()[0]
+        
+        # tracks has no triggers, so SQLite truncates it without visiting rows;
+        # albums still runs its albums_fts delete trigger per row
+        cursor.execute("DELETE FROM tracks")
+        tracks_deleted = cursor.rowcount
+        cursor.execute("DELETE FROM albums")
+        self.connection.commit()
+        
+        # Freed pages would otherwise stay in the file until vacuum() runs
+        self.vacuum_pending = True
+        
+        logger.info(f"Deleted all {albums_deleted} albums and {tracks_deleted} tracks")
+        return albums_deleted
+    
+    def vacuum(self) -> bool:
+        """
+        Rebuild the database file to give freed pages back. Uses its own
+        connection, so it can run in a worker thread and isn't refused because
+        of cursors still open on the main connection (e.g. a streamed response).
+        Returns False if SQLite couldn't vacuum (logged, the data is unaffected).
+        """
+        self.vacuum_pending = False
+        try:
+            connection = sqlite3.connect(self.db_path, timeout=30)
+            try:
+                connection.execute("VACUUM")
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            logger.warning(f"VACUUM failed: {e}")
+            return False
+        logger.info("Vacuumed database")
+        return True
+    
     def get_data_summary(self) -> Dict[str, Any]:
         """Get summary of data in database for admin purposes"""
         cursor = self.connection.cursor()
@@ -448,7 +759,7 @@ class AlbumsDatabase:
             GROUP BY release_date 
             ORDER BY release_date DESC
         """)
-        dates_data = [dict(row) for row in cursor.fetchall()]
+        dates_data = rows_as_dicts(cursor)
         
         # Database size (approximate)
         cursor.execute("SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()")
@@ -605,7 +916,7 @@ class AlbumsDatabase:
         '''
         cursor.execute(query, params + [limit, offset])
         
-        albums = [dict(row) for row in cursor.fetchall()]
+        albums = rows_as_dicts(cursor)
         
         # Add tracks for each album
         for album in albums:
@@ -616,12 +927,12 @@ class AlbumsDatabase:
                 ORDER BY CAST(track_number AS INTEGER)
             ''', (album['album_id'],))
             
-            album['tracklist'] = [dict(row) for row in cursor.fetchall()]
+            album['tracklist'] = rows_as_dicts(cursor)
             
             # Parse details JSON
             if album['details']:
                 try:
-                    album['details'] = json.loads(album['details'])
+                    album['details'] = orjson.loads(album['details'])
                 except:
                     album['details'] = {}
         
@@ -668,6 +979,39 @@ class AlbumsDatabase:
             self.connection.rollback()
             return False
     
+    def insert_parsed_genres_bulk(self, albums_genres: List[Tuple[str, List[Dict[str, Any]]]]) -> bool:
+        """Replace the parsed genres of many albums in a single transaction"""
+        cursor = self.connection.cursor()
+        
+        rows = [
+            (
+                album_id,
+                genre_data.get('genre_name', ''),
+                genre_data.get('genre_type', 'main'),
+                genre_data.get('confidence', 1.0),
+                genre_data.get('period')
+            )
+            for album_id, parsed_genres in albums_genres
+            for genre_data in parsed_genres
+        ]
+        
+        self._begin_write()
+        try:
+            cursor.executemany('DELETE FROM parsed_genres WHERE album_id = ?',
+                               [(album_id,) for album_id, _ in albums_genres])
+            cursor.executemany('''
+                INSERT INTO parsed_genres (album_id, genre_name, genre_type, confidence, period)
+                VALUES (?, ?, ?, ?, ?)
+            ''', rows)
+            
+            self._commit_write()
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error bulk inserting parsed genres for {len(albums_genres)} albums: {e}")
+            self._rollback_write()
+            return False
+    
     def get_parsed_genres_by_album(self, album_id: str) -> List[Dict[str, Any]]:
         """Get parsed genres for a specific album"""
         cursor = self.connection.cursor()
@@ -728,43 +1072,52 @@ class AlbumsDatabase:
         return [dict(row) for row in cursor.fetchall()]
     
     def get_albums_by_genre(self, genre_name: str, date: str = None, date_from: str = None, 
-                           date_to: str = None, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
-        """Get albums filtered by genre with optional date filtering"""
+                           date_to: str = None, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
+        """Get a page of albums filtered by genre with optional date filtering, plus the total match count"""
         cursor = self.connection.cursor()
         
-        # Build the query based on filters
-        base_query = '''
-            SELECT DISTINCT a.*
-            FROM albums a
-            JOIN parsed_genres pg ON a.album_id = pg.album_id
-            WHERE pg.genre_name = ?
-        '''
+        # Build the filter; the total is computed by the same execution as the page
+        where_clause = 'a.album_id IN (SELECT album_id FROM parsed_genres WHERE genre_name = ?)'
         params = [genre_name]
         
         if date:
-            base_query += ' AND a.release_date = ?'
+            where_clause += ' AND a.release_date = ?'
             params.append(date)
         elif date_from and date_to:
-            base_query += ' AND a.release_date BETWEEN ? AND ?'
+            where_clause += ' AND a.release_date BETWEEN ? AND ?'
             params.extend([date_from, date_to])
         elif date_from:
-            base_query += ' AND a.release_date >= ?'
+            where_clause += ' AND a.release_date >= ?'
             params.append(date_from)
         elif date_to:
-            base_query += ' AND a.release_date <= ?'
+            where_clause += ' AND a.release_date <= ?'
             params.append(date_to)
         
-        base_query += ' ORDER BY a.release_date DESC, a.band_name, a.album_name LIMIT ? OFFSET ?'
-        params.extend([limit, offset])
-        
-        cursor.execute(base_query, params)
-        albums = [dict(row) for row in cursor.fetchall()]
+        cursor.execute(f'''
+            SELECT a.*, COUNT(*) OVER() as _total
+            FROM albums a
+            WHERE {where_clause}
+            ORDER BY a.release_date DESC, a.band_name, a.album_name
+            LIMIT ? OFFSET ?
+        ''', params + [limit, offset])
+        albums = rows_as_dicts(cursor)
+        
+        if albums:
+            total = albums[0]['_total']
+            for album in albums:
+                del album['_total']
+        elif offset > 0:
+            # Page past the end: count separately so pagination still knows the size
+            cursor.execute(f'SELECT COUNT(*) FROM albums a WHERE {where_clause}', params)
+            total = cursor.fetchone()[0]
+        else:
+            total = 0
         
         # Add parsed genres for each album
         for album in albums:
             album['parsed_genres'] = self.get_parsed_genres_by_album(album['album_id'])
         
-        return albums
+        return {'albums': albums, 'total': total}
     
     def get_genre_statistics(self) -> Dict[str, Any]:
         """Get comprehensive genre statistics"""
@@ -833,10 +1186,41 @@ class AlbumsDatabase:
             self.connection.rollback()
             return False
     
+    def upsert_genre_taxonomy_bulk(self, entries: List[Dict[str, Any]]) -> bool:
+        """Insert or update many genre taxonomy entries in a single transaction"""
+        cursor = self.connection.cursor()
+        
+        self._begin_write()
+        try:
+            cursor.executemany('''
+                INSERT OR REPLACE INTO genre_taxonomy 
+                (genre_name, normalized_name, parent_genre, genre_category, aliases, color_hex)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', [
+                (
+                    entry['genre_name'],
+                    entry['normalized_name'],
+                    entry.get('parent_genre'),
+                    entry['category'],
+                    json.dumps(entry.get('aliases') or []),
+                    entry.get('color_hex')
+                )
+                for entry in entries
+            ])
+            
+            self._commit_write()
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error bulk upserting {len(entries)} genre taxonomy entries: {e}")
+            self._rollback_write()
+            return False
+    
     def update_genre_statistics(self) -> bool:
         """Update genre statistics table with current data"""
         cursor = self.connection.cursor()
         
+        self._begin_write()
         try:
             # Clear existing stats
             cursor.execute('DELETE FROM genre_stats')
@@ -855,38 +1239,69 @@ class AlbumsDatabase:
                 GROUP BY pg.genre_name
             ''')
             
-            self.connection.commit()
+            self._commit_write()
             logger.info("Genre statistics updated successfully")
             return True
             
         except Exception as e:
             logger.error(f"Error updating genre statistics: {e}")
-            self.connection.rollback()
+            self._rollback_write()
             return False
     
     def get_setting(self, key: str, default: Any = None) -> Any:
-        """Get a setting value by key"""
-        cursor = self.connection.cursor()
-        cursor.execute('SELECT value FROM settings WHERE key = ?', (key,))
-        result = cursor.fetchone()
-        if result:
-            return json.loads(result['value'])
-        return default
+        """Get a setting value by key
+        
+        The settings table is tiny and only changes through set_setting, so it is
+        read once and then served from memory (hot public endpoints read several
+        keys per request). List and dict values are returned as copies, so
+        callers can't mutate the cached value.
+        """
+        if self._settings is None:
+            cursor = self.connection.cursor()
+            cursor.execute('SELECT key, value FROM settings')
+            self._settings = {row[0]: json.loads(row[1]) for row in cursor.fetchall()}
+        value = self._settings.get(key, default)
+        if isinstance(value, (list, dict)):
+            return copy.deepcopy(value)
+        return value
     
     def set_setting(self, key: str, value: Any, category: str = 'general', description: str = None) -> bool:
         """Set a setting value"""
         try:
+            encoded = json.dumps(value)
             cursor = self.connection.cursor()
             cursor.execute('''
                 INSERT OR REPLACE INTO settings (key, value, category, description, updated_at)
                 VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (key, json.dumps(value), category, description))
+            ''', (key, encoded, category, description))
             self.connection.commit()
+            if self._settings is not None:
+                # Store the decoded copy so the caller's object isn't shared with the cache
+                self._settings[key] = json.loads(encoded)
             return True
         except Exception as e:
             logger.error(f"Error setting {key}: {e}")
             return False
     
+    def set_settings(self, entries: List[Tuple[str, Any, str, Optional[str]]]) -> bool:
+        """Set several settings in one transaction; entries are (key, value, category, description)"""
+        try:
+            rows = [(key, json.dumps(value), category, description) for key, value, category, description in entries]
+            cursor = self.connection.cursor()
+            cursor.executemany('''
+                INSERT OR REPLACE INTO settings (key, value, category, description, updated_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ''', rows)
+            self.connection.commit()
+            if self._settings is not None:
+                for key, encoded, _, _ in rows:
+                    self._settings[key] = json.loads(encoded)
+            return True
+        except Exception as e:
+            logger.error(f"Error setting {len(entries)} settings: {e}")
+            self.connection.rollback()
+            return False
+    
     def get_settings_by_category(self, category: str) -> Dict[str, Any]:
         """Get all settings in a category"""
         cursor = self.connection.cursor()
@@ -900,6 +1315,64 @@ class AlbumsDatabase:
             for row in results
         }
     
+    # ============================================================================
+    # VERIFICATION JOB METHODS
+    # ============================================================================
+    
+    def create_verification_job(self, start_date: str, end_date: str, min_similarity: int) -> int:
+        """Record a new pending verification run and return its id"""
+        cursor = self.connection.cursor()
+        cursor.execute('''
+            INSERT INTO verification_jobs (start_date, end_date, min_similarity)
+            VALUES (?, ?, ?)
+        ''', (start_date, end_date, min_similarity))
+        self.connection.commit()
+        return cursor.lastrowid
+    
+    def update_verification_job(self, job_id: int, state: str,
+                                stats: Optional[Dict[str, Any]] = None, error: str = None) -> bool:
+        """Move a verification job to a new state (timestamps follow the state)"""
+        cursor = self.connection.cursor()
+        cursor.execute('''
+            UPDATE verification_jobs
+            SET state = ?,
+                stats = COALESCE(?, stats),
+                error = ?,
+                started_at = CASE WHEN ? = 'running' THEN CURRENT_TIMESTAMP ELSE started_at END,
+                finished_at = CASE WHEN ? IN ('success', 'failure', 'canceled') THEN CURRENT_TIMESTAMP ELSE finished_at END
+            WHERE id = ?
+        ''', (state, json.dumps(stats) if stats is not None else None, error, state, state, job_id))
+        self.connection.commit()
+        return cursor.rowcount > 0
+    
+    def update_verification_job_progress(self, job_id: int, stats: Dict[str, Any]) -> bool:
+        """Store the running statistics of a job without touching its state"""
+        cursor = self.connection.cursor()
+        cursor.execute('UPDATE verification_jobs SET stats = ? WHERE id = ?', (json.dumps(stats), job_id))
+        self.connection.commit()
+        return cursor.rowcount > 0
+    
+    def get_verification_job(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """Get a verification job with its decoded stats"""
+        cursor = self.connection.cursor()
+        cursor.execute('SELECT * FROM verification_jobs WHERE id = ?', (job_id,))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        job = dict(row)
+        job['stats'] = json.loads(job['stats']) if job['stats'] else None
+        return job
+    
+    def get_unfinished_verification_jobs(self) -> List[Dict[str, Any]]:
+        """Pending or interrupted (running) jobs, oldest first"""
+        cursor = self.connection.cursor()
+        cursor.execute('''
+            SELECT * FROM verification_jobs
+            WHERE state IN ('pending', 'running')
+            ORDER BY id
+        ''')
+        return rows_as_dicts(cursor)
+    
     # ============================================================================
     # PLAYLIST MANAGEMENT METHODS
     # ============================================================================
@@ -943,7 +1416,7 @@ class AlbumsDatabase:
             ORDER BY pi.position
         ''', (playlist_id,))
         
-        items = [dict(row) for row in cursor.fetchall()]
+        items = rows_as_dicts(cursor)
         
         result = dict(playlist)
         result['items'] = items
@@ -964,6 +1437,18 @@ class AlbumsDatabase:
         ''')
         return [dict(row) for row in cursor.fetchall()]
     
+    def get_playlists_version(self) -> tuple:
+        """
+        Get a cheap fingerprint of the playlists listing.
+        
+        The revision is bumped by triggers on every insert, update and delete
+        of playlists and playlist items, so it changes with every edit.
+        """
+        cursor = self.connection.cursor()
+        cursor.execute('SELECT revision FROM playlists_revision WHERE id = 1')
+        row = cursor.fetchone()
+        return (row['revision'] if row else 0,)
+    
     def update_playlist(self, playlist_id: int, name: str = None, 
                        description: str = None, is_public: bool = None) -> bool:
         """Update playlist metadata."""
@@ -1000,6 +1485,41 @@ class AlbumsDatabase:
         self.connection.commit()
         return cursor.rowcount > 0
     
+    def get_cached_verification(self, album_id: str, platform: str, platform_url: str,
+                                max_age_days: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a fresh verification of an album's platform link, shaped like a
+        PlatformVerifier result. None if missing, stale, or the link changed.
+        """
+        cursor = self.connection.cursor()
+        cursor.execute('''
+            SELECT embed_url, verified_title, match_score, embed_type
+            FROM album_platform_verification
+            WHERE album_id = ? AND platform = ? AND platform_url = ?
+            AND verified_at >= datetime('now', ?)
+        ''', (album_id, platform, platform_url, f'-{max_age_days} days'))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        return {
+            'found': True,
+            'embed_url': row['embed_url'],
+            'title': row['verified_title'],
+            'match_score': row['match_score'],
+            'type': row['embed_type']
+        }
+    
+    def save_verification(self, album_id: str, platform: str, platform_url: str, result: Dict[str, Any]):
+        """Remember a successful verification of an album's platform link"""
+        cursor = self.connection.cursor()
+        cursor.execute('''
+            INSERT OR REPLACE INTO album_platform_verification
+            (album_id, platform, platform_url, embed_url, verified_title, match_score, embed_type, verified_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ''', (album_id, platform, platform_url, result['embed_url'], result.get('title'),
+              result.get('match_score'), result.get('type', 'video')))
+        self.connection.commit()
+    
     def add_playlist_item_verified(
         self, 
         playlist_id: int, 
@@ -1036,6 +1556,65 @@ class AlbumsDatabase:
         self.connection.commit()
         return cursor.lastrowid
     
+    def add_playlist_items_verified_batch(self, playlist_id: int, items: List[Dict[str, Any]]) -> List[int]:
+        """
+        Add several verified items to the end of a playlist in one transaction.
+        
+        Each item dict takes the keyword arguments of add_playlist_item_verified.
+        Returns the new item IDs in insertion order.
+        """
+        if not items:
+            return []
+        
+        cursor = self.connection.cursor()
+        
+        try:
+            # Get first free position
+            cursor.execute('''
+                SELECT COALESCE(MAX(position), 0) + 1 
+                FROM playlist_items WHERE playlist_id = ?
+            ''', (playlist_id,))
+            first_position = cursor.fetchone()[0]
+            
+            cursor.executemany('''
+                INSERT INTO playlist_items 
+                (playlist_id, album_id, track_number, platform, playable_url, position,
+                 verification_status, verification_score, verified_title, embed_type, verification_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ''', [
+                (
+                    playlist_id,
+                    item['album_id'],
+                    item.get('track_number'),
+                    item['platform'],
+                    item['playable_url'],
+                    first_position + offset,
+                    item.get('verification_status', 'verified'),
+                    item.get('verification_score'),
+                    item.get('verified_title'),
+                    item.get('embed_type')
+                )
+                for offset, item in enumerate(items)
+            ])
+            
+            # Update playlist timestamp
+            cursor.execute('UPDATE playlists SET updated_at = CURRENT_TIMESTAMP WHERE id = ?', (playlist_id,))
+            
+            # executemany() does not expose per-row IDs, so read them back by position
+            cursor.execute('''
+                SELECT id FROM playlist_items
+                WHERE playlist_id = ? AND position >= ?
+                ORDER BY position
+            ''', (playlist_id, first_position))
+            item_ids = [row['id'] for row in cursor.fetchall()]
+            
+            self.connection.commit()
+            return item_ids
+        except Exception as e:
+            logger.error(f"Error adding playlist items: {e}")
+            self.connection.rollback()
+            raise
+    
     def add_playlist_item_pending(
         self, 
         playlist_id: int, 
@@ -1058,9 +1637,13 @@ class AlbumsDatabase:
             (playlist_id, album_id, track_number, platform, position, verification_status)
             VALUES (?, ?, ?, ?, ?, 'pending')
         ''', (playlist_id, album_id, track_number, platform, position))
+        item_id = cursor.lastrowid
+        
+        # Update playlist timestamp
+        cursor.execute('UPDATE playlists SET updated_at = CURRENT_TIMESTAMP WHERE id = ?', (playlist_id,))
         
         self.connection.commit()
-        return cursor.lastrowid
+        return item_id
     
     def update_playlist_item_verification(
         self,
@@ -1089,6 +1672,19 @@ class AlbumsDatabase:
         self.connection.commit()
         return cursor.rowcount > 0
     
+    def get_playlist_item(self, playlist_id: int, item_id: int) -> Optional[Dict]:
+        """Get a single playlist item with its verification state."""
+        cursor = self.connection.cursor()
+        cursor.execute('''
+            SELECT id, album_id, track_number, platform, playable_url, position,
+                   verification_status, verification_score, verified_title, embed_type
+            FROM playlist_items
+            WHERE id = ? AND playlist_id = ?
+        ''', (item_id, playlist_id))
+        
+        row = cursor.fetchone()
+        return dict(row) if row else None
+    
     def delete_playlist_item(self, playlist_id: int, item_id: int) -> bool:
         """Remove item from playlist."""
         cursor = self.connection.cursor()
@@ -1109,12 +1705,14 @@ class AlbumsDatabase:
         cursor = self.connection.cursor()
         
         try:
-            for position, item_id in enumerate(item_ids, start=1):
-                cursor.execute('''
-                    UPDATE playlist_items 
-                    SET position = ? 
-                    WHERE id = ? AND playlist_id = ?
-                ''', (position, item_id, playlist_id))
+            cursor.executemany('''
+                UPDATE playlist_items 
+                SET position = ? 
+                WHERE id = ? AND playlist_id = ?
+            ''', [
+                (position, item_id, playlist_id)
+                for position, item_id in enumerate(item_ids, start=1)
+            ])
             
             # Update playlist timestamp
             cursor.execute('UPDATE playlists SET updated_at = CURRENT_TIMESTAMP WHERE id = ?', (playlist_id,))
@@ -1136,7 +1734,7 @@ class AlbumsDatabase:
                 spotify_url, discogs_url, lastfm_url, soundcloud_url, tidal_url,
                 youtube_embed_url, youtube_verified_title, youtube_verification_score,
                 bandcamp_embed_url, bandcamp_verified_title, bandcamp_verification_score,
-                playable_verified
+                playable_verified, playable_verification_date, created_at
             FROM albums WHERE album_id = ?
         ''', (album_id,))
         
@@ -1197,18 +1795,27 @@ class AlbumsDatabase:
         
         return False
     
-    def get_albums_for_dynamic_playlist(
+    def _execute_dynamic_playlist_query(
         self,
         release_date: Optional[str] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         genre_filters: Optional[List[str]] = None,
         search_query: Optional[str] = None,
-        only_playable: bool = True
-    ) -> List[Dict]:
-        """Get albums for dynamic playlist generation with filters."""
+        only_playable: bool = True,
+        youtube_enabled: bool = True,
+        bandcamp_enabled: bool = True,
+        shuffle: bool = False,
+        limit: Optional[int] = None
+    ) -> sqlite3.Cursor:
+        """
+        Build and execute the dynamic playlist query, returning the open cursor.
+        With only_playable, albums playable only on a disabled platform are
+        left out too. shuffle orders rows randomly in SQL, and limit caps how
+        many rows are returned at all.
+        """
         logger.info(f"🎵 Getting albums for playlist - Date: {release_date}, Range: {start_date} to {end_date}")
-        logger.info(f"   Filters - Genres: {genre_filters}, Search: {search_query}, Only Playable: {only_playable}")
+        logger.info(f"   Filters - Genres: {genre_filters}, Search: {search_query}, Only Playable: {only_playable}, Shuffle: {shuffle}, Limit: {limit}")
         
         cursor = self.connection.cursor()
         
@@ -1216,9 +1823,8 @@ class AlbumsDatabase:
             SELECT 
                 album_id, album_name, band_name, type, release_date, genre,
                 cover_art, cover_path, album_url,
-                youtube_embed_url, youtube_video_url, youtube_verified_title, youtube_verification_score, youtube_embed_type,
-                bandcamp_embed_url, bandcamp_verified_title, bandcamp_verification_score,
-                playable_verified
+                youtube_embed_url, youtube_verified_title, youtube_verification_score, youtube_embed_type,
+                bandcamp_embed_url, bandcamp_verified_title, bandcamp_verification_score
             FROM albums
             WHERE 1=1
         '''
@@ -1236,6 +1842,13 @@ class AlbumsDatabase:
         if only_playable:
             query += " AND playable_verified = 1"
             query += " AND (youtube_embed_url IS NOT NULL OR bandcamp_embed_url IS NOT NULL)"
+            # Extra terms on top of the partial index's; != '' is also false for NULL
+            if not youtube_enabled and not bandcamp_enabled:
+                query += " AND 0"
+            elif not youtube_enabled:
+                query += " AND bandcamp_embed_url != ''"
+            elif not bandcamp_enabled:
+                query += " AND youtube_embed_url != ''"
         
         # Genre filtering
         if genre_filters and len(genre_filters) > 0:
@@ -1249,17 +1862,106 @@ class AlbumsDatabase:
             search_pattern = f"%{search_query}%"
             params.extend([search_pattern, search_pattern])
         
-        query += " ORDER BY release_date DESC, band_name ASC"
+        if shuffle:
+            query += " ORDER BY RANDOM()"
+        else:
+            query += " ORDER BY release_date DESC, band_name ASC"
+        
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
         
         logger.info(f"   Executing query with {len(params)} parameters")
         cursor.execute(query, params)
-        results = [dict(row) for row in cursor.fetchall()]
-        
-        logger.info(f"   ✓ Found {len(results)} total albums")
-        playable_count = sum(1 for r in results if r.get('youtube_embed_url') or r.get('bandcamp_embed_url'))
-        logger.info(f"   ✓ {playable_count} albums have playable URLs")
+        return cursor
+    
+    def get_albums_for_dynamic_playlist(
+        self,
+        release_date: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        genre_filters: Optional[List[str]] = None,
+        search_query: Optional[str] = None,
+        only_playable: bool = True,
+        youtube_enabled: bool = True,
+        bandcamp_enabled: bool = True,
+        shuffle: bool = False,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Get albums for dynamic playlist generation with filters.
+        
+        One query returns the album columns together with the YouTube and
+        Bandcamp URLs; rows are converted in fetchmany() batches so the Row
+        list and the dict list are never both held in full.
+        """
+        cursor = self._execute_dynamic_playlist_query(
+            release_date=release_date,
+            start_date=start_date,
+            end_date=end_date,
+            genre_filters=genre_filters,
+            search_query=search_query,
+            only_playable=only_playable,
+            youtube_enabled=youtube_enabled,
+            bandcamp_enabled=bandcamp_enabled,
+            shuffle=shuffle,
+            limit=limit
+        )
+        keys = [column[0] for column in cursor.description]
+        results = []
+        while True:
+            rows = cursor.fetchmany(DYNAMIC_PLAYLIST_FETCH_SIZE)
+            if not rows:
+                break
+            results.extend(dict(zip(keys, row)) for row in rows)
+        
+        logger.info(f"   ✓ Found {len(results)} albums")
         
         return results
+    
+    def iter_albums_for_dynamic_playlist(
+        self,
+        release_date: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        genre_filters: Optional[List[str]] = None,
+        search_query: Optional[str] = None,
+        only_playable: bool = True,
+        youtube_enabled: bool = True,
+        bandcamp_enabled: bool = True,
+        shuffle: bool = False,
+        limit: Optional[int] = None
+    ) -> sqlite3.Cursor:
+        """
+        Lazily yield albums (as sqlite3.Row) for dynamic playlist generation.
+        
+        The query is executed immediately so errors surface to the caller;
+        rows are then pulled from the cursor one at a time instead of
+        materializing the whole result with fetchall(), and without being
+        copied into dicts.
+        """
+        return self._execute_dynamic_playlist_query(
+            release_date=release_date,
+            start_date=start_date,
+            end_date=end_date,
+            genre_filters=genre_filters,
+            search_query=search_query,
+            only_playable=only_playable,
+            youtube_enabled=youtube_enabled,
+            bandcamp_enabled=bandcamp_enabled,
+            shuffle=shuffle,
+            limit=limit
+        )
+
+def ingest_records(db: AlbumsDatabase, albums_data: List[Dict[str, Any]]) -> int:
+    """Insert already-loaded album records into database, returning how many succeeded"""
+    successful_inserts = 0
+    for album_data in albums_data:
+        if db.insert_album(album_data):
+            successful_inserts += 1
+    
+    logger.info(f"Ingestion complete: {successful_inserts}/{len(albums_data)} albums inserted successfully")
+    return successful_inserts
 
 def ingest_json_files(db: AlbumsDatabase, json_pattern: str = "data/albums_*.json"):
     """Ingest all JSON files matching pattern into database"""
@@ -1269,29 +1971,23 @@ def ingest_json_files(db: AlbumsDatabase, json_pattern: str = "data/albums_*.jso
         logger.warning(f"No JSON files found matching pattern: {json_pattern}")
         return
     
-    total_albums = 0
-    successful_inserts = 0
-    
     for json_file in json_files:
         logger.info(f"Processing {json_file}...")
         
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                albums_data = json.load(f)
+            with open(json_file, 'rb') as f:
+                albums_data = orjson.loads(f.read())
             
             if not isinstance(albums_data, list):
                 logger.error(f"Expected list in {json_file}, got {type(albums_data)}")
                 continue
             
-            for album_data in albums_data:
-                total_albums += 1
-                if db.insert_album(album_data):
-                    successful_inserts += 1
+            # One commit per file instead of one per album
+            with db.transaction():
+                ingest_records(db, albums_data)
                     
         except Exception as e:
             logger.error(f"Error processing {json_file}: {e}")
-    
-    logger.info(f"Ingestion complete: {successful_inserts}/{total_albums} albums inserted successfully")
 
 def main():
     """Main function to set up database and ingest data"""
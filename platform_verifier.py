@@ -8,11 +8,150 @@ import re
 import asyncio
 from typing import Optional, Dict, List
 from playwright.async_api import Page
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process, utils
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Only the HTML and its inline scripts carry the track data; skipping the rest
+# cuts most of the bytes (and time) of a Bandcamp album page load
+BANDCAMP_BLOCKED_RESOURCES = {'image', 'media', 'font', 'stylesheet'}
+
+# Reads the TralbumData object Bandcamp embeds in album pages
+BANDCAMP_TRACKS_JS = '''() => {
+    // Bandcamp embeds track data in TralbumData JavaScript object
+    if (typeof TralbumData !== 'undefined' && TralbumData.trackinfo) {
+        console.log('Found TralbumData with', TralbumData.trackinfo.length, 'tracks');
+        return {
+            album_id: TralbumData.id || TralbumData.album_id,
+            album_title: TralbumData.current?.title || TralbumData.album_title,
+            artist: TralbumData.artist,
+            tracks: TralbumData.trackinfo
+        };
+    }
+    
+    // Fallback: try to find it in script tags
+    console.log('TralbumData not found in window, searching scripts...');
+    const scripts = document.querySelectorAll('script[type="application/ld+json"], script:not([src])');
+    
+    for (const script of scripts) {
+        const text = script.textContent || script.innerText;
+        
+        // Look for TralbumData assignment
+        if (text.includes('TralbumData') || text.includes('trackinfo')) {
+            console.log('Found potential TralbumData in script');
+            
+            // Try multiple regex patterns
+            const patterns = [
+                /var TralbumData\s*=\s*(\{[\s\S]*?\});/,
+                /TralbumData\s*=\s*(\{[\s\S]*?\});/,
+                /"@type":\s*"MusicAlbum"[\s\S]*?"track":\s*(\[[\s\S]*?\])/
+            ];
+            
+            for (const pattern of patterns) {
+                const match = text.match(pattern);
+                if (match) {
+                    try {
+                        let data;
+                        if (pattern.source.includes('MusicAlbum')) {
+                            // JSON-LD format
+                            const jsonLd = JSON.parse(script.textContent);
+                            if (jsonLd.track) {
+                                return {
+                                    album_id: null,
+                                    album_title: jsonLd.name,
+                                    artist: jsonLd.byArtist?.name,
+                                    tracks: jsonLd.track.map((t, i) => ({
+                                        title: t.name,
+                                        duration: t.duration || 0,
+                                        track_num: i + 1,
+                                        file: {}
+                                    }))
+                                };
+                            }
+                        } else {
+                            // TralbumData format
+                            data = eval('(' + match[1] + ')');
+                            if (data.trackinfo) {
+                                console.log('Successfully parsed TralbumData');
+                                return {
+                                    album_id: data.id || data.album_id,
+                                    album_title: data.current?.title || data.album_title,
+                                    artist: data.artist,
+                                    tracks: data.trackinfo
+                                };
+                            }
+                        }
+                    } catch (e) {
+                        console.error('Failed to parse data:', e);
+                    }
+                }
+            }
+        }
+    }
+    
+    console.error('Could not find track data');
+    return null;
+}'''
+
+def _batch_scores(query: str, choices: List[str], scorer, score_cutoff: float = 0, processor=None) -> List[int]:
+    """
+    Score every choice against query in one rapidfuzz call (C++ loop over the list).
+    Choices scoring below score_cutoff come back as 0; scores are rounded to
+    the integers stored and compared everywhere.
+    """
+    scores = [0] * len(choices)
+    for _, score, index in process.extract(
+        query, choices, scorer=scorer, processor=processor,
+        score_cutoff=score_cutoff, limit=None
+    ):
+        scores[index] = int(round(score))
+    return scores
+
+def token_sort_scores(query: str, choices: List[str], min_similarity: int = 0) -> List[int]:
+    """
+    token_sort_ratio of each choice on normalized strings (lowercase, punctuation
+    stripped). Scores that can't round up to min_similarity come back as 0,
+    which lets rapidfuzz give up early (e.g. on the length difference alone).
+    """
+    return _batch_scores(
+        query, choices, fuzz.token_sort_ratio,
+        score_cutoff=max(min_similarity - 0.5, 0), processor=utils.default_process
+    )
+
+def title_match_scores(
+    titles: List[str],
+    band_name: str,
+    album_name: str,
+    min_similarity: int,
+    boost_full_album: bool = False
+) -> List[int]:
+    """
+    Combined score of each search result title against a band and album (capped at 100).
+    
+    The best of the whole-string match and the album (plus band, when both are
+    present) substring matches, optionally boosted by 10 for "full album" titles.
+    """
+    titles_lower = [title.lower() for title in titles]
+    album_scores = _batch_scores(album_name.lower(), titles_lower, fuzz.partial_ratio)
+    band_scores = _batch_scores(band_name.lower(), titles_lower, fuzz.partial_ratio)
+    # A whole-string score that can't reach the threshold even with the
+    # largest boost never decides a match, so it may be cut off as 0
+    max_boost = 10 if boost_full_album else 0
+    full_scores = token_sort_scores(f"{band_name} {album_name}", titles_lower, min_similarity - max_boost)
+    
+    scores = []
+    for title_lower, full_score, album_score, band_score in zip(titles_lower, full_scores, album_scores, band_scores):
+        boost = 10 if boost_full_album and 'full album' in title_lower else 0
+        
+        # Boost if both band and album are present
+        if band_score > 70 and album_score > 70:
+            score = max(full_score, (album_score + band_score) // 2) + boost
+        else:
+            score = max(full_score, album_score) + boost
+        scores.append(min(score, 100))
+    return scores
+
 class PlatformVerifier:
     """Verify and extract album-specific URLs from band platform pages."""
     
@@ -84,33 +223,21 @@ class PlatformVerifier:
                 logger.warning(f"No YouTube results found for: {search_query}")
                 return {'found': False, 'match_score': 0}
             
-            # Fuzzy match results
+            # Fuzzy match results ("full album" titles get a boost)
             matches = []
-            search_term = f"{band_name} {album_name}".lower()
             
-            for result in results:
-                title_lower = result['title'].lower()
-                
-                # Calculate similarity scores
-                full_score = fuzz.token_sort_ratio(search_term, title_lower)
-                album_score = fuzz.partial_ratio(album_name.lower(), title_lower)
-                band_score = fuzz.partial_ratio(band_name.lower(), title_lower)
-                
-                # Boost score if "full album" is in title
-                boost = 10 if 'full album' in title_lower else 0
-                
-                # Boost if both band and album are present
-                if band_score > 70 and album_score > 70:
-                    score = max(full_score, (album_score + band_score) // 2) + boost
-                else:
-                    score = max(full_score, album_score) + boost
-                
+            scores = title_match_scores(
+                [result['title'] for result in results], band_name, album_name,
+                min_similarity, boost_full_album=True
+            )
+            
+            for result, score in zip(results, scores):
                 if score >= min_similarity:
                     matches.append({
                         'title': result['title'],
                         'url': result['url'],
                         'isPlaylist': result['isPlaylist'],
-                        'score': min(score, 100)  # Cap at 100
+                        'score': score
                     })
             
             if not matches:
@@ -269,12 +396,18 @@ class PlatformVerifier:
             if youtube_url and ('/channel/' in youtube_url or '/@' in youtube_url or '/user/' in youtube_url):
                 logger.info(f"Channel URL detected, searching channel: {youtube_url}")
                 try:
-                    # Navigate to the channel
-                    await self.page.goto(youtube_url, wait_until='networkidle', timeout=30000)
-                    await asyncio.sleep(2)
-                    
-                    # Check Videos tab
-                    videos = await self._search_youtube_videos(album_name, band_name, min_similarity)
+                    # Videos tab on this page, Playlists tab on a second one, loaded side by side
+                    videos, playlists = await asyncio.gather(
+                        self._search_channel_videos(youtube_url, album_name, band_name, min_similarity),
+                        self._search_channel_playlists(youtube_url, album_name, min_similarity),
+                        return_exceptions=True
+                    )
+                    if isinstance(videos, Exception):
+                        logger.warning(f"Channel video search failed: {videos}")
+                        videos = []
+                    if isinstance(playlists, Exception):
+                        logger.warning(f"Channel playlist search failed: {playlists}")
+                        playlists = []
                     
                     if videos:
                         best_match = videos[0]
@@ -290,9 +423,7 @@ class PlatformVerifier:
                                 'type': 'video'
                             }
                     
-                    # Check Playlists tab (for full albums)
-                    playlists = await self._search_youtube_playlists(album_name, min_similarity)
-                    
+                    # Fall back to the Playlists tab (for full albums)
                     if playlists:
                         best_match = playlists[0]
                         playlist_id = self._extract_youtube_playlist_id(best_match['url'])
@@ -319,6 +450,28 @@ class PlatformVerifier:
             logger.error(f"Error verifying YouTube album: {e}")
             return {'found': False, 'error': str(e), 'match_score': 0}
     
+    async def _search_channel_videos(
+        self,
+        channel_url: str,
+        album_name: str,
+        band_name: str,
+        min_similarity: int
+    ) -> List[Dict]:
+        """Open a channel on this page and search its videos."""
+        await self.page.goto(channel_url, wait_until='networkidle', timeout=30000)
+        await asyncio.sleep(2)
+        return await self._search_youtube_videos(album_name, band_name, min_similarity)
+    
+    async def _search_channel_playlists(self, channel_url: str, album_name: str, min_similarity: int) -> List[Dict]:
+        """Open a channel on a second page of the same context and search its playlists."""
+        page = await self.page.context.new_page()
+        try:
+            await page.goto(channel_url, wait_until='networkidle', timeout=30000)
+            await asyncio.sleep(2)
+            return await PlatformVerifier(page)._search_youtube_playlists(album_name, min_similarity)
+        finally:
+            await page.close()
+    
     async def _search_youtube_videos(
         self, 
         album_name: str, 
@@ -364,22 +517,10 @@ class PlatformVerifier:
             
             # Fuzzy match against album name
             matches = []
-            search_term = f"{band_name} {album_name}".lower()
             
-            for video in videos:
-                title_lower = video['title'].lower()
-                
-                # Calculate similarity scores
-                full_score = fuzz.token_sort_ratio(search_term, title_lower)
-                album_score = fuzz.partial_ratio(album_name.lower(), title_lower)
-                band_score = fuzz.partial_ratio(band_name.lower(), title_lower)
-                
-                # Boost score if both band and album are present
-                if band_score > 70 and album_score > 70:
-                    score = max(full_score, (album_score + band_score) // 2)
-                else:
-                    score = max(full_score, album_score)
-                
+            scores = title_match_scores([video['title'] for video in videos], band_name, album_name, min_similarity)
+            
+            for video, score in zip(videos, scores):
                 if score >= min_similarity:
                     matches.append({
                         'title': video['title'],
@@ -434,9 +575,9 @@ class PlatformVerifier:
             # Fuzzy match against album name
             matches = []
             
-            for playlist in playlists:
-                score = fuzz.token_sort_ratio(album_name.lower(), playlist['title'].lower())
-                
+            scores = token_sort_scores(album_name, [playlist['title'] for playlist in playlists], min_similarity)
+            
+            for playlist, score in zip(playlists, scores):
                 if score >= min_similarity:
                     matches.append({
                         'title': playlist['title'],
@@ -512,26 +653,15 @@ class PlatformVerifier:
 
             # Fuzzy match results against album and band
             matches = []
-            search_term = f"{band_name} {album_name}".lower()
-
-            for result in results:
-                title_lower = result['title'].lower()
-
-                full_score = fuzz.token_sort_ratio(search_term, title_lower)
-                album_score = fuzz.partial_ratio(album_name.lower(), title_lower)
-                band_score = fuzz.partial_ratio(band_name.lower(), title_lower)
 
-                # Prefer results that contain both band and album names
-                if band_score > 70 and album_score > 70:
-                    score = max(full_score, (album_score + band_score) // 2)
-                else:
-                    score = max(full_score, album_score)
+            scores = title_match_scores([result['title'] for result in results], band_name, album_name, min_similarity)
 
+            for result, score in zip(results, scores):
                 if score >= min_similarity:
                     matches.append({
                         'title': result['title'],
                         'url': result['url'],
-                        'score': min(score, 100),
+                        'score': score,
                     })
 
             if not matches:
@@ -664,9 +794,9 @@ class PlatformVerifier:
             # Fuzzy match against album name
             matches = []
             
-            for release in releases:
-                score = fuzz.token_sort_ratio(album_name.lower(), release['title'].lower())
-                
+            scores = token_sort_scores(album_name, [release['title'] for release in releases], min_similarity)
+            
+            for release, score in zip(releases, scores):
                 if score >= min_similarity:
                     matches.append({
                         'title': release['title'],
@@ -770,6 +900,14 @@ class PlatformVerifier:
         match = re.search(r'list=([^&\n?#]+)', url)
         return match.group(1) if match else None
     
+    @staticmethod
+    async def _block_heavy_resources(route):
+        """Route handler that aborts images, media, fonts and stylesheets"""
+        if route.request.resource_type in BANDCAMP_BLOCKED_RESOURCES:
+            await route.abort()
+        else:
+            await route.continue_()
+    
     async def extract_bandcamp_tracks(self, album_url: str) -> Dict[str, any]:
         """
         Extract individual track URLs and metadata from a Bandcamp album page.
@@ -793,86 +931,13 @@ class PlatformVerifier:
         try:
             logger.info(f"Extracting Bandcamp tracks from: {album_url}")
             
-            # Navigate to album page
-            await self.page.goto(album_url, wait_until='networkidle', timeout=30000)
-            await asyncio.sleep(2)
+            await self.page.route('**/*', self._block_heavy_resources)
+            
+            # TralbumData is set by an inline script, so it's ready once the DOM is
+            await self.page.goto(album_url, wait_until='domcontentloaded', timeout=30000)
             
             # Extract track data from the page's JavaScript data
-            track_data = await self.page.evaluate('''() => {
-                // Bandcamp embeds track data in TralbumData JavaScript object
-                if (typeof TralbumData !== 'undefined' && TralbumData.trackinfo) {
-                    console.log('Found TralbumData with', TralbumData.trackinfo.length, 'tracks');
-                    return {
-                        album_id: TralbumData.id || TralbumData.album_id,
-                        album_title: TralbumData.current?.title || TralbumData.album_title,
-                        artist: TralbumData.artist,
-                        tracks: TralbumData.trackinfo
-                    };
-                }
-                
-                // Fallback: try to find it in script tags
-                console.log('TralbumData not found in window, searching scripts...');
-                const scripts = document.querySelectorAll('script[type="application/ld+json"], script:not([src])');
-                
-                for (const script of scripts) {
-                    const text = script.textContent || script.innerText;
-                    
-                    // Look for TralbumData assignment
-                    if (text.includes('TralbumData') || text.includes('trackinfo')) {
-                        console.log('Found potential TralbumData in script');
-                        
-                        // Try multiple regex patterns
-                        const patterns = [
-                            /var TralbumData\s*=\s*(\{[\s\S]*?\});/,
-                            /TralbumData\s*=\s*(\{[\s\S]*?\});/,
-                            /"@type":\s*"MusicAlbum"[\s\S]*?"track":\s*(\[[\s\S]*?\])/
-                        ];
-                        
-                        for (const pattern of patterns) {
-                            const match = text.match(pattern);
-                            if (match) {
-                                try {
-                                    let data;
-                                    if (pattern.source.includes('MusicAlbum')) {
-                                        // JSON-LD format
-                                        const jsonLd = JSON.parse(script.textContent);
-                                        if (jsonLd.track) {
-                                            return {
-                                                album_id: null,
-                                                album_title: jsonLd.name,
-                                                artist: jsonLd.byArtist?.name,
-                                                tracks: jsonLd.track.map((t, i) => ({
-                                                    title: t.name,
-                                                    duration: t.duration || 0,
-                                                    track_num: i + 1,
-                                                    file: {}
-                                                }))
-                                            };
-                                        }
-                                    } else {
-                                        // TralbumData format
-                                        data = eval('(' + match[1] + ')');
-                                        if (data.trackinfo) {
-                                            console.log('Successfully parsed TralbumData');
-                                            return {
-                                                album_id: data.id || data.album_id,
-                                                album_title: data.current?.title || data.album_title,
-                                                artist: data.artist,
-                                                tracks: data.trackinfo
-                                            };
-                                        }
-                                    }
-                                } catch (e) {
-                                    console.error('Failed to parse data:', e);
-                                }
-                            }
-                        }
-                    }
-                }
-                
-                console.error('Could not find track data');
-                return null;
-            }''')
+            track_data = await self.page.evaluate(BANDCAMP_TRACKS_JS)
             
             if not track_data or not track_data.get('tracks'):
                 logger.warning(f"No track data found on Bandcamp page: {album_url}")
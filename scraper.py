@@ -880,11 +880,12 @@ class MetalArchivesScraper:
             filename = f"{album_id}.jpg"
             filepath = covers_dir / filename
             
-            # Download the image using requests-like approach with Playwright
+            # Fetch through the context's request client rather than navigating
+            # self.page: it shares the browser cookies but not the page, so
+            # several covers can be downloaded concurrently
             logger.debug(f"Downloading cover: {cover_url}")
             
-            # Navigate to the image URL and get the response
-            response = await self.page.goto(cover_url)
+            response = await self.context.request.get(cover_url, timeout=config.REQUEST_TIMEOUT * 1000)
             if response and response.status == 200:
                 # Get the image data
                 image_data = await response.body()
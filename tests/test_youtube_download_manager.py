@@ -0,0 +1,61 @@
+"""
+Tests for the YouTube download manager's process-pool download function.
+"""
+
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+pytest.importorskip("yt_dlp")
+import youtube_download_manager as ydm  # noqa: E402
+
+
+class TracebackError(Exception):
+    """Stand-in for yt-dlp's DownloadError, which keeps exc_info (a traceback)"""
+
+    def __init__(self, msg):
+        super().__init__(msg)
+        try:
+            raise ValueError(msg)
+        except ValueError:
+            self.exc_info = sys.exc_info()
+
+
+class FailingYoutubeDL:
+    def extract_info(self, url, download=True):
+        raise TracebackError("ERROR: [youtube] abc: Video unavailable")
+
+
+def test_download_error_message_survives_the_process_pool(tmp_path):
+    outtmpl = str(tmp_path / f'%(id)s{ydm.DOWNLOAD_TMP_MARKER}%(ext)s')
+    # fork, so the pool process inherits the failing YoutubeDL
+    ydm._process_ytdlp[outtmpl] = FailingYoutubeDL()
+    try:
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('fork')) as pool:
+            future = pool.submit(ydm._ytdlp_download, "https://www.youtube.com/watch?v=abc", outtmpl, 60)
+            with pytest.raises(RuntimeError, match="Video unavailable"):
+                future.result(timeout=30)
+    finally:
+        ydm._process_ytdlp.pop(outtmpl, None)
+
+
+class StalledYoutubeDL:
+    """Reports download progress after the deadline has passed"""
+
+    def extract_info(self, url, download=True):
+        ydm._download_progress({'status': 'downloading', 'downloaded_bytes': 1024})
+
+
+def test_download_aborts_itself_past_its_deadline(tmp_path):
+    outtmpl = str(tmp_path / f'%(id)s{ydm.DOWNLOAD_TMP_MARKER}%(ext)s')
+    ydm._process_ytdlp[outtmpl] = StalledYoutubeDL()
+    try:
+        with pytest.raises(RuntimeError, match="Download timeout after 0s"):
+            ydm._ytdlp_download("https://www.youtube.com/watch?v=abc", outtmpl, 0)
+    finally:
+        ydm._process_ytdlp.pop(outtmpl, None)
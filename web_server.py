@@ -5,32 +5,45 @@ Serves API endpoints and static frontend files
 """
 
 import asyncio
+import functools
 import threading
-import json
+import hashlib
 import os
+import re
+import sqlite3
+import time
+import random
+import orjson
+import yt_dlp
+from collections import defaultdict
+from dataclasses import dataclass
 from contextlib import asynccontextmanager
-from datetime import datetime, date
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks, Depends
+from calendar import monthrange
+from datetime import datetime, date, timedelta, timezone
+from fastapi import FastAPI, HTTPException, Query, BackgroundTasks, Depends, Request, Response
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from starlette.concurrency import iterate_in_threadpool
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator, model_validator
 import uvicorn
 import logging
 from pathlib import Path
-from db_manager import AlbumsDatabase, ingest_json_files
+from db_manager import AlbumsDatabase, ingest_records, rows_as_dicts
 from scraper import MetalArchivesScraper
 from models import (
     Album, PlaylistCreate, PlaylistUpdate, PlaylistItemCreate,
     PlaylistItemResponse, PlaylistResponse, ReorderRequest
 )
 from auth_manager import AuthManager
+from batch_verifier import BatchVerifier
+from browser_pool import BrowserContextPool
 from genre_parser import GenreParser
 from platform_verifier import PlatformVerifier
 from youtube_cache_manager import YouTubeCacheManager
-from youtube_download_manager import YouTubeDownloadManager
+from youtube_download_manager import YouTubeDownloadManager, YTDLP_EXECUTOR
 import config
 
 logging.basicConfig(level=logging.INFO)
@@ -42,21 +55,184 @@ db = AlbumsDatabase()
 # Global auth manager instance
 auth_manager = AuthManager()
 
+# Fixed SQL used by the endpoints. Executing the exact same string every time
+# lets sqlite3's per-connection statement cache reuse the compiled program.
+PREPARED = {
+    "stats_totals": """
+        SELECT (SELECT COUNT(*) FROM albums) as total_albums,
+               (SELECT COUNT(*) FROM tracks) as total_tracks
+    """,
+    "stats_top_genres": """
+        SELECT genre, COUNT(*) as count 
+        FROM albums 
+        WHERE genre IS NOT NULL AND genre != ''
+        GROUP BY genre 
+        ORDER BY count DESC 
+        LIMIT 10
+    """,
+    "stats_top_countries": """
+        SELECT country_of_origin as country, COUNT(*) as count 
+        FROM albums 
+        WHERE country_of_origin IS NOT NULL AND country_of_origin != ''
+        GROUP BY country_of_origin 
+        ORDER BY count DESC 
+        LIMIT 10
+    """,
+    "stats_recent_dates": """
+        SELECT release_date, COUNT(*) as count 
+        FROM albums 
+        WHERE release_date IS NOT NULL AND release_date != ''
+        GROUP BY release_date 
+        ORDER BY release_date DESC 
+        LIMIT 5
+    """,
+    "genre_details": """
+        SELECT gt.*, COALESCE(gs.album_count, 0) as album_count,
+               gs.date_range_start, gs.date_range_end
+        FROM genre_taxonomy gt
+        LEFT JOIN genre_stats gs ON gt.genre_name = gs.genre_name
+        WHERE gt.genre_name = ? OR gt.normalized_name = ?
+    """,
+    "genre_siblings": """
+        SELECT genre_name, album_count FROM genre_taxonomy gt
+        LEFT JOIN genre_stats gs ON gt.genre_name = gs.genre_name
+        WHERE gt.parent_genre = ? AND gt.genre_name != ?
+        ORDER BY gs.album_count DESC
+        LIMIT 5
+    """,
+    "related_cooc": """
+        SELECT pg2.genre_name, COUNT(*) as co_occurrence,
+               AVG(pg2.confidence) as avg_confidence
+        FROM parsed_genres pg1
+        JOIN parsed_genres pg2 ON pg1.album_id = pg2.album_id
+        WHERE pg1.genre_name = ? AND pg2.genre_name != ?
+        GROUP BY pg2.genre_name
+        ORDER BY co_occurrence DESC, avg_confidence DESC
+        LIMIT ?
+    """,
+}
+
 # Global YouTube cache manager
 youtube_cache = YouTubeCacheManager(
     cache_dir=str(config.YOUTUBE_CACHE_DIR),
     max_size_gb=config.YOUTUBE_CACHE_MAX_SIZE_GB
 )
 
+# Cache hits only update access times in memory; they are written out this often
+YOUTUBE_CACHE_FLUSH_INTERVAL = 30  # seconds
+
+async def flush_youtube_cache_metadata():
+    """Periodically persist buffered YouTube cache access times"""
+    while True:
+        await asyncio.sleep(YOUTUBE_CACHE_FLUSH_INTERVAL)
+        youtube_cache.flush()
+
 # Global YouTube download manager (handles parallel downloads)
 youtube_download_manager = None  # Will be initialized in lifespan
 
-# Track active downloads to prevent duplicates and allow cancellation
-active_downloads: Dict[str, asyncio.Task] = {}
-download_locks: Dict[str, asyncio.Lock] = {}
+# YouTube URL patterns, compiled once
+YOUTUBE_WATCH_ID_RE = re.compile(r'[?&]v=([a-zA-Z0-9_-]{11})')
+YOUTUBE_EMBED_ID_RE = re.compile(r'/embed/([a-zA-Z0-9_-]{11})')
+YOUTUBE_MIX_ID_RE = re.compile(r'list=RD(?:MM|AO)?([a-zA-Z0-9_-]{11})')
+
+# Admin date inputs: YYYY-MM-DD (database format) or DD-MM-YYYY (scrape format)
+ISO_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+DMY_DATE_RE = re.compile(r'(\d{1,2})-(\d{1,2})-(\d{4})')
+
+def parse_admin_date(value: str) -> Optional[date]:
+    """Parse YYYY-MM-DD or DD-MM-YYYY without strptime; None if invalid"""
+    match = ISO_DATE_RE.fullmatch(value)
+    if match:
+        year, month, day = match.groups()
+    else:
+        match = DMY_DATE_RE.fullmatch(value)
+        if not match:
+            return None
+        day, month, year = match.groups()
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:  # e.g. month 13 or 31-02
+        return None
+
+# yt-dlp options for metadata-only extraction
+YTDLP_STREAM_OPTS = {
+    'format': 'bestaudio/best',
+    'quiet': False,  # Show yt-dlp output for debugging
+    'no_warnings': False,
+    'extract_flat': False,  # Get full info for playlists
+    'ignoreerrors': True,   # Continue on errors
+    'logger': logger,  # Use our logger
+}
+YTDLP_PROBE_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'skip_download': True,
+}
+
+# YoutubeDL instances aren't thread-safe, so each YTDLP_EXECUTOR thread keeps
+# its own per option set instead of constructing one for every request
+_ytdlp_local = threading.local()
+
+def get_ytdlp(name: str, options: Dict[str, Any]) -> yt_dlp.YoutubeDL:
+    """Return this thread's YoutubeDL for an option set (call from executor threads)"""
+    instances = getattr(_ytdlp_local, 'instances', None)
+    if instances is None:
+        instances = _ytdlp_local.instances = {}
+    ydl = instances.get(name)
+    if ydl is None:
+        ydl = instances[name] = yt_dlp.YoutubeDL(options)
+    return ydl
+
+# get_youtube_stream results (url -> (response, time)); titles and track
+# lists are stable, so repeat plays skip yt-dlp entirely
+youtube_stream_cache: Dict[str, tuple] = {}
+YOUTUBE_STREAM_CACHE_TTL = 6 * 3600  # seconds; playlists can still be edited
+YOUTUBE_STREAM_CACHE_MAX_ENTRIES = 512
+
+def _cache_youtube_stream(url: str, response: Dict[str, Any]):
+    """Remember a stream response, evicting the oldest entry when full"""
+    if len(youtube_stream_cache) >= YOUTUBE_STREAM_CACHE_MAX_ENTRIES and url not in youtube_stream_cache:
+        del youtube_stream_cache[next(iter(youtube_stream_cache))]
+    youtube_stream_cache[url] = (response, time.time())
+
+# yt-dlp size probes for not-yet-downloaded videos (video_id -> info response)
+youtube_audio_info_cache: Dict[str, Dict[str, Any]] = {}
+YOUTUBE_AUDIO_INFO_CACHE_MAX_ENTRIES = 512
+
+# Content types for cached audio files by extension (webm when unknown)
+AUDIO_MEDIA_TYPES = {
+    '.mp4': 'audio/mp4',
+    '.m4a': 'audio/mp4',
+    '.opus': 'audio/opus',
+    '.ogg': 'audio/ogg',
+    '.webm': 'audio/webm',
+}
 
-# Global scraping lock to prevent multiple instances
-scraping_lock = asyncio.Lock()
+# Set while a scrape is queued or running. Claimed and released on the event
+# loop thread with no await in between, so the check-and-set is atomic.
+scraping_claimed = False
+
+# One Chromium shared by Bandcamp extractions, playable URL verification and
+# playlist item verification, with a bounded number of reusable contexts;
+# launched at startup and closed in lifespan shutdown. Each user caps itself at
+# its own concurrency setting, so none of them can take the others' slots.
+browser_pool = BrowserContextPool(
+    size=(config.BANDCAMP_BROWSER_CONTEXTS + config.VERIFY_CONCURRENCY
+          + config.PLAYLIST_VERIFY_CONCURRENCY),
+    # Same browser fingerprint as MetalArchivesScraper
+    context_options={
+        'user_agent': random.choice(config.USER_AGENTS),
+        'viewport': {'width': 1920, 'height': 1080},
+        'locale': 'en-US',
+        'timezone_id': 'Europe/Madrid',
+    },
+    extra_headers={
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'DNT': '1',
+        'Upgrade-Insecure-Requests': '1'
+    }
+)
 
 # Security scheme for JWT tokens
 security = HTTPBearer()
@@ -79,13 +255,29 @@ async def lifespan(app: FastAPI):
         cache_dir=config.YOUTUBE_CACHE_DIR,
         youtube_cache_manager=youtube_cache,
         max_parallel=int(max_parallel),
-        download_timeout=config.YOUTUBE_DOWNLOAD_TIMEOUT
+        download_timeout=config.YOUTUBE_DOWNLOAD_TIMEOUT,
+        queue_high_watermark=config.YOUTUBE_QUEUE_HIGH_WATERMARK
     )
     
     # Start download workers
     await youtube_download_manager.start_workers()
     logger.info("🎬 YouTube download manager started")
     
+    cache_flusher = asyncio.create_task(flush_youtube_cache_metadata())
+    
+    # Resume verification jobs interrupted by the last shutdown
+    unfinished_jobs = db.get_unfinished_verification_jobs()
+    for job in unfinished_jobs:
+        enqueue_verification_job(job['id'])
+    if unfinished_jobs:
+        logger.info(f"🎵 Resumed {len(unfinished_jobs)} verification job(s)")
+    
+    # Warm the shared browser so the first extraction/verification skips the launch
+    try:
+        await browser_pool.start()
+    except Exception as e:
+        logger.warning(f"🌐 Could not pre-launch shared browser (will retry on first use): {e}")
+    
     yield
     
     # Shutdown
@@ -93,6 +285,11 @@ async def lifespan(app: FastAPI):
         await youtube_download_manager.stop_workers()
         logger.info("🎬 YouTube download manager stopped")
     
+    cache_flusher.cancel()
+    youtube_cache.flush()
+    
+    await browser_pool.close()
+    
     db.close()
     logger.info("🗄️ Database disconnected")
 
@@ -100,32 +297,131 @@ app = FastAPI(
     title="Metal Albums API",
     description="API for browsing metal album releases",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes large album/playlist payloads several times faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
+class AllowAllCORSMiddleware:
+    """
+    Pure ASGI CORS for the allow-any-origin development setup.
+    
+    Same-origin requests (no Origin header) pass straight through; cross-origin
+    responses get the fixed headers appended and preflights are answered here
+    without entering the router.
+    """
+    
+    ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+    PREFLIGHT_MAX_AGE = b"600"
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request_headers = dict(scope["headers"])
+        origin = request_headers.get(b"origin")
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+        
+        # Credentials are allowed, so the origin is echoed rather than "*"
+        cors_headers = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+        
+        if scope["method"] == "OPTIONS" and b"access-control-request-method" in request_headers:
+            cors_headers += [
+                (b"access-control-allow-methods", self.ALLOW_METHODS),
+                (b"access-control-max-age", self.PREFLIGHT_MAX_AGE),
+                (b"content-length", b"2"),
+                (b"content-type", b"text/plain; charset=utf-8"),
+            ]
+            requested_headers = request_headers.get(b"access-control-request-headers")
+            if requested_headers:
+                cors_headers.append((b"access-control-allow-headers", requested_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": cors_headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+        
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + cors_headers
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cors)
+
 # CORS middleware for development
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(AllowAllCORSMiddleware)
 
+class ApiGZipMiddleware(GZipMiddleware):
+    """GZip API responses only; audio files and static assets pass through untouched"""
+    
+    # Cached audio is already compressed and served with Range support
+    EXCLUDED_PREFIXES = ("/api/youtube/audio/",)
+    
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if scope["type"] == "http" and path.startswith("/api/") and not path.startswith(self.EXCLUDED_PREFIXES):
+            await super().__call__(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+# Level 4 keeps compression cheap on the event loop while still shrinking
+# repetitive album JSON several times over
+app.add_middleware(ApiGZipMiddleware, minimum_size=1024, compresslevel=4)
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """Log unexpected errors once with traceback and return a generic 500"""
+    logger.error(f"❌ Unhandled error on {request.method} {request.url.path}: {exc}", exc_info=exc)
+    return ORJSONResponse(status_code=500, content={"detail": "Internal server error"})
+
+
+@dataclass(slots=True)
+class ScrapingStatus:
+    """State of the current/last scrape, polled by the admin UI"""
+    is_running: bool = False
+    current_date: Optional[str] = None
+    progress: int = 0
+    total: int = 0
+    status_message: str = "Ready"
+    start_time: Optional[str] = None
+    end_time: Optional[str] = None
+    error: Optional[str] = None
+    should_stop: bool = False
+    rate_limited: bool = False
+    verification_stats: Optional[Dict[str, Any]] = None
+    download_stats: Optional[Dict[str, Any]] = None
+    verification_error: Optional[str] = None
+    
+    def update(self, values: Dict[str, Any]):
+        """Set several fields at once (unknown names raise AttributeError)"""
+        for name, value in values.items():
+            setattr(self, name, value)
+    
+    @property
+    def user_friendly_status(self) -> str:
+        """One-line description for the admin UI, derived from the current fields"""
+        if not self.is_running:
+            return "Ready to start scraping"
+        if self.should_stop:
+            return f"Stopping scraping for {self.current_date or 'unknown date'}"
+        return f"Scraping in progress for {self.current_date or 'unknown date'}"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Snapshot of all fields (plus user_friendly_status) for JSON responses"""
+        snapshot = {name: getattr(self, name) for name in self.__slots__}
+        snapshot["user_friendly_status"] = self.user_friendly_status
+        return snapshot
 
 # Global scraping status
-scraping_status = {
-    "is_running": False,
-    "current_date": None,
-    "progress": 0,
-    "total": 0,
-    "status_message": "Ready",
-    "start_time": None,
-    "end_time": None,
-    "error": None,
-    "should_stop": False,
-    "rate_limited": False
-}
+scraping_status = ScrapingStatus()
 
 # Pydantic models for admin endpoints
 class ScrapeRequest(BaseModel):
@@ -137,8 +433,38 @@ class DeleteDateRequest(BaseModel):
     date: str  # Format: DD-MM-YYYY or YYYY-MM-DD
     
 class DeleteRangeRequest(BaseModel):
-    start_date: str
-    end_date: str
+    start_date: date  # Format: DD-MM-YYYY or YYYY-MM-DD
+    end_date: date
+    
+    @field_validator('start_date', 'end_date', mode='before')
+    @classmethod
+    def parse_date(cls, value):
+        if isinstance(value, str):
+            parsed = parse_admin_date(value)
+            if parsed is None:
+                raise ValueError("Invalid date format. Use DD-MM-YYYY or YYYY-MM-DD")
+            return parsed
+        return value
+    
+    @model_validator(mode='after')
+    def check_order(self):
+        if self.start_date > self.end_date:
+            raise ValueError("Start date must be before or equal to end date")
+        return self
+
+# Settings update models (omitted fields are left unchanged)
+class PlatformLinkSetting(BaseModel):
+    visible: Optional[bool] = None
+
+class CacheSettingsUpdate(BaseModel):
+    youtube_cache_max_size_gb: Optional[float] = Field(None, gt=0, le=100)
+    youtube_parallel_downloads: Optional[int] = Field(None, ge=1, le=10)
+    youtube_download_timeout: Optional[int] = Field(None, ge=60, le=600)
+    youtube_post_scrape_downloads: Optional[int] = Field(None, ge=1, le=10)
+
+class PlayerSettingsUpdate(BaseModel):
+    bandcamp_enabled: Optional[bool] = None
+    youtube_enabled: Optional[bool] = None
 
 # Authentication models
 class SetupRequest(BaseModel):
@@ -166,15 +492,64 @@ async def verify_admin_token(credentials: HTTPAuthorizationCredentials = Depends
     return credentials.credentials
 
 
+def _compute_etag(*parts: Any) -> str:
+    """Build a strong ETag from the values a response depends on"""
+    digest = hashlib.md5(':'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    return f'"{digest}"'
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match header already holds this ETag"""
+    if_none_match = request.headers.get('if-none-match')
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    return etag in (tag.strip().removeprefix('W/') for tag in if_none_match.split(','))
+
+def _not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the current validator"""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+# Serialized bodies of read-mostly endpoints, keyed on (endpoint, *params).
+# Album data changes when a scrape, verification or delete completes, all of
+# which call invalidate_album_caches(), or when another process writes the
+# database (see _invalidate_on_external_writes()).
+response_cache: Dict[tuple, tuple] = {}  # key -> (body, cached_time)
+RESPONSE_CACHE_TTL = 60  # seconds
+RESPONSE_CACHE_MAX_ENTRIES = 256
+
+def _get_cached_response(cache_key: tuple) -> Optional[Response]:
+    """Return the cached JSON response for this key if it is still fresh"""
+    _invalidate_on_external_writes()
+    cached = response_cache.get(cache_key)
+    if cached is None:
+        return None
+    body, cached_time = cached
+    if time.monotonic() - cached_time >= RESPONSE_CACHE_TTL:
+        del response_cache[cache_key]
+        return None
+    return Response(content=body, media_type="application/json")
+
+def _cache_response(cache_key: tuple, payload: Any) -> Response:
+    """Serialize a payload once, remember the bytes and return them as a response"""
+    body = orjson.dumps(payload)
+    # Evict the oldest entry (dicts keep insertion order) when full
+    if len(response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+        response_cache.pop(next(iter(response_cache)))
+    response_cache[cache_key] = (body, time.monotonic())
+    return Response(content=body, media_type="application/json")
+
+
 @app.get("/api/dates")
 async def get_available_dates():
     """Get all available release dates with album counts"""
-    try:
-        dates = db.get_available_dates()
-        return {"dates": dates, "total": len(dates)}
-    except Exception as e:
-        logger.error(f"Error fetching dates: {e}")
-        raise HTTPException(status_code=500, detail="Failed to fetch dates")
+    cache_key = ('dates',)
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+    
+    dates = db.get_available_dates()
+    return _cache_response(cache_key, {"dates": dates, "total": len(dates)})
 
 @app.get("/api/dates/grouped")
 async def get_dates_grouped(
@@ -185,24 +560,50 @@ async def get_dates_grouped(
         if view not in ['day', 'week', 'month']:
             raise HTTPException(status_code=400, detail="Invalid view mode. Must be 'day', 'week', or 'month'")
         
+        cache_key = ('dates_grouped', view)
+        cached = _get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
         periods = db.get_dates_grouped(view)
-        return {"periods": periods, "total": len(periods), "view": view}
+        return _cache_response(cache_key, {"periods": periods, "total": len(periods), "view": view})
     except ValueError as e:
         logger.error(f"Invalid view mode: {e}")
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Error fetching grouped dates: {e}")
-        raise HTTPException(status_code=500, detail="Failed to fetch grouped dates")
+
+def _stream_ndjson(rows, connection: sqlite3.Connection):
+    """
+    Yield one orjson-encoded line per row. A plain generator: it is iterated
+    in the threadpool and closes the request's reader connection when done.
+    """
+    try:
+        for row in rows:
+            yield orjson.dumps(row) + b"\n"
+    finally:
+        connection.close()
 
 @app.get("/api/albums/{release_date}")
-async def get_albums_by_date(release_date: str):
+async def get_albums_by_date(
+    release_date: str,
+    stream: bool = Query(False, description="Stream albums as newline-delimited JSON")
+):
     """Get all albums for a specific release date"""
-    try:
-        albums = db.get_albums_by_date(release_date)
-        return {"albums": albums, "total": len(albums), "date": release_date}
-    except Exception as e:
-        logger.error(f"Error fetching albums for {release_date}: {e}")
-        raise HTTPException(status_code=500, detail="Failed to fetch albums")
+    if stream:
+        # Its own reader connection, as for the dynamic playlist: the cursor stays
+        # open while the response streams, so it mustn't share the write connection
+        reader_db = db.reader(check_same_thread=False)
+        try:
+            albums = await asyncio.to_thread(reader_db.iter_albums_by_date, release_date)
+        except BaseException:
+            reader_db.connection.close()
+            raise
+        return StreamingResponse(
+            iterate_in_threadpool(_stream_ndjson(albums, reader_db.connection)),
+            media_type="application/x-ndjson"
+        )
+    
+    albums = db.get_albums_by_date(release_date)
+    return {"albums": albums, "total": len(albums), "date": release_date}
 
 @app.get("/api/albums/period/{period_type}/{period_key}")
 async def get_albums_by_period(
@@ -245,9 +646,135 @@ async def get_albums_by_period(
     except ValueError as e:
         logger.error(f"Invalid period parameters: {e}")
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Error fetching albums for period {period_type}/{period_key}: {e}")
-        raise HTTPException(status_code=500, detail="Failed to fetch albums")
+
+# Read-only database per worker thread. The shared `db` connection is bound
+# to the event loop thread, so queries offloaded with asyncio.to_thread use these.
+_reader_local = threading.local()
+
+def _get_reader_db() -> AlbumsDatabase:
+    """Return this thread's read-only AlbumsDatabase, opening it on first use"""
+    reader_db = getattr(_reader_local, 'db', None)
+    if reader_db is None:
+        reader_db = db.reader()
+        _reader_local.db = reader_db
+    return reader_db
+
+def _get_reader() -> sqlite3.Connection:
+    """Return this thread's read-only connection, opening it on first use"""
+    return _get_reader_db().connection
+
+async def run_read(method, *args):
+    """Run a read-only AlbumsDatabase method in a worker thread, e.g. run_read(AlbumsDatabase.get_playlist, 1)"""
+    return await asyncio.to_thread(lambda: method(_get_reader_db(), *args))
+
+# Album search SQL for every filter combination, built once at import so each
+# request executes one of a few fixed strings (statement cache hits, no string
+# building). Keyed on (text mode, has genre, has country).
+SEARCH_TEXT_CONDITIONS = {
+    None: None,
+    'fts': "id IN (SELECT rowid FROM albums_fts WHERE albums_fts MATCH ?)",
+    'like': "(album_name LIKE ? OR band_name LIKE ?)",
+}
+
+def _build_search_sql(text_mode: Optional[str], has_genre: bool, has_country: bool) -> str:
+    """Assemble the search query for one filter combination"""
+    conditions = []
+    if text_mode:
+        conditions.append(SEARCH_TEXT_CONDITIONS[text_mode])
+    if has_genre:
+        conditions.append("genre LIKE ?")
+    if has_country:
+        conditions.append("country_of_origin LIKE ?")
+    
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+    return f"""
+        SELECT * FROM albums 
+        WHERE {where_clause}
+        ORDER BY release_date DESC, band_name, album_name
+        LIMIT ?
+    """
+
+SEARCH_SQL = {
+    (text_mode, has_genre, has_country): _build_search_sql(text_mode, has_genre, has_country)
+    for text_mode in SEARCH_TEXT_CONDITIONS
+    for has_genre in (False, True)
+    for has_country in (False, True)
+}
+
+def _search_albums_sync(q: Optional[str], genre: Optional[str], country: Optional[str], limit: int) -> List[Dict]:
+    """Run the album search and tracklist queries (blocking, worker thread)"""
+    cursor = _get_reader().cursor()
+    
+    params = []
+    
+    text_mode = None
+    match = AlbumsDatabase.build_search_match(q) if q and db.album_search_enabled else None
+    if match:
+        # Word-prefix lookup in the full-text index instead of a %q% table scan
+        text_mode = 'fts'
+        params.append(match)
+    elif q:
+        text_mode = 'like'
+        params.extend([f"%{q}%", f"%{q}%"])
+    
+    if genre:
+        params.append(f"%{genre}%")
+    
+    if country:
+        params.append(f"%{country}%")
+    
+    params.append(limit)
+    query = SEARCH_SQL[(text_mode, bool(genre), bool(country))]
+    
+    cursor.execute(query, params)
+    albums = rows_as_dicts(cursor)
+    
+    # Fetch the tracklists of all matched albums in one query
+    tracks_by_album = defaultdict(list)
+    if albums:
+        album_ids = [album['album_id'] for album in albums]
+        placeholders = ','.join('?' * len(album_ids))
+        cursor.execute(f"""
+            SELECT album_id, track_number, track_name, track_length, lyrics_url
+            FROM tracks 
+            WHERE album_id IN ({placeholders})
+            ORDER BY album_id, CAST(track_number AS INTEGER)
+        """, album_ids)
+        for track in rows_as_dicts(cursor):
+            tracks_by_album[track.pop('album_id')].append(track)
+    
+    for album in albums:
+        album['tracklist'] = tracks_by_album.get(album['album_id'], [])
+    
+    return albums
+
+def _database_stats_sync() -> Dict[str, Any]:
+    """Run the statistics queries (blocking, worker thread)"""
+    cursor = _get_reader().cursor()
+    
+    # Total albums and tracks in one round trip
+    cursor.execute(PREPARED["stats_totals"])
+    total_albums, total_tracks = cursor.fetchone()
+    
+    # Albums by genre
+    cursor.execute(PREPARED["stats_top_genres"])
+    genres = [dict(row) for row in cursor.fetchall()]
+    
+    # Albums by country
+    cursor.execute(PREPARED["stats_top_countries"])
+    countries = [dict(row) for row in cursor.fetchall()]
+    
+    # Recent dates
+    cursor.execute(PREPARED["stats_recent_dates"])
+    recent_dates = [dict(row) for row in cursor.fetchall()]
+    
+    return {
+        "total_albums": total_albums,
+        "total_tracks": total_tracks,
+        "top_genres": genres,
+        "top_countries": countries,
+        "recent_dates": recent_dates
+    }
 
 @app.get("/api/search")
 async def search_albums(
@@ -257,112 +784,19 @@ async def search_albums(
     limit: int = Query(50, description="Maximum results")
 ):
     """Search albums with optional filters"""
-    try:
-        # Basic search implementation
-        cursor = db.connection.cursor()
-        
-        conditions = []
-        params = []
-        
-        if q:
-            conditions.append("(album_name LIKE ? OR band_name LIKE ?)")
-            params.extend([f"%{q}%", f"%{q}%"])
-        
-        if genre:
-            conditions.append("genre LIKE ?")
-            params.append(f"%{genre}%")
-        
-        if country:
-            conditions.append("country_of_origin LIKE ?")
-            params.append(f"%{country}%")
-        
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
-        
-        query = f"""
-            SELECT * FROM albums 
-            WHERE {where_clause}
-            ORDER BY release_date DESC, band_name, album_name
-            LIMIT ?
-        """
-        params.append(limit)
-        
-        cursor.execute(query, params)
-        albums = [dict(row) for row in cursor.fetchall()]
-        
-        # Add tracks for each album
-        for album in albums:
-            cursor.execute("""
-                SELECT track_number, track_name, track_length, lyrics_url
-                FROM tracks 
-                WHERE album_id = ? 
-                ORDER BY CAST(track_number AS INTEGER)
-            """, (album['album_id'],))
-            album['tracklist'] = [dict(row) for row in cursor.fetchall()]
-        
-        return {"albums": albums, "total": len(albums), "query": q}
-        
-    except Exception as e:
-        logger.error(f"Error searching albums: {e}")
-        raise HTTPException(status_code=500, detail="Failed to search albums")
+    albums = await asyncio.to_thread(_search_albums_sync, q, genre, country, limit)
+    return {"albums": albums, "total": len(albums), "query": q}
 
 @app.get("/api/stats")
 async def get_database_stats():
     """Get database statistics"""
-    try:
-        cursor = db.connection.cursor()
-        
-        # Total albums
-        cursor.execute("SELECT COUNT(*) as total FROM albums")
-        total_albums = cursor.fetchone()['total']
-        
-        # Total tracks
-        cursor.execute("SELECT COUNT(*) as total FROM tracks")
-        total_tracks = cursor.fetchone()['total']
-        
-        # Albums by genre
-        cursor.execute("""
-            SELECT genre, COUNT(*) as count 
-            FROM albums 
-            WHERE genre IS NOT NULL AND genre != ''
-            GROUP BY genre 
-            ORDER BY count DESC 
-            LIMIT 10
-        """)
-        genres = [dict(row) for row in cursor.fetchall()]
-        
-        # Albums by country
-        cursor.execute("""
-            SELECT country_of_origin as country, COUNT(*) as count 
-            FROM albums 
-            WHERE country_of_origin IS NOT NULL AND country_of_origin != ''
-            GROUP BY country_of_origin 
-            ORDER BY count DESC 
-            LIMIT 10
-        """)
-        countries = [dict(row) for row in cursor.fetchall()]
-        
-        # Recent dates
-        cursor.execute("""
-            SELECT release_date, COUNT(*) as count 
-            FROM albums 
-            WHERE release_date IS NOT NULL AND release_date != ''
-            GROUP BY release_date 
-            ORDER BY release_date DESC 
-            LIMIT 5
-        """)
-        recent_dates = [dict(row) for row in cursor.fetchall()]
-        
-        return {
-            "total_albums": total_albums,
-            "total_tracks": total_tracks,
-            "top_genres": genres,
-            "top_countries": countries,
-            "recent_dates": recent_dates
-        }
-        
-    except Exception as e:
-        logger.error(f"Error fetching stats: {e}")
-        raise HTTPException(status_code=500, detail="Failed to fetch statistics")
+    cache_key = ('stats',)
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+    
+    stats = await asyncio.to_thread(_database_stats_sync)
+    return _cache_response(cache_key, stats)
 
 @app.get("/api/health")
 async def health_check():
@@ -373,6 +807,14 @@ async def health_check():
 # GENRE ENDPOINTS
 # ============================================================================
 
+# Fallback autocomplete suggestions as (name, lowercase name) pairs
+COMMON_GENRES = tuple(
+    (genre, genre.lower()) for genre in (
+        "Black Metal", "Death Metal", "Thrash Metal", "Heavy Metal",
+        "Doom Metal", "Power Metal", "Progressive Metal"
+    )
+)
+
 @app.get("/api/genres")
 async def get_genres(
     category: Optional[str] = Query(None, description="Filter by category: base, modifier, style"),
@@ -380,24 +822,19 @@ async def get_genres(
     include_stats: bool = Query(True, description="Include album counts")
 ):
     """Get all genres with optional filtering and statistics"""
-    try:
-        db = AlbumsDatabase()
-        db.connect()
-        
-        genres = db.get_all_genres(category=category, limit=limit)
-        
-        return {
-            "genres": genres,
-            "total": len(genres),
-            "category": category,
-            "include_stats": include_stats
-        }
-        
-    except Exception as e:
-        logger.error(f"Error fetching genres: {e}")
-        raise HTTPException(status_code=500, detail="Failed to fetch genres")
-    finally:
-        db.close()
+    cache_key = ('genres', category, limit, include_stats)
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+    
+    genres = db.get_all_genres(category=category, limit=limit)
+    
+    return _cache_response(cache_key, {
+        "genres": genres,
+        "total": len(genres),
+        "category": category,
+        "include_stats": include_stats
+    })
 
 @app.get("/api/genres/search")
 async def search_genres(
@@ -405,88 +842,65 @@ async def search_genres(
     limit: int = Query(20, description="Maximum results")
 ):
     """Search genres with autocomplete functionality"""
-    try:
-        db = AlbumsDatabase()
-        db.connect()
-        
-        genres = db.search_genres(query=q, limit=limit)
-        
-        # Generate suggestions based on partial matches
-        suggestions = []
-        if len(genres) < limit:
-            # Add some common genre suggestions if not enough results
-            common_genres = ["Black Metal", "Death Metal", "Thrash Metal", "Heavy Metal", 
-                           "Doom Metal", "Power Metal", "Progressive Metal"]
-            for genre in common_genres:
-                if q.lower() in genre.lower() and genre not in [g['genre_name'] for g in genres]:
-                    suggestions.append(genre)
-        
-        return {
-            "genres": genres,
-            "total": len(genres),
-            "query": q,
-            "suggestions": suggestions[:5]  # Limit suggestions
-        }
-        
-    except Exception as e:
-        logger.error(f"Error searching genres: {e}")
-        raise HTTPException(status_code=500, detail="Failed to search genres")
-    finally:
-        db.close()
+    cache_key = ('genres_search', q, limit)
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+    
+    genres = db.search_genres(query=q, limit=limit)
+    
+    # Generate suggestions based on partial matches
+    suggestions = []
+    if len(genres) < limit:
+        # Add some common genre suggestions if not enough results
+        q_lower = q.lower()
+        existing = {g['genre_name'] for g in genres}
+        suggestions = [
+            genre for genre, genre_lower in COMMON_GENRES
+            if q_lower in genre_lower and genre not in existing
+        ]
+    
+    return _cache_response(cache_key, {
+        "genres": genres,
+        "total": len(genres),
+        "query": q,
+        "suggestions": suggestions[:5]  # Limit suggestions
+    })
 
 @app.get("/api/genres/{genre_name}")
 async def get_genre_details(genre_name: str):
     """Get detailed information about a specific genre"""
-    try:
-        db = AlbumsDatabase()
-        db.connect()
-        
-        # Get genre from taxonomy
-        cursor = db.connection.cursor()
-        cursor.execute('''
-            SELECT gt.*, COALESCE(gs.album_count, 0) as album_count,
-                   gs.date_range_start, gs.date_range_end
-            FROM genre_taxonomy gt
-            LEFT JOIN genre_stats gs ON gt.genre_name = gs.genre_name
-            WHERE gt.genre_name = ? OR gt.normalized_name = ?
-        ''', (genre_name, genre_name))
-        
-        genre_info = cursor.fetchone()
-        if not genre_info:
-            raise HTTPException(status_code=404, detail=f"Genre '{genre_name}' not found")
-        
-        genre_dict = dict(genre_info)
-        
-        # Parse aliases JSON
-        if genre_dict.get('aliases'):
-            try:
-                genre_dict['aliases'] = json.loads(genre_dict['aliases'])
-            except:
-                genre_dict['aliases'] = []
-        
-        # Get related genres (same parent or children)
-        related_genres = []
-        if genre_dict.get('parent_genre'):
-            cursor.execute('''
-                SELECT genre_name, album_count FROM genre_taxonomy gt
-                LEFT JOIN genre_stats gs ON gt.genre_name = gs.genre_name
-                WHERE gt.parent_genre = ? AND gt.genre_name != ?
-                ORDER BY gs.album_count DESC
-                LIMIT 5
-            ''', (genre_dict['parent_genre'], genre_name))
-            related_genres = [dict(row) for row in cursor.fetchall()]
-        
-        genre_dict['related_genres'] = related_genres
-        
-        return genre_dict
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error fetching genre details for {genre_name}: {e}")
-        raise HTTPException(status_code=500, detail="Failed to fetch genre details")
-    finally:
-        db.close()
+    cache_key = ('genre_details', genre_name)
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Get genre from taxonomy
+    cursor = db.connection.cursor()
+    cursor.execute(PREPARED["genre_details"], (genre_name, genre_name))
+    
+    genre_info = cursor.fetchone()
+    if not genre_info:
+        raise HTTPException(status_code=404, detail=f"Genre '{genre_name}' not found")
+    
+    genre_dict = dict(genre_info)
+    
+    # Parse aliases JSON
+    if genre_dict.get('aliases'):
+        try:
+            genre_dict['aliases'] = orjson.loads(genre_dict['aliases'])
+        except:
+            genre_dict['aliases'] = []
+    
+    # Get related genres (same parent or children)
+    related_genres = []
+    if genre_dict.get('parent_genre'):
+        cursor.execute(PREPARED["genre_siblings"], (genre_dict['parent_genre'], genre_name))
+        related_genres = [dict(row) for row in cursor.fetchall()]
+    
+    genre_dict['related_genres'] = related_genres
+    
+    return _cache_response(cache_key, genre_dict)
 
 @app.get("/api/genres/{genre_name}/related")
 async def get_related_genres(
@@ -494,36 +908,22 @@ async def get_related_genres(
     limit: int = Query(10, description="Maximum related genres")
 ):
     """Get genres related to the specified genre"""
-    try:
-        db = AlbumsDatabase()
-        db.connect()
-        
-        # Get genres that frequently appear together with this genre
-        cursor = db.connection.cursor()
-        cursor.execute('''
-            SELECT pg2.genre_name, COUNT(*) as co_occurrence,
-                   AVG(pg2.confidence) as avg_confidence
-            FROM parsed_genres pg1
-            JOIN parsed_genres pg2 ON pg1.album_id = pg2.album_id
-            WHERE pg1.genre_name = ? AND pg2.genre_name != ?
-            GROUP BY pg2.genre_name
-            ORDER BY co_occurrence DESC, avg_confidence DESC
-            LIMIT ?
-        ''', (genre_name, genre_name, limit))
-        
-        related = [dict(row) for row in cursor.fetchall()]
-        
-        return {
-            "genre": genre_name,
-            "related_genres": related,
-            "total": len(related)
-        }
-        
-    except Exception as e:
-        logger.error(f"Error fetching related genres for {genre_name}: {e}")
-        raise HTTPException(status_code=500, detail="Failed to fetch related genres")
-    finally:
-        db.close()
+    cache_key = ('genre_related', genre_name, limit)
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Get genres that frequently appear together with this genre
+    cursor = db.connection.cursor()
+    cursor.execute(PREPARED["related_cooc"], (genre_name, genre_name, limit))
+    
+    related = [dict(row) for row in cursor.fetchall()]
+    
+    return _cache_response(cache_key, {
+        "genre": genre_name,
+        "related_genres": related,
+        "total": len(related)
+    })
 
 @app.get("/api/albums/by-genre/{genre_name}")
 async def get_albums_by_genre(
@@ -535,96 +935,64 @@ async def get_albums_by_genre(
     offset: int = Query(0, description="Pagination offset")
 ):
     """Get albums filtered by genre with optional date filtering"""
-    try:
-        db = AlbumsDatabase()
-        db.connect()
-        
-        albums = db.get_albums_by_genre(
-            genre_name=genre_name,
-            date=date,
-            date_from=date_from,
-            date_to=date_to,
-            limit=limit,
-            offset=offset
-        )
-        
-        # Get total count for pagination
-        cursor = db.connection.cursor()
-        count_query = '''
-            SELECT COUNT(DISTINCT a.album_id)
-            FROM albums a
-            JOIN parsed_genres pg ON a.album_id = pg.album_id
-            WHERE pg.genre_name = ?
-        '''
-        params = [genre_name]
-        
-        if date:
-            count_query += ' AND a.release_date = ?'
-            params.append(date)
-        elif date_from and date_to:
-            count_query += ' AND a.release_date BETWEEN ? AND ?'
-            params.extend([date_from, date_to])
-        elif date_from:
-            count_query += ' AND a.release_date >= ?'
-            params.append(date_from)
-        elif date_to:
-            count_query += ' AND a.release_date <= ?'
-            params.append(date_to)
-        
-        cursor.execute(count_query, params)
-        total_count = cursor.fetchone()[0]
-        
-        return {
-            "albums": albums,
-            "total": total_count,
-            "limit": limit,
-            "offset": offset,
-            "genre": genre_name,
-            "filters": {
-                "date": date,
-                "date_from": date_from,
-                "date_to": date_to
-            }
+    result = db.get_albums_by_genre(
+        genre_name=genre_name,
+        date=date,
+        date_from=date_from,
+        date_to=date_to,
+        limit=limit,
+        offset=offset
+    )
+    
+    return {
+        "albums": result['albums'],
+        "total": result['total'],
+        "limit": limit,
+        "offset": offset,
+        "genre": genre_name,
+        "filters": {
+            "date": date,
+            "date_from": date_from,
+            "date_to": date_to
         }
-        
-    except Exception as e:
-        logger.error(f"Error fetching albums by genre {genre_name}: {e}")
-        raise HTTPException(status_code=500, detail="Failed to fetch albums by genre")
-    finally:
-        db.close()
+    }
 
 @app.get("/api/genres/stats")
 async def get_genre_statistics():
     """Get comprehensive genre statistics"""
-    try:
-        db = AlbumsDatabase()
-        db.connect()
-        
-        stats = db.get_genre_statistics()
-        
-        return stats
-        
-    except Exception as e:
-        logger.error(f"Error fetching genre statistics: {e}")
-        raise HTTPException(status_code=500, detail="Failed to fetch genre statistics")
-    finally:
-        db.close()
+    cache_key = ('genre_stats',)
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+    
+    stats = db.get_genre_statistics()
+    
+    return _cache_response(cache_key, stats)
 
 # ============================================================================
 # ADMIN ENDPOINTS
 # ============================================================================
 
-async def run_scraper_task_with_lock(scrape_date: str, download_covers: bool = True):
-    """Wrapper function that runs scraper task with lock protection"""
-    async with scraping_lock:
-        logger.info(f"🔒 Acquired scraping lock for date: {scrape_date}")
-        try:
-            await run_scraper_task(scrape_date, download_covers)
-        except Exception as e:
-            logger.error(f"Error in locked scraper task: {e}")
-            raise
-        finally:
-            logger.info(f"🔓 Released scraping lock for date: {scrape_date}")
+def try_claim_scraping() -> bool:
+    """Claim the single scraping slot; False if a scrape is already queued or running"""
+    global scraping_claimed
+    if scraping_claimed or scraping_status.is_running:
+        return False
+    scraping_claimed = True
+    return True
+
+async def run_scraper_task_with_lock(scrape_date: str, date_obj: date, db_date: str, download_covers: bool = True):
+    """Wrapper function that runs scraper task and releases the claimed scraping slot"""
+    global scraping_claimed
+    logger.info(f"🔒 Acquired scraping lock for date: {scrape_date}")
+    try:
+        await run_scraper_task(scrape_date, date_obj, db_date, download_covers)
+    except Exception as e:
+        logger.error(f"Error in locked scraper task: {e}")
+        raise
+    finally:
+        scraping_claimed = False
+        logger.info(f"🔓 Released scraping lock for date: {scrape_date}")
 
 async def queue_youtube_downloads_for_date(start_date: str, end_date: str) -> Dict:
     """
@@ -667,7 +1035,6 @@ async def queue_youtube_downloads_for_date(start_date: str, end_date: str) -> Di
         
         # Extract video IDs from URLs
         video_ids = []
-        import re
         
         for album_id, youtube_embed_url, youtube_video_url in albums:
             # Try to extract video ID from either URL
@@ -675,13 +1042,13 @@ async def queue_youtube_downloads_for_date(start_date: str, end_date: str) -> Di
             
             if youtube_video_url:
                 # Extract from video URL: https://www.youtube.com/watch?v=VIDEO_ID
-                match = re.search(r'[?&]v=([a-zA-Z0-9_-]{11})', youtube_video_url)
+                match = YOUTUBE_WATCH_ID_RE.search(youtube_video_url)
                 if match:
                     video_id = match.group(1)
             
             if not video_id and youtube_embed_url:
                 # Extract from embed URL: https://youtube-nocookie.com/embed/VIDEO_ID
-                match = re.search(r'/embed/([a-zA-Z0-9_-]{11})', youtube_embed_url)
+                match = YOUTUBE_EMBED_ID_RE.search(youtube_embed_url)
                 if match:
                     video_id = match.group(1)
             
@@ -708,13 +1075,99 @@ async def queue_youtube_downloads_for_date(start_date: str, end_date: str) -> Di
         }
         
     except Exception as e:
-        logger.error(f"🎬 [POST-SCRAPE] Error queuing downloads: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception("🎬 [POST-SCRAPE] Error queuing downloads: %s", e)
         return {'queued': 0, 'skipped': 0, 'total': 0, 'error': str(e)}
 
-async def run_scraper_task(scrape_date: str, download_covers: bool = True):
-    """Background task to run the scraper"""
+# Scraper error classification: (lowercase substring, (status message, rate_limited))
+SCRAPE_ERROR_RULES = (
+    ("stopped by user", ("Scraping stopped by user", False)),
+    ("timeout", ("Scraping failed: Possible timeout. Try again later.", True)),
+    ("rate limit", ("Scraping failed: Rate limited by Metal Archives. Try again later.", True)),
+    ("rate-limit", ("Scraping failed: Rate limited by Metal Archives. Try again later.", True)),
+    ("connection", ("Scraping failed: Network connection error", False)),
+)
+
+def _write_albums_json(json_filename: str, albums: List[Dict]):
+    """Write the scraped albums archive file (blocking, worker thread)"""
+    with open(json_filename, 'wb') as f:
+        f.write(orjson.dumps(albums, option=orjson.OPT_INDENT_2))
+
+def _parse_album_genres(genre_parser: GenreParser, genre_string: str) -> List[Dict[str, Any]]:
+    """Turn a band genre string into parsed_genres rows (main, modifier and related genres)"""
+    genre_data = []
+    for parsed_genre in genre_parser.parse_genre_string(genre_string):
+        # Add main genre
+        if parsed_genre.main:
+            genre_data.append({
+                'genre_name': parsed_genre.main,
+                'genre_type': 'main',
+                'confidence': parsed_genre.confidence,
+                'period': parsed_genre.period
+            })
+        
+        # Add modifiers
+        for modifier in parsed_genre.modifiers:
+            genre_data.append({
+                'genre_name': modifier,
+                'genre_type': 'modifier',
+                'confidence': parsed_genre.confidence * 0.8,
+                'period': parsed_genre.period
+            })
+        
+        # Add related genres
+        for related in parsed_genre.related:
+            genre_data.append({
+                'genre_name': related,
+                'genre_type': 'related',
+                'confidence': parsed_genre.confidence * 0.7,
+                'period': parsed_genre.period
+            })
+    return genre_data
+
+def _parse_genres_batch(albums: List[Album]):
+    """Parse the genres of all scraped albums (blocking, worker thread)
+    
+    Returns the (album_id, genre_data) pairs and the genre taxonomy entries to write.
+    """
+    genre_parser = GenreParser()
+    pending_parsed = []  # (album_id, genre_data)
+    pending_taxonomy = {}  # genre_name -> taxonomy entry (last one wins, like INSERT OR REPLACE)
+    
+    for album in albums:
+        # Album.band and Band.genre are required model fields; only emptiness needs checking
+        genre_string = album.band.genre
+        if genre_string and genre_string.strip():
+            try:
+                logger.debug(f"Parsing genres for album {album.id}: {genre_string}")
+                genre_data = _parse_album_genres(genre_parser, genre_string)
+                
+                # Queue parsed genres for the database
+                if genre_data:
+                    pending_parsed.append((album.id, genre_data))
+                    
+                    # Queue genre taxonomy updates
+                    for genre_item in genre_data:
+                        genre_name = genre_item['genre_name']
+                        pending_taxonomy[genre_name] = {
+                            'genre_name': genre_name,
+                            'normalized_name': genre_parser.normalize_genre(genre_name),
+                            'category': 'base' if genre_item['genre_type'] == 'main' else genre_item['genre_type']
+                        }
+            
+            except Exception as e:
+                logger.warning(f"Failed to parse genres for album {album.id}: {e}")
+        else:
+            # Log albums without genre information for debugging
+            logger.debug(f"Album {album.id} has no genre information to parse")
+    
+    return pending_parsed, list(pending_taxonomy.values())
+
+async def run_scraper_task(scrape_date: str, date_obj: date, db_date: str, download_covers: bool = True):
+    """Background task to run the scraper
+    
+    scrape_date is the DD-MM-YYYY string from the request; date_obj and db_date
+    (YYYY-MM-DD) are parsed from it once by trigger_scrape.
+    """
     global scraping_status
     
     # Define JSON filename early for cleanup purposes
@@ -732,48 +1185,63 @@ async def run_scraper_task(scrape_date: str, download_covers: bool = True):
             "start_time": datetime.now().isoformat(),
             "end_time": None,
             "should_stop": False,
-            "rate_limited": False
+            "rate_limited": False,
+            "verification_stats": None,
+            "download_stats": None,
+            "verification_error": None
         })
         
         # Initialize scraper with stop callback
         def check_stop():
-            return scraping_status["should_stop"]
+            return scraping_status.should_stop
         
         scraper = MetalArchivesScraper(headless=True, stop_callback=check_stop)
         await scraper.initialize()
         
-        scraping_status["status_message"] = f"Scraping albums for {scrape_date}..."
-        
-        # Run the scraper
-        date_obj = datetime.strptime(scrape_date, "%d-%m-%Y").date()
+        scraping_status.status_message = f"Scraping albums for {scrape_date}..."
         
         # Check for stop signal before starting
-        if scraping_status["should_stop"]:
+        if scraping_status.should_stop:
             raise Exception("Scraping stopped by user")
             
+        # Run the scraper
         albums_data = await scraper.search_albums_by_date(date_obj)
         
         # Check if we got rate limited (empty results or specific error patterns)
         if not albums_data:
-            scraping_status["rate_limited"] = True
-            scraping_status["status_message"] = "No albums found - possibly rate limited by Metal Archives"
+            scraping_status.rate_limited = True
+            scraping_status.status_message = "No albums found - possibly rate limited by Metal Archives"
             logger.warning(f"No albums found for {scrape_date} - possible rate limiting")
+            
+            # Nothing to save, parse or verify; keep the rate-limit status visible
+            scraping_status.update({
+                "is_running": False,
+                "end_time": datetime.now().isoformat(),
+                "should_stop": False
+            })
+            await scraper.close()
+            return
         
         # Convert to Album objects if needed
-        albums = []
-        for i, album_data in enumerate(albums_data):
-            # Check for stop signal during processing
-            if scraping_status["should_stop"]:
-                raise Exception("Scraping stopped by user")
-                
-            album = Album.from_scraped_data(album_data)
-            if download_covers:
-                await scraper.download_cover(album_data)
-            albums.append(album)
+        albums = [Album.from_scraped_data(album_data) for album_data in albums_data]
+        scraping_status.total = len(albums_data)
+        
+        if download_covers:
+            # Download covers concurrently, bounded so Metal Archives isn't hammered
+            cover_semaphore = asyncio.Semaphore(config.COVER_DOWNLOAD_CONCURRENCY)
             
-            # Update progress
-            scraping_status["progress"] = i + 1
-            scraping_status["total"] = len(albums_data)
+            async def download_one_cover(album_data):
+                async with cover_semaphore:
+                    # Check for stop signal during processing
+                    if scraping_status.should_stop:
+                        return
+                    await scraper.download_cover(album_data)
+                    scraping_status.progress += 1
+            
+            await asyncio.gather(*(download_one_cover(album_data) for album_data in albums_data))
+        
+        if scraping_status.should_stop:
+            raise Exception("Scraping stopped by user")
         
         scraping_status.update({
             "progress": len(albums),
@@ -781,112 +1249,59 @@ async def run_scraper_task(scrape_date: str, download_covers: bool = True):
             "status_message": f"Scraped {len(albums)} albums, saving to database..."
         })
         
-        # Save to JSON file - flatten band data for database compatibility
-        # json_filename already defined at function start
+        # Flatten band data for database compatibility
         flattened_albums = []
         for album in albums:
-            album_dict = album.model_dump(by_alias=True)
-            
-            # Flatten band data to top level
-            if 'band' in album_dict:
-                band_data = album_dict.pop('band')
-                album_dict.update({
-                    'band_name': band_data.get('name', ''),
-                    'band_url': band_data.get('url', ''),
-                    'band_id': band_data.get('id', ''),
-                    'country_of_origin': band_data.get('country_of_origin', ''),
-                    'location': band_data.get('location', ''),
-                    'genre': band_data.get('genre', ''),
-                    'themes': band_data.get('themes', ''),
-                    'current_label': band_data.get('current_label', ''),
-                    'years_active': band_data.get('years_active', '')
-                })
-            
-            # Ensure release_date_raw is included (may be missing from Album model)
-            if 'release_date_raw' not in album_dict:
-                # Extract from details if available
-                details = album_dict.get('details', {})
-                album_dict['release_date_raw'] = details.get('release_date_', '')
-            
+            # Dump everything but the nested band, then copy the band fields to
+            # the top level straight from the model
+            album_dict = album.model_dump(by_alias=True, exclude={'band'})
+            band = album.band
+            album_dict.update({
+                'band_name': band.name,
+                'band_url': band.url,
+                'band_id': band.id,
+                'country_of_origin': band.country_of_origin,
+                'location': band.location,
+                'genre': band.genre,
+                'themes': band.themes,
+                'current_label': band.current_label,
+                'years_active': band.years_active,
+                # Not an Album field; the scraper keeps it in details
+                'release_date_raw': album.details.get('release_date_', '')
+            })
             flattened_albums.append(album_dict)
         
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(flattened_albums, f, indent=2, ensure_ascii=False)
-        
-        # Ingest into database
-        ingest_json_files(db, json_filename)
+        # Parse genres for all albums (CPU-bound; keep it off the event loop)
+        scraping_status.status_message = "Parsing genres..."
+        pending_parsed, pending_taxonomy = await asyncio.to_thread(_parse_genres_batch, albums)
+        
+        # Albums, parsed genres, taxonomy and statistics land in one transaction
+        scraping_status.status_message = f"Saving {len(albums)} albums to database..."
+        with db.transaction():
+            ingest_records(db, flattened_albums)
+            if pending_parsed:
+                db.insert_parsed_genres_bulk(pending_parsed)
+            if pending_taxonomy:
+                db.upsert_genre_taxonomy_bulk(pending_taxonomy)
+            db.update_genre_statistics()
         database_ingested = True  # Mark successful database ingestion
-        
-        # Parse genres for all albums
-        scraping_status["status_message"] = "Parsing genres..."
-        genre_parser = GenreParser()
-        
-        for album in albums:
-            # Check if album has band and band has genre attribute
-            if hasattr(album, 'band') and album.band and hasattr(album.band, 'genre') and album.band.genre and album.band.genre.strip():
-                try:
-                    logger.debug(f"Parsing genres for album {album.id}: {album.band.genre}")
-                    parsed_genres = genre_parser.parse_genre_string(album.band.genre)
-                    genre_data = []
-                    
-                    for parsed_genre in parsed_genres:
-                        # Add main genre
-                        if parsed_genre.main:
-                            genre_data.append({
-                                'genre_name': parsed_genre.main,
-                                'genre_type': 'main',
-                                'confidence': parsed_genre.confidence,
-                                'period': parsed_genre.period
-                            })
-                        
-                        # Add modifiers
-                        for modifier in parsed_genre.modifiers:
-                            genre_data.append({
-                                'genre_name': modifier,
-                                'genre_type': 'modifier',
-                                'confidence': parsed_genre.confidence * 0.8,
-                                'period': parsed_genre.period
-                            })
-                        
-                        # Add related genres
-                        for related in parsed_genre.related:
-                            genre_data.append({
-                                'genre_name': related,
-                                'genre_type': 'related',
-                                'confidence': parsed_genre.confidence * 0.7,
-                                'period': parsed_genre.period
-                            })
-                    
-                    # Insert parsed genres into database
-                    if genre_data:
-                        db.insert_parsed_genres(album.id, genre_data)
-                        
-                        # Update genre taxonomy
-                        for genre_item in genre_data:
-                            genre_name = genre_item['genre_name']
-                            normalized_name = genre_parser.normalize_genre(genre_name)
-                            category = 'base' if genre_item['genre_type'] == 'main' else genre_item['genre_type']
-                            
-                            db.upsert_genre_taxonomy(
-                                genre_name=genre_name,
-                                normalized_name=normalized_name,
-                                category=category
-                            )
-                
-                except Exception as e:
-                    logger.warning(f"Failed to parse genres for album {album.id}: {e}")
-            else:
-                # Log albums without genre information for debugging
-                if hasattr(album, 'id'):
-                    logger.debug(f"Album {album.id} has no genre information to parse")
-        
-        # Update genre statistics
-        db.update_genre_statistics()
+        invalidate_album_caches()
         logger.info(f"Genre parsing completed for {len(albums)} albums")
         
+        # The JSON file is only an archive copy now; write it in a worker
+        # thread while the scraper shuts down
+        json_write = asyncio.create_task(
+            asyncio.to_thread(_write_albums_json, json_filename, flattened_albums)
+        )
+        
         # Close scraper before verification
         await scraper.close()
         
+        try:
+            await json_write
+        except Exception as e:
+            logger.warning(f"Could not write {json_filename}: {e}")
+        
         # Auto-verify playable URLs after successful scraping
         logger.info(f"🎵 Starting automatic verification for {scrape_date}...")
         scraping_status.update({
@@ -896,26 +1311,18 @@ async def run_scraper_task(scrape_date: str, download_covers: bool = True):
         })
         
         try:
-            from batch_verifier import BatchVerifier
-            verifier = BatchVerifier(db, headless=True)
-            await verifier.initialize()
-            
-            # Convert date format from DD-MM-YYYY to YYYY-MM-DD for database query
-            date_obj_for_verify = datetime.strptime(scrape_date, "%d-%m-%Y")
-            db_date_format = date_obj_for_verify.strftime("%Y-%m-%d")
-            
+            verifier = BatchVerifier(db, pool=browser_pool)
             verification_stats = await verifier.verify_date_range(
-                db_date_format,
-                db_date_format,
+                db_date,
+                db_date,
                 min_similarity=75
             )
             
-            await verifier.close()
-            
             logger.info(f"✓ Verification complete: {verification_stats['verified']}/{verification_stats['total']} albums verified")
+            invalidate_album_caches()
             
             # Queue YouTube downloads for verified albums
-            download_stats = await queue_youtube_downloads_for_date(db_date_format, db_date_format)
+            download_stats = await queue_youtube_downloads_for_date(db_date, db_date)
             
             scraping_status.update({
                 "is_running": False,
@@ -952,21 +1359,12 @@ async def run_scraper_task(scrape_date: str, download_covers: bool = True):
         # Provide user-friendly error messages
         error_message = str(e)
         
-        # Reset rate_limited flag by default
-        rate_limited = False
-        
-        if "stopped by user" in error_message.lower():
-            status_message = "Scraping stopped by user"
-        elif "timeout" in error_message.lower():
-            status_message = "Scraping failed: Possible timeout. Try again later."
-            rate_limited = True
-        elif "rate limit" in error_message.lower() or "rate-limit" in error_message.lower():
-            status_message = "Scraping failed: Rate limited by Metal Archives. Try again later."
-            rate_limited = True
-        elif "connection" in error_message.lower():
-            status_message = "Scraping failed: Network connection error"
-        else:
-            status_message = f"Scraping failed: {error_message}"
+        # First matching rule wins; rate_limited stays False unless the rule says otherwise
+        error_lower = error_message.lower()
+        status_message, rate_limited = next(
+            (outcome for needle, outcome in SCRAPE_ERROR_RULES if needle in error_lower),
+            (f"Scraping failed: {error_message}", False)
+        )
         
         scraping_status.update({
             "is_running": False,
@@ -988,17 +1386,17 @@ async def trigger_scrape(request: ScrapeRequest, background_tasks: BackgroundTas
     """Trigger manual scraping for a specific date"""
     # Validate date format first
     try:
-        datetime.strptime(request.date, "%d-%m-%Y")
+        date_obj = datetime.strptime(request.date, "%d-%m-%Y").date()
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid date format. Use DD-MM-YYYY")
     
     # PRIORITY CHECK: If scraping is already running, show current operation details
-    if scraping_status["is_running"] or scraping_lock.locked():
-        current_date = scraping_status.get("current_date", "unknown date")
-        current_status = scraping_status.get("status_message", "running")
+    if scraping_claimed or scraping_status.is_running:
+        current_date = scraping_status.current_date or "unknown date"
+        current_status = scraping_status.status_message or "running"
         
         # Create a more informative error message
-        if scraping_status.get("should_stop"):
+        if scraping_status.should_stop:
             detail = f"Scraping is currently stopping (was processing {current_date}). Please wait for it to complete before starting a new operation."
         else:
             detail = f"Scraping is already in progress for {current_date} ({current_status}). Please wait for the current operation to complete or stop it first."
@@ -1006,7 +1404,7 @@ async def trigger_scrape(request: ScrapeRequest, background_tasks: BackgroundTas
         raise HTTPException(status_code=409, detail=detail)
     
     # Check if data already exists for this date (convert to database format)
-    db_date = datetime.strptime(request.date, "%d-%m-%Y").strftime("%Y-%m-%d")
+    db_date = date_obj.strftime("%Y-%m-%d")
     existing_data = db.check_date_exists(db_date)
     if existing_data and not getattr(request, 'force_rescrape', False):
         # Get count of existing albums for this date
@@ -1016,8 +1414,11 @@ async def trigger_scrape(request: ScrapeRequest, background_tasks: BackgroundTas
             detail=f"Data already exists for {request.date} ({existing_count} albums). Use force_rescrape=true to overwrite existing data."
         )
     
-    # Start background scraping task with lock protection
-    background_tasks.add_task(run_scraper_task_with_lock, request.date, request.download_covers)
+    # Claim the slot before responding so a second request can't slip in
+    # before the background task starts
+    if not try_claim_scraping():
+        raise HTTPException(status_code=409, detail="Scraping is already in progress. Please wait for the current operation to complete or stop it first.")
+    background_tasks.add_task(run_scraper_task_with_lock, request.date, date_obj, db_date, request.download_covers)
     
     return {
         "message": f"Scraping started for {request.date}",
@@ -1028,34 +1429,38 @@ async def trigger_scrape(request: ScrapeRequest, background_tasks: BackgroundTas
 @app.get("/api/admin/scrape/status")
 async def get_scrape_status(token: str = Depends(verify_admin_token)):
     """Get current scraping status"""
-    # Add lock status and enhanced information
-    status_with_lock = scraping_status.copy()
-    status_with_lock["lock_held"] = scraping_lock.locked()
-    
-    # Add user-friendly status description
-    if status_with_lock.get("is_running"):
-        if status_with_lock.get("should_stop"):
-            status_with_lock["user_friendly_status"] = f"Stopping scraping for {status_with_lock.get('current_date', 'unknown date')}"
-        else:
-            status_with_lock["user_friendly_status"] = f"Scraping in progress for {status_with_lock.get('current_date', 'unknown date')}"
-    else:
-        status_with_lock["user_friendly_status"] = "Ready to start scraping"
-    
-    return status_with_lock
+    # to_dict() already carries user_friendly_status; only the claim flag is added here
+    status = scraping_status.to_dict()
+    status["lock_held"] = scraping_claimed
+    return status
 
 @app.post("/api/admin/scrape/stop")
 async def stop_scraping(token: str = Depends(verify_admin_token)):
     """Stop the currently running scraping process"""
-    if not scraping_status.get("is_running"):
+    if not scraping_status.is_running:
         raise HTTPException(status_code=400, detail="No scraping process is currently running")
     
-    scraping_status["should_stop"] = True
-    scraping_status["status_message"] = "Stopping scraping process..."
+    scraping_status.should_stop = True
+    scraping_status.status_message = "Stopping scraping process..."
     
     return {"message": "Stop signal sent to scraping process"}
 
+def _cached_audio_response(cached_file: Path) -> FileResponse:
+    """Serve a cached audio file (immutable, so browsers may keep it)"""
+    return FileResponse(
+        cached_file,
+        media_type=AUDIO_MEDIA_TYPES.get(cached_file.suffix, 'audio/webm'),
+        headers={
+            "Accept-Ranges": "bytes",
+            "Cache-Control": "public, max-age=31536000",
+        }
+    )
+
 @app.get("/api/youtube/audio/{video_id}")
-async def get_youtube_audio(video_id: str):
+async def get_youtube_audio(
+    video_id: str,
+    wait: float = Query(0, ge=0, le=60, description="Seconds to wait for an in-progress download")
+):
     """
     Serve cached YouTube audio file.
     
@@ -1064,10 +1469,11 @@ async def get_youtube_audio(video_id: str):
     - Returns 404 if file is not available
     - Does NOT initiate downloads (use /api/youtube/queue endpoint to queue downloads)
     
-    This prevents blocking the player while waiting for downloads.
+    This prevents blocking the player while waiting for downloads. Clients
+    that would rather wait can pass `wait`: if the video is queued or
+    downloading, the request joins that download for up to `wait` seconds
+    instead of returning 202 straight away.
     """
-    from fastapi.responses import FileResponse
-    
     logger.info(f"🎬 [YOUTUBE/AUDIO] Request for video: {video_id}")
     
     # Check if already cached
@@ -1075,32 +1481,22 @@ async def get_youtube_audio(video_id: str):
     if cached_file:
         file_size_mb = cached_file.stat().st_size / 1024 / 1024
         logger.info(f"🎬 [YOUTUBE/AUDIO] ✅ Serving from cache: {cached_file.name} ({file_size_mb:.2f} MB)")
-        
-        # Determine media type
-        media_type = "audio/webm"
-        if cached_file.suffix == '.mp4' or cached_file.suffix == '.m4a':
-            media_type = "audio/mp4"
-        elif cached_file.suffix == '.opus':
-            media_type = "audio/opus"
-        elif cached_file.suffix == '.ogg':
-            media_type = "audio/ogg"
-        
-        return FileResponse(
-            cached_file,
-            media_type=media_type,
-            headers={
-                "Accept-Ranges": "bytes",
-                "Cache-Control": "public, max-age=31536000",
-            }
-        )
+        return _cached_audio_response(cached_file)
     
     # Not cached - check if currently downloading
     download_status = youtube_download_manager.get_download_status(video_id)
+    if download_status and wait:
+        downloaded_file = await youtube_download_manager.wait_for_download(video_id, wait)
+        if downloaded_file:
+            logger.info(f"🎬 [YOUTUBE/AUDIO] ✅ Serving after download: {downloaded_file.name}")
+            return _cached_audio_response(downloaded_file)
+        download_status = youtube_download_manager.get_download_status(video_id)
+    
     if download_status:
-        logger.info(f"🎬 [YOUTUBE/AUDIO] ⏳ {video_id} is {download_status.status.value}")
+        logger.info(f"🎬 [YOUTUBE/AUDIO] ⏳ {video_id} is {download_status.status.label}")
         raise HTTPException(
             status_code=202,  # Accepted - processing
-            detail=f"Audio file is being downloaded. Status: {download_status.status.value}"
+            detail=f"Audio file is being downloaded. Status: {download_status.status.label}"
         )
     
     # Not cached and not downloading
@@ -1116,8 +1512,6 @@ async def get_youtube_audio_info(video_id: str):
     Get information about a YouTube audio file (size, download status).
     Used by frontend to show download notifications.
     """
-    import yt_dlp
-    
     # Check if already cached
     cached_file = youtube_cache.get_cached_file(video_id)
     if cached_file:
@@ -1128,20 +1522,18 @@ async def get_youtube_audio_info(video_id: str):
             "estimated_time": "0s"
         }
     
+    # A video's size doesn't change, so each one is only probed once
+    if video_id in youtube_audio_info_cache:
+        return youtube_audio_info_cache[video_id]
+    
     # Not cached - get file size estimate
     try:
         video_url = f"https://www.youtube.com/watch?v={video_id}"
         
         def get_info():
-            ydl_opts_info = {
-                'quiet': True,
-                'no_warnings': True,
-                'skip_download': True,
-            }
-            with yt_dlp.YoutubeDL(ydl_opts_info) as ydl:
-                return ydl.extract_info(video_url, download=False)
+            return get_ytdlp('probe', YTDLP_PROBE_OPTS).extract_info(video_url, download=False)
         
-        info_only = await asyncio.to_thread(get_info)
+        info_only = await asyncio.get_running_loop().run_in_executor(YTDLP_EXECUTOR, get_info)
         
         if info_only:
             filesize = info_only.get('filesize') or info_only.get('filesize_approx', 0)
@@ -1156,11 +1548,15 @@ async def get_youtube_audio_info(video_id: str):
                 else:
                     estimated_time = f"{int(estimated_seconds / 60)}m {int(estimated_seconds % 60)}s"
             
-            return {
+            audio_info = {
                 "cached": False,
                 "size_mb": round(filesize_mb, 1),
                 "estimated_time": estimated_time
             }
+            if len(youtube_audio_info_cache) >= YOUTUBE_AUDIO_INFO_CACHE_MAX_ENTRIES:
+                youtube_audio_info_cache.pop(next(iter(youtube_audio_info_cache)))
+            youtube_audio_info_cache[video_id] = audio_info
+            return audio_info
     except Exception as e:
         logger.error(f"Error getting audio info: {e}")
         return {
@@ -1204,7 +1600,7 @@ async def queue_youtube_download(video_ids: List[str], current_index: int = 0):
             if download_status:
                 statuses.append({
                     "video_id": video_id,
-                    "status": download_status.status.value,
+                    "status": download_status.status.label,
                     "attempts": download_status.attempts,
                     "error": download_status.error
                 })
@@ -1242,13 +1638,13 @@ async def get_download_status(video_id: str):
     if download_status:
         return {
             "video_id": video_id,
-            "status": download_status.status.value,
+            "status": download_status.status.label,
             "cached": False,
             "attempts": download_status.attempts,
             "max_attempts": download_status.max_attempts,
             "error": download_status.error,
-            "started_at": download_status.started_at.isoformat() if download_status.started_at else None,
-            "completed_at": download_status.completed_at.isoformat() if download_status.completed_at else None
+            "started_at": datetime.fromtimestamp(download_status.started_at, timezone.utc).isoformat() if download_status.started_at else None,
+            "completed_at": datetime.fromtimestamp(download_status.completed_at, timezone.utc).isoformat() if download_status.completed_at else None
         }
     
     return {
@@ -1280,20 +1676,18 @@ async def get_youtube_stream(url: str):
     Returns direct stream URLs for playback without embed restrictions.
     """
     try:
-        import yt_dlp
-        
         logger.info(f"🎬 [YOUTUBE/YT-DLP] ========== START ==========")
         logger.info(f"🎬 [YOUTUBE/YT-DLP] Received URL: {url}")
         
         # Check if this is a YouTube Mix/Radio playlist (RD prefix)
         # These are auto-generated and can't be accessed directly
-        if 'list=RD' in url or 'list=RDMM' in url or 'list=RDAO' in url:
+        # ('list=RD' also covers the RDMM/RDAO variants)
+        if 'list=RD' in url:
             logger.warning(f"🎬 [YOUTUBE/YT-DLP] Detected YouTube Mix playlist (RD/RDMM/RDAO)")
             
             # Try to extract the video ID from the Mix playlist ID
             # Format: RD{videoId} or RDMM{videoId}
-            import re
-            video_id_match = re.search(r'list=RD(?:MM|AO)?([a-zA-Z0-9_-]{11})', url)
+            video_id_match = YOUTUBE_MIX_ID_RE.search(url)
             
             if video_id_match:
                 video_id = video_id_match.group(1)
@@ -1308,107 +1702,130 @@ async def get_youtube_stream(url: str):
                     detail="YouTube Mix playlists are not supported. Please use a regular playlist or video URL."
                 )
         
-        # yt-dlp options for audio extraction
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'quiet': False,  # Show yt-dlp output for debugging
-            'no_warnings': False,
-            'extract_flat': False,  # Get full info for playlists
-            'ignoreerrors': True,   # Continue on errors
-            'logger': logger,  # Use our logger
-        }
+        cached = youtube_stream_cache.get(url)
+        if cached and time.time() - cached[1] < YOUTUBE_STREAM_CACHE_TTL:
+            response = cached[0]
+            logger.info(f"🎬 [YOUTUBE/YT-DLP] ✅ Cache hit ({response['type']})")
+            # Queue downloads again in case files were evicted (no-op if cached)
+            if response['type'] == 'playlist':
+                video_ids = [track['video_id'] for track in response['tracks']]
+                await youtube_download_manager.download_playlist(video_ids, current_index=0)
+            elif response['video_id']:
+                await youtube_download_manager.download_video(response['video_id'], priority=True)
+            return response
         
         logger.info(f"🎬 [YOUTUBE/YT-DLP] Calling yt-dlp.extract_info()...")
         
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
+        # extract_info blocks for seconds; keep it off the event loop
+        def extract_info():
+            return get_ytdlp('stream', YTDLP_STREAM_OPTS).extract_info(url, download=False)
+        
+        info = await asyncio.get_running_loop().run_in_executor(YTDLP_EXECUTOR, extract_info)
+        
+        logger.info(f"🎬 [YOUTUBE/YT-DLP] Extract complete. Info type: {type(info)}")
+        
+        if not info:
+            logger.error(f"🎬 [YOUTUBE/YT-DLP] yt-dlp returned None - video may be unavailable")
+            raise HTTPException(
+                status_code=404, 
+                detail="Could not extract video information. The video may be private, deleted, or region-restricted."
+            )
+        
+        # Handle playlists
+        if 'entries' in info:
+            logger.info(f"🎬 [YOUTUBE/YT-DLP] Type: PLAYLIST with {len(info.get('entries', []))} entries")
+            tracks = []
+            video_ids = []
             
-            logger.info(f"🎬 [YOUTUBE/YT-DLP] Extract complete. Info type: {type(info)}")
+            for idx, entry in enumerate(info['entries']):
+                if entry:
+                    video_id = entry.get('id')
+                    if video_id:
+                        video_ids.append(video_id)
+                        logger.info(f"🎬 [YOUTUBE/YT-DLP]   Track {idx+1}: {entry.get('title', 'Unknown')} (ID: {video_id})")
+                        tracks.append({
+                            'title': entry.get('title', 'Unknown'),
+                            'duration': entry.get('duration', 0),
+                            'url': f"https://www.youtube.com/watch?v={video_id}",
+                            'video_id': video_id,
+                            'thumbnail': entry.get('thumbnail'),
+                        })
             
-            if not info:
-                logger.error(f"🎬 [YOUTUBE/YT-DLP] yt-dlp returned None - video may be unavailable")
-                raise HTTPException(
-                    status_code=404, 
-                    detail="Could not extract video information. The video may be private, deleted, or region-restricted."
-                )
+            # Queue all videos for download immediately (prioritize first track)
+            if video_ids:
+                logger.info(f"🎬 [YOUTUBE/YT-DLP] Queuing {len(video_ids)} videos for download")
+                await youtube_download_manager.download_playlist(video_ids, current_index=0)
             
-            # Handle playlists
-            if 'entries' in info:
-                logger.info(f"🎬 [YOUTUBE/YT-DLP] Type: PLAYLIST with {len(info.get('entries', []))} entries")
-                tracks = []
-                video_ids = []
-                
-                for idx, entry in enumerate(info['entries']):
-                    if entry:
-                        video_id = entry.get('id')
-                        if video_id:
-                            video_ids.append(video_id)
-                            logger.info(f"🎬 [YOUTUBE/YT-DLP]   Track {idx+1}: {entry.get('title', 'Unknown')} (ID: {video_id})")
-                            tracks.append({
-                                'title': entry.get('title', 'Unknown'),
-                                'duration': entry.get('duration', 0),
-                                'url': f"https://www.youtube.com/watch?v={video_id}",
-                                'video_id': video_id,
-                                'thumbnail': entry.get('thumbnail'),
-                            })
-                
-                # Queue all videos for download immediately (prioritize first track)
-                if video_ids:
-                    logger.info(f"🎬 [YOUTUBE/YT-DLP] Queuing {len(video_ids)} videos for download")
-                    await youtube_download_manager.download_playlist(video_ids, current_index=0)
-                
-                logger.info(f"🎬 [YOUTUBE/YT-DLP] ✅ SUCCESS - Returning {len(tracks)} tracks")
-                logger.info(f"🎬 [YOUTUBE/YT-DLP] ========== END ==========")
-                return {
-                    'found': True,
-                    'type': 'playlist',
-                    'title': info.get('title', 'Unknown Playlist'),
-                    'tracks': tracks,
-                    'track_count': len(tracks)
-                }
-            
-            # Handle single video
-            else:
-                video_id = info.get('id')
-                logger.info(f"🎬 [YOUTUBE/YT-DLP] Type: SINGLE VIDEO")
-                logger.info(f"🎬 [YOUTUBE/YT-DLP] Title: {info.get('title', 'Unknown')}")
-                logger.info(f"🎬 [YOUTUBE/YT-DLP] Duration: {info.get('duration', 0)}s")
-                logger.info(f"🎬 [YOUTUBE/YT-DLP] Video ID: {video_id}")
-                
-                # Queue single video for download immediately
-                if video_id:
-                    logger.info(f"🎬 [YOUTUBE/YT-DLP] Queuing video for download: {video_id}")
-                    await youtube_download_manager.download_video(video_id, priority=True)
-                
-                logger.info(f"🎬 [YOUTUBE/YT-DLP] ✅ SUCCESS")
-                logger.info(f"🎬 [YOUTUBE/YT-DLP] ========== END ==========")
-                return {
-                    'found': True,
-                    'type': 'video',
-                    'title': info.get('title', 'Unknown'),
-                    'duration': info.get('duration', 0),
-                    'video_id': video_id,
-                    'url': f"https://www.youtube.com/watch?v={video_id}" if video_id else None,
-                    'thumbnail': info.get('thumbnail'),
-                }
+            logger.info(f"🎬 [YOUTUBE/YT-DLP] ✅ SUCCESS - Returning {len(tracks)} tracks")
+            logger.info(f"🎬 [YOUTUBE/YT-DLP] ========== END ==========")
+            response = {
+                'found': True,
+                'type': 'playlist',
+                'title': info.get('title', 'Unknown Playlist'),
+                'tracks': tracks,
+                'track_count': len(tracks)
+            }
+            _cache_youtube_stream(url, response)
+            return response
         
-    except yt_dlp.utils.DownloadError as e:
-        logger.error(f"🎬 [YOUTUBE/YT-DLP] ❌ DownloadError for URL {url}")
-        logger.error(f"🎬 [YOUTUBE/YT-DLP] Error: {e}")
-        logger.error(f"🎬 [YOUTUBE/YT-DLP] ========== END (ERROR) ==========")
+        # Handle single video
+        else:
+            video_id = info.get('id')
+            logger.info(f"🎬 [YOUTUBE/YT-DLP] Type: SINGLE VIDEO")
+            logger.info(f"🎬 [YOUTUBE/YT-DLP] Title: {info.get('title', 'Unknown')}")
+            logger.info(f"🎬 [YOUTUBE/YT-DLP] Duration: {info.get('duration', 0)}s")
+            logger.info(f"🎬 [YOUTUBE/YT-DLP] Video ID: {video_id}")
+            
+            # Queue single video for download immediately
+            if video_id:
+                logger.info(f"🎬 [YOUTUBE/YT-DLP] Queuing video for download: {video_id}")
+                await youtube_download_manager.download_video(video_id, priority=True)
+            
+            logger.info(f"🎬 [YOUTUBE/YT-DLP] ✅ SUCCESS")
+            logger.info(f"🎬 [YOUTUBE/YT-DLP] ========== END ==========")
+            response = {
+                'found': True,
+                'type': 'video',
+                'title': info.get('title', 'Unknown'),
+                'duration': info.get('duration', 0),
+                'video_id': video_id,
+                'url': f"https://www.youtube.com/watch?v={video_id}" if video_id else None,
+                'thumbnail': info.get('thumbnail'),
+            }
+            _cache_youtube_stream(url, response)
+            return response
+    
+    except HTTPException:
+        raise
+    except (yt_dlp.utils.DownloadError, yt_dlp.utils.ExtractorError) as e:
+        # Expected for private/removed/region-locked videos; no traceback needed
+        logger.error("🎬 [YOUTUBE/YT-DLP] ❌ %s for URL %s: %s", type(e).__name__, url, e)
         raise HTTPException(status_code=404, detail=f"Could not extract stream: {str(e)}")
     except Exception as e:
-        logger.error(f"🎬 [YOUTUBE/YT-DLP] ❌ Unexpected error for URL {url}")
-        logger.error(f"🎬 [YOUTUBE/YT-DLP] Error: {e}")
-        import traceback
-        logger.error(f"🎬 [YOUTUBE/YT-DLP] Traceback:\n{traceback.format_exc()}")
-        logger.error(f"🎬 [YOUTUBE/YT-DLP] ========== END (ERROR) ==========")
+        logger.exception("🎬 [YOUTUBE/YT-DLP] ❌ Unexpected error for URL %s", url)
         raise HTTPException(status_code=500, detail=str(e))
 
 # Simple cache for Bandcamp track data to avoid rate limiting
-bandcamp_tracks_cache = {}
+bandcamp_tracks_cache = {}  # url -> (serialized JSON body, cached_time)
 BANDCAMP_CACHE_TTL = 3600  # 1 hour
 
+# Extractions in flight, so concurrent requests for one album share a page load
+bandcamp_extractions: Dict[str, asyncio.Task] = {}
+
+async def _extract_bandcamp_tracks(url: str) -> Dict[str, Any]:
+    """Load a Bandcamp album page in a pooled context and extract its tracks"""
+    # Waits if all contexts are busy
+    async with browser_pool.context() as context:
+        page = await context.new_page()
+        try:
+            # Enable console logging from the page
+            page.on("console", lambda msg: logger.info(f"Browser console: {msg.text}"))
+            
+            verifier = PlatformVerifier(page)
+            return await verifier.extract_bandcamp_tracks(url)
+        finally:
+            await page.close()
+
 @app.get("/api/bandcamp/tracks")
 async def get_bandcamp_tracks(url: str):
     """
@@ -1417,36 +1834,28 @@ async def get_bandcamp_tracks(url: str):
     Cached for 1 hour to avoid rate limiting.
     """
     try:
-        from playwright.async_api import async_playwright
-        from platform_verifier import PlatformVerifier
-        import time
-        
         # Check cache first
         cache_key = url
         if cache_key in bandcamp_tracks_cache:
-            cached_data, cached_time = bandcamp_tracks_cache[cache_key]
+            cached_body, cached_time = bandcamp_tracks_cache[cache_key]
             if time.time() - cached_time < BANDCAMP_CACHE_TTL:
                 logger.info(f"🎵 [CACHE HIT] Returning cached tracks for: {url}")
-                return cached_data
+                return Response(content=cached_body, media_type="application/json")
             else:
                 logger.info(f"🎵 [CACHE EXPIRED] Re-fetching tracks for: {url}")
                 del bandcamp_tracks_cache[cache_key]
         
         logger.info(f"🎵 [CACHE MISS] Extracting Bandcamp tracks from: {url}")
         
-        # Launch browser and extract tracks
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
-            page = await context.new_page()
-            
-            # Enable console logging from the page
-            page.on("console", lambda msg: logger.info(f"Browser console: {msg.text}"))
-            
-            verifier = PlatformVerifier(page)
-            track_data = await verifier.extract_bandcamp_tracks(url)
-            
-            await browser.close()
+        # Join an extraction already running for this URL, or start one
+        extraction = bandcamp_extractions.get(url)
+        if extraction is None:
+            extraction = asyncio.create_task(_extract_bandcamp_tracks(url))
+            bandcamp_extractions[url] = extraction
+            extraction.add_done_callback(lambda _: bandcamp_extractions.pop(url, None))
+        
+        # Shielded so a client disconnecting doesn't cancel it for the others
+        track_data = await asyncio.shield(extraction)
         
         logger.info(f"Track extraction result: found={track_data.get('found')}, tracks={len(track_data.get('tracks', []))}")
         
@@ -1455,11 +1864,12 @@ async def get_bandcamp_tracks(url: str):
             logger.error(f"❌ Track extraction failed: {error_msg}")
             raise HTTPException(status_code=404, detail=error_msg)
         
-        # Cache the successful result
-        bandcamp_tracks_cache[cache_key] = (track_data, time.time())
+        # Cache the successful result already serialized, so hits skip encoding
+        body = orjson.dumps(track_data)
+        bandcamp_tracks_cache[cache_key] = (body, time.time())
         logger.info(f"✓ Successfully extracted and cached {len(track_data['tracks'])} tracks")
         
-        return track_data
+        return Response(content=body, media_type="application/json")
         
     except HTTPException:
         raise
@@ -1467,44 +1877,94 @@ async def get_bandcamp_tracks(url: str):
         logger.error(f"❌ Error extracting Bandcamp tracks: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
+# Admin verification runs are recorded in verification_jobs and handled one at
+# a time by a single worker (one job's albums are verified in parallel)
+verification_queue: asyncio.Queue = asyncio.Queue()
+verification_worker: Optional[asyncio.Task] = None
+
+def enqueue_verification_job(job_id: int):
+    """Queue a verification job and start the worker if it isn't running"""
+    global verification_worker
+    verification_queue.put_nowait(job_id)
+    if verification_worker is None or verification_worker.done():
+        verification_worker = asyncio.create_task(run_verification_queue())
+
+async def run_verification_queue():
+    """Drain verification_queue; albums of a job are verified in parallel on the shared browser pool"""
+    verifier = BatchVerifier(db, pool=browser_pool)
+    while not verification_queue.empty():
+        job = db.get_verification_job(verification_queue.get_nowait())
+        if job is None or job['state'] not in ('pending', 'running'):
+            continue  # Canceled while waiting
+        
+        db.update_verification_job(job['id'], 'running')
+        try:
+            # Per-album results stay in the logs; the job keeps the counters
+            def save_progress(stats: Dict[str, Any], job_id: int = job['id']):
+                db.update_verification_job_progress(
+                    job_id, {key: value for key, value in stats.items() if key != 'results'}
+                )
+            
+            stats = await verifier.verify_date_range(
+                job['start_date'], job['end_date'], job['min_similarity'],
+                progress_callback=save_progress
+            )
+            logger.info(f"Verification job {job['id']} complete: {stats.get('verified')}/{stats.get('total')} verified")
+            db.update_verification_job(
+                job['id'], 'success',
+                stats={key: value for key, value in stats.items() if key != 'results'}
+            )
+        except Exception as e:
+            logger.error(f"Verification job {job['id']} failed: {e}")
+            db.update_verification_job(job['id'], 'failure', error=str(e))
+        finally:
+            # A failed job may already have saved playable URLs for some albums
+            invalidate_album_caches()
+
 @app.post("/api/admin/verify-playable")
 async def verify_playable_urls(
     start_date: str = Query(..., description="Start date (YYYY-MM-DD)"),
     end_date: str = Query(..., description="End date (YYYY-MM-DD)"),
     min_similarity: int = Query(75, description="Minimum fuzzy match score (0-100)"),
-    background_tasks: BackgroundTasks = None,
     token: str = Depends(verify_admin_token)
 ):
     """
     Verify playable URLs for albums in date range.
     This runs in the background and updates albums with embed URLs.
+    Jobs are persisted (and resumed after a restart); poll
+    /api/admin/verify-playable/jobs/{job_id} for the outcome.
     """
-    from batch_verifier import BatchVerifier
-    
-    async def run_verification():
-        verifier = BatchVerifier(db, headless=True)
-        try:
-            await verifier.initialize()
-            stats = await verifier.verify_date_range(start_date, end_date, min_similarity)
-            logger.info(f"Verification complete: {stats}")
-        except Exception as e:
-            logger.error(f"Verification error: {e}")
-        finally:
-            await verifier.close()
-    
-    # Run in background
-    if background_tasks:
-        background_tasks.add_task(run_verification)
-    else:
-        # Fallback: run synchronously
-        await run_verification()
+    job_id = db.create_verification_job(start_date, end_date, min_similarity)
+    enqueue_verification_job(job_id)
     
     return {
         "message": "Playable URL verification started",
+        "job_id": job_id,
         "date_range": f"{start_date} to {end_date}",
-        "min_similarity": min_similarity
+        "min_similarity": min_similarity,
+        "queued_runs": verification_queue.qsize()
     }
 
+@app.get("/api/admin/verify-playable/jobs/{job_id}")
+async def get_verification_job(job_id: int, token: str = Depends(verify_admin_token)):
+    """Get the state and statistics of a verification job"""
+    job = db.get_verification_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Verification job not found")
+    return job
+
+@app.post("/api/admin/verify-playable/jobs/{job_id}/cancel")
+async def cancel_verification_job(job_id: int, token: str = Depends(verify_admin_token)):
+    """Cancel a verification job that hasn't started yet"""
+    job = db.get_verification_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Verification job not found")
+    if job['state'] != 'pending':
+        raise HTTPException(status_code=409, detail=f"Only pending jobs can be canceled (job is {job['state']})")
+    
+    db.update_verification_job(job_id, 'canceled')
+    return {"message": f"Verification job {job_id} canceled"}
+
 @app.get("/api/admin/test-youtube-search")
 async def test_youtube_search(
     band_name: str = Query("AngelMaker", description="Band name to search"),
@@ -1517,7 +1977,7 @@ async def test_youtube_search(
     """
     import time
     import asyncio
-    from fuzzywuzzy import fuzz
+    from rapidfuzz import fuzz, utils
     
     diagnostic_log = []
     start_time = time.time()
@@ -1639,9 +2099,10 @@ async def test_youtube_search(
                 title_lower = result['title'].lower()
                 
                 # Calculate similarity scores
-                full_score = fuzz.token_sort_ratio(search_term, title_lower)
-                album_score = fuzz.partial_ratio(album_name.lower(), title_lower)
-                band_score = fuzz.partial_ratio(band_name.lower(), title_lower)
+                # Same scores as platform_verifier.title_match_scores, without cutoffs
+                full_score = round(fuzz.token_sort_ratio(search_term, title_lower, processor=utils.default_process))
+                album_score = round(fuzz.partial_ratio(album_name.lower(), title_lower))
+                band_score = round(fuzz.partial_ratio(band_name.lower(), title_lower))
                 
                 # Boost score if "full album" is in title
                 boost = 10 if 'full album' in title_lower else 0
@@ -1749,56 +2210,56 @@ async def test_youtube_search(
             "execution_time": f"{time.time() - start_time:.2f}s"
         }
 
-@app.delete("/api/admin/data/{date}")
-async def delete_data_by_date(date: str, token: str = Depends(verify_admin_token)):
-    """Delete all data for a specific date"""
-    search_date = None
-    
+# Declared before /api/admin/data/{date}, which would otherwise capture "range"
+@app.delete("/api/admin/data/range")
+async def delete_data_by_range(
+    request: DeleteRangeRequest,
+    background_tasks: BackgroundTasks,
+    token: str = Depends(verify_admin_token)
+):
+    """Delete all data within a date range (dates are validated by DeleteRangeRequest)"""
+    # isoformat() is the database storage format
+    start_date = request.start_date.isoformat()
+    end_date = request.end_date.isoformat()
     try:
-        # Try YYYY-MM-DD format first (database storage format)
-        try:
-            parsed_date = datetime.strptime(date, "%Y-%m-%d")
-            search_date = date  # Use as-is since it matches database format
-        except ValueError:
-            # Try DD-MM-YYYY format and convert to database format
-            parsed_date = datetime.strptime(date, "%d-%m-%Y")
-            search_date = parsed_date.strftime("%Y-%m-%d")  # Convert to database format
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD or DD-MM-YYYY")
+        deleted_count = db.delete_albums_by_date_range(start_date, end_date)
+    finally:
+        # Batches may have been committed even if a later one failed
+        invalidate_album_caches()
     
-    deleted_count = db.delete_albums_by_date(search_date)
+    if db.vacuum_pending:
+        # Everything was deleted; give the space back after responding (runs in the threadpool)
+        background_tasks.add_task(db.vacuum)
     
     if deleted_count == 0:
-        raise HTTPException(status_code=404, detail=f"No data found for date {date}")
+        raise HTTPException(status_code=404, detail=f"No data found in range {start_date} to {end_date}")
     
     return {
-        "message": f"Deleted {deleted_count} albums for {date}",
-        "date": date,
+        "message": f"Deleted {deleted_count} albums from {start_date} to {end_date}",
+        "start_date": start_date,
+        "end_date": end_date,
         "deleted_albums": deleted_count
     }
 
-@app.delete("/api/admin/data/range")
-async def delete_data_by_range(request: DeleteRangeRequest, token: str = Depends(verify_admin_token)):
-    """Delete all data within a date range"""
-    try:
-        # Validate date formats
-        start_parsed = datetime.strptime(request.start_date, "%d-%m-%Y")
-        end_parsed = datetime.strptime(request.end_date, "%d-%m-%Y")
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid date format. Use DD-MM-YYYY")
-    
-    if start_parsed > end_parsed:
-        raise HTTPException(status_code=400, detail="Start date must be before or equal to end date")
+@app.delete("/api/admin/data/{date}")
+async def delete_data_by_date(date: str, token: str = Depends(verify_admin_token)):
+    """Delete all data for a specific date"""
+    parsed_date = parse_admin_date(date)
+    if parsed_date is None:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD or DD-MM-YYYY")
     
-    deleted_count = db.delete_albums_by_date_range(request.start_date, request.end_date)
+    # isoformat() is the database storage format
+    try:
+        deleted_count = db.delete_albums_by_date(parsed_date.isoformat())
+    finally:
+        invalidate_album_caches()
     
     if deleted_count == 0:
-        raise HTTPException(status_code=404, detail=f"No data found in range {request.start_date} to {request.end_date}")
+        raise HTTPException(status_code=404, detail=f"No data found for date {date}")
     
     return {
-        "message": f"Deleted {deleted_count} albums from {request.start_date} to {request.end_date}",
-        "start_date": request.start_date,
-        "end_date": request.end_date,
+        "message": f"Deleted {deleted_count} albums for {date}",
+        "date": date,
         "deleted_albums": deleted_count
     }
 
@@ -1807,8 +2268,9 @@ async def get_admin_summary(token: str = Depends(verify_admin_token)):
     """Get database summary for admin dashboard"""
     try:
         summary = db.get_data_summary()
-        summary["scraping_status"] = scraping_status
-        return summary
+        summary["scraping_status"] = scraping_status.to_dict()
+        # Plain JSON types only; skip FastAPI's jsonable_encoder walk over dates_data
+        return ORJSONResponse(summary)
     except Exception as e:
         logger.error(f"Error fetching admin summary: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch admin summary")
@@ -1817,10 +2279,9 @@ async def get_admin_summary(token: str = Depends(verify_admin_token)):
 @app.get("/api/admin/settings/platform-links")
 async def get_platform_link_settings(token: str = Depends(verify_admin_token)):
     """Get platform link visibility settings"""
-    import config as app_config
     
     # Get settings from database or use defaults from config
-    platforms = app_config.LINK_EXTRACTION.get('platforms', {})
+    platforms = config.LINK_EXTRACTION.get('platforms', {})
     settings = {}
     
     for platform_name, platform_info in platforms.items():
@@ -1841,19 +2302,24 @@ async def get_platform_link_settings(token: str = Depends(verify_admin_token)):
     return {"settings": settings}
 
 @app.put("/api/admin/settings/platform-links")
-async def update_platform_link_settings(settings: dict, token: str = Depends(verify_admin_token)):
+async def update_platform_link_settings(settings: Dict[str, PlatformLinkSetting], token: str = Depends(verify_admin_token)):
     """Update platform link visibility settings"""
     try:
-        for platform_name, platform_data in settings.items():
-            if 'visible' in platform_data:
-                db.set_setting(
-                    f'platform_link_visible_{platform_name}',
-                    platform_data['visible'],
-                    category='platform_links',
-                    description=f'Visibility setting for {platform_name} links'
-                )
+        db.set_settings([
+            (
+                f'platform_link_visible_{platform_name}',
+                platform_data.visible,
+                'platform_links',
+                f'Visibility setting for {platform_name} links'
+            )
+            for platform_name, platform_data in settings.items()
+            if platform_data.visible is not None
+        ])
         
-        return {"message": "Settings updated successfully", "settings": settings}
+        return {
+            "message": "Settings updated successfully",
+            "settings": {name: data.model_dump(exclude_none=True) for name, data in settings.items()}
+        }
     except Exception as e:
         logger.error(f"Error updating settings: {e}")
         raise HTTPException(status_code=500, detail="Failed to update settings")
@@ -1861,9 +2327,8 @@ async def update_platform_link_settings(settings: dict, token: str = Depends(ver
 @app.get("/api/settings/platform-links")
 async def get_public_platform_link_settings():
     """Get platform link visibility settings (public endpoint for frontend)"""
-    import config as app_config
     
-    platforms = app_config.LINK_EXTRACTION.get('platforms', {})
+    platforms = config.LINK_EXTRACTION.get('platforms', {})
     settings = {}
     
     for platform_name, platform_info in platforms.items():
@@ -1931,87 +2396,41 @@ async def get_cache_settings(token: str = Depends(verify_admin_token)):
         raise HTTPException(status_code=500, detail="Failed to get cache settings")
 
 @app.put("/api/admin/settings/cache")
-async def update_cache_settings(settings: dict, token: str = Depends(verify_admin_token)):
-    """Update YouTube cache and download settings"""
+async def update_cache_settings(settings: CacheSettingsUpdate, token: str = Depends(verify_admin_token)):
+    """Update YouTube cache and download settings (ranges are validated by CacheSettingsUpdate)"""
     try:
-        if 'youtube_cache_max_size_gb' in settings:
-            new_size = float(settings['youtube_cache_max_size_gb'])
-            
-            # Validate size (must be positive, reasonable limit of 100GB)
-            if new_size <= 0 or new_size > 100:
-                raise HTTPException(status_code=400, detail="Cache size must be between 0 and 100 GB")
-            
-            # Save to database
-            db.set_setting(
-                'youtube_cache_max_size_gb',
-                new_size,
-                category='cache',
-                description='Maximum YouTube cache size in gigabytes'
-            )
-            
-            # Update cache manager
-            youtube_cache.update_max_size(new_size)
-            
-            logger.info(f"📦 [CACHE] Settings updated: max_size={new_size} GB")
-        
-        if 'youtube_parallel_downloads' in settings:
-            new_parallel = int(settings['youtube_parallel_downloads'])
-            
-            # Validate (must be between 1 and 10)
-            if new_parallel < 1 or new_parallel > 10:
-                raise HTTPException(status_code=400, detail="Parallel downloads must be between 1 and 10")
-            
-            # Save to database
-            db.set_setting(
-                'youtube_parallel_downloads',
-                new_parallel,
-                category='cache',
-                description='Maximum number of parallel YouTube downloads'
-            )
-            
-            # Update download manager
-            youtube_download_manager.update_max_parallel(new_parallel)
-            
-            logger.info(f"🔧 [DOWNLOAD-MGR] Settings updated: max_parallel={new_parallel}")
-        
-        if 'youtube_download_timeout' in settings:
-            new_timeout = int(settings['youtube_download_timeout'])
-            
-            # Validate (must be between 60 and 600 seconds)
-            if new_timeout < 60 or new_timeout > 600:
-                raise HTTPException(status_code=400, detail="Download timeout must be between 60 and 600 seconds")
-            
-            # Save to database
-            db.set_setting(
-                'youtube_download_timeout',
-                new_timeout,
-                category='cache',
-                description='Timeout for individual YouTube downloads in seconds'
-            )
-            
+        # Saved together in one commit; live components are updated afterwards
+        entries = []
+        if settings.youtube_cache_max_size_gb is not None:
+            entries.append(('youtube_cache_max_size_gb', settings.youtube_cache_max_size_gb,
+                            'cache', 'Maximum YouTube cache size in gigabytes'))
+        if settings.youtube_parallel_downloads is not None:
+            entries.append(('youtube_parallel_downloads', settings.youtube_parallel_downloads,
+                            'cache', 'Maximum number of parallel YouTube downloads'))
+        if settings.youtube_download_timeout is not None:
+            entries.append(('youtube_download_timeout', settings.youtube_download_timeout,
+                            'cache', 'Timeout for individual YouTube downloads in seconds'))
+        if settings.youtube_post_scrape_downloads is not None:
+            entries.append(('youtube_post_scrape_downloads', settings.youtube_post_scrape_downloads,
+                            'cache', 'Parallel downloads after scraping completes (1-10)'))
+        db.set_settings(entries)
+        
+        if settings.youtube_cache_max_size_gb is not None:
+            youtube_cache.update_max_size(settings.youtube_cache_max_size_gb)
+            logger.info(f"📦 [CACHE] Settings updated: max_size={settings.youtube_cache_max_size_gb} GB")
+        
+        if settings.youtube_parallel_downloads is not None:
+            youtube_download_manager.update_max_parallel(settings.youtube_parallel_downloads)
+            logger.info(f"🔧 [DOWNLOAD-MGR] Settings updated: max_parallel={settings.youtube_parallel_downloads}")
+        
+        if settings.youtube_download_timeout is not None:
             # Note: timeout change requires restart to take effect
-            logger.info(f"🔧 [DOWNLOAD-MGR] Settings updated: timeout={new_timeout}s (requires restart)")
+            logger.info(f"🔧 [DOWNLOAD-MGR] Settings updated: timeout={settings.youtube_download_timeout}s (requires restart)")
         
-        if 'youtube_post_scrape_downloads' in settings:
-            new_post_scrape = int(settings['youtube_post_scrape_downloads'])
-            
-            # Validate (must be between 1 and 10)
-            if new_post_scrape < 1 or new_post_scrape > 10:
-                raise HTTPException(status_code=400, detail="Post-scrape parallel downloads must be between 1 and 10")
-            
-            # Save to database
-            db.set_setting(
-                'youtube_post_scrape_downloads',
-                new_post_scrape,
-                category='cache',
-                description='Parallel downloads after scraping completes (1-10)'
-            )
-            
-            logger.info(f"🔧 [DOWNLOAD-MGR] Settings updated: post_scrape_downloads={new_post_scrape}")
+        if settings.youtube_post_scrape_downloads is not None:
+            logger.info(f"🔧 [DOWNLOAD-MGR] Settings updated: post_scrape_downloads={settings.youtube_post_scrape_downloads}")
         
-        return {"message": "Cache settings updated successfully", "settings": settings}
-    except HTTPException:
-        raise
+        return {"message": "Cache settings updated successfully", "settings": settings.model_dump(exclude_none=True)}
     except Exception as e:
         logger.error(f"Error updating cache settings: {e}")
         raise HTTPException(status_code=500, detail="Failed to update cache settings")
@@ -2041,28 +2460,24 @@ async def get_player_settings():
         raise HTTPException(status_code=500, detail="Failed to get player settings")
 
 @app.put("/api/admin/settings/player")
-async def update_player_settings(settings: dict, token: str = Depends(verify_admin_token)):
+async def update_player_settings(settings: PlayerSettingsUpdate, token: str = Depends(verify_admin_token)):
     """Update player service settings"""
     try:
-        if 'bandcamp_enabled' in settings:
-            db.set_setting(
-                'player_bandcamp_enabled',
-                bool(settings['bandcamp_enabled']),
-                category='player',
-                description='Enable/disable Bandcamp player'
-            )
-            logger.info(f"🎵 [PLAYER] Bandcamp enabled: {settings['bandcamp_enabled']}")
-        
-        if 'youtube_enabled' in settings:
-            db.set_setting(
-                'player_youtube_enabled',
-                bool(settings['youtube_enabled']),
-                category='player',
-                description='Enable/disable YouTube player'
-            )
-            logger.info(f"🎬 [PLAYER] YouTube enabled: {settings['youtube_enabled']}")
+        entries = []
+        if settings.bandcamp_enabled is not None:
+            entries.append(('player_bandcamp_enabled', settings.bandcamp_enabled,
+                            'player', 'Enable/disable Bandcamp player'))
+            logger.info(f"🎵 [PLAYER] Bandcamp enabled: {settings.bandcamp_enabled}")
+        
+        if settings.youtube_enabled is not None:
+            entries.append(('player_youtube_enabled', settings.youtube_enabled,
+                            'player', 'Enable/disable YouTube player'))
+            logger.info(f"🎬 [PLAYER] YouTube enabled: {settings.youtube_enabled}")
         
-        return {"message": "Player settings updated successfully", "settings": settings}
+        db.set_settings(entries)
+        
+        invalidate_album_caches()
+        return {"message": "Player settings updated successfully", "settings": settings.model_dump(exclude_none=True)}
     except Exception as e:
         logger.error(f"Error updating player settings: {e}")
         raise HTTPException(status_code=500, detail="Failed to update player settings")
@@ -2134,10 +2549,16 @@ async def verify_token_endpoint(token: str = Depends(verify_admin_token)):
 # ============================================================================
 
 @app.get("/api/playlists")
-async def get_playlists():
-    """Get all playlists."""
+async def get_playlists(request: Request, response: Response):
+    """Get all playlists. Supports conditional requests via ETag."""
     try:
-        playlists = db.get_all_playlists()
+        etag = _compute_etag('playlists', *await run_read(AlbumsDatabase.get_playlists_version))
+        if _etag_matches(request, etag):
+            return _not_modified(etag)
+        
+        playlists = await run_read(AlbumsDatabase.get_all_playlists)
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
         return {"playlists": playlists}
     except Exception as e:
         logger.error(f"Error fetching playlists: {e}")
@@ -2147,7 +2568,7 @@ async def get_playlists():
 async def get_playlist(playlist_id: int):
     """Get playlist details with items."""
     try:
-        playlist = db.get_playlist(playlist_id)
+        playlist = await run_read(AlbumsDatabase.get_playlist, playlist_id)
         if not playlist:
             raise HTTPException(status_code=404, detail="Playlist not found")
         return playlist
@@ -2204,6 +2625,111 @@ async def delete_playlist(playlist_id: int):
         logger.error(f"Error deleting playlist: {e}")
         raise HTTPException(status_code=500, detail="Failed to delete playlist")
 
+def _get_platform_url(album: Dict[str, Any], platform: str) -> str:
+    """Get the album's link for a playable platform, or raise a 400"""
+    platform_url = album.get(f'{platform}_url')
+    if not platform_url or platform_url == 'N/A' or platform_url == '':
+        raise HTTPException(
+            status_code=400, 
+            detail=f"No {platform} link available for this album"
+        )
+    
+    if platform not in ('youtube', 'bandcamp'):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Platform '{platform}' not supported for playback. Only 'youtube' and 'bandcamp' are supported."
+        )
+    
+    return platform_url
+
+async def _verify_album_on_platform(
+    verifier: PlatformVerifier,
+    album: Dict[str, Any],
+    platform: str,
+    platform_url: str
+) -> Dict[str, Any]:
+    """Verify that the platform link contains the album, or raise a 404"""
+    if platform == 'youtube':
+        result = await verifier.verify_youtube_album(
+            youtube_url=platform_url,
+            album_name=album['album_name'],
+            band_name=album['band_name'],
+            min_similarity=75  # Configurable threshold
+        )
+    else:
+        result = await verifier.verify_bandcamp_album(
+            bandcamp_url=platform_url,
+            album_name=album['album_name'],
+            album_type=album.get('type', 'album'),
+            min_similarity=75
+        )
+    
+    # Check if album was found
+    if not result.get('found'):
+        error_msg = result.get('error', 'Album not found on platform')
+        raise HTTPException(
+            status_code=404,
+            detail=f"Album not found on {platform}. {error_msg}"
+        )
+    
+    return result
+
+# Bounds how many playlist-item verifications (single and batch) use the browser pool at once
+playlist_verification_semaphore = asyncio.Semaphore(config.PLAYLIST_VERIFY_CONCURRENCY)
+
+def _cached_playlist_verification(album: Dict[str, Any], platform: str, platform_url: str) -> Optional[Dict[str, Any]]:
+    """A recent verification of this album's platform link (from any playlist), if any"""
+    return db.get_cached_verification(
+        album['album_id'], platform, platform_url, config.PLAYLIST_VERIFICATION_CACHE_DAYS
+    )
+
+async def _verify_playlist_album(album: Dict[str, Any], platform: str, platform_url: str) -> Dict[str, Any]:
+    """Verify an album on a platform (cached, else on a page from the shared browser pool)"""
+    cached = _cached_playlist_verification(album, platform, platform_url)
+    if cached:
+        return cached
+    
+    async with playlist_verification_semaphore:
+        async with browser_pool.context() as context:
+            page = await context.new_page()
+            try:
+                result = await _verify_album_on_platform(PlatformVerifier(page), album, platform, platform_url)
+            except HTTPException as e:
+                # "Not found" is a normal outcome; keep it from discarding a healthy context
+                not_verified = e
+            else:
+                db.save_verification(album['album_id'], platform, platform_url, result)
+                return result
+            finally:
+                await page.close()
+        raise not_verified
+
+async def _verify_and_update_playlist_item(
+    item_id: int,
+    album: Dict[str, Any],
+    platform: str,
+    platform_url: str
+):
+    """Background task: verify a pending playlist item and record the outcome"""
+    try:
+        result = await _verify_playlist_album(album, platform, platform_url)
+        
+        db.update_playlist_item_verification(
+            item_id=item_id,
+            verification_status='verified',
+            playable_url=result['embed_url'],
+            verification_score=result['match_score'],
+            verified_title=result['title'],
+            embed_type=result.get('type', 'video')
+        )
+        logger.info(f"✓ Playlist item {item_id} verified (Match: {result['match_score']}%)")
+    except HTTPException as e:
+        logger.warning(f"Playlist item {item_id} failed verification: {e.detail}")
+        db.update_playlist_item_verification(item_id=item_id, verification_status='failed')
+    except Exception as e:
+        logger.error(f"Error verifying playlist item {item_id}: {e}")
+        db.update_playlist_item_verification(item_id=item_id, verification_status='failed')
+
 @app.post("/api/playlists/{playlist_id}/items")
 async def add_playlist_item(
     playlist_id: int, 
@@ -2212,88 +2738,69 @@ async def add_playlist_item(
 ):
     """
     Add item to playlist with verification.
-    Verifies that the platform link contains the album using fuzzy matching.
+    If the album's platform link was verified recently (for any playlist),
+    the item is added as 'verified' straight away. Otherwise it is stored as
+    'pending' and returned immediately; a background task then verifies that
+    the platform link contains the album using fuzzy matching and marks the
+    item 'verified' or 'failed'. Poll
+    /api/playlists/{playlist_id}/items/{item_id}/status for the outcome.
     """
     try:
-        # Check if playlist exists
-        playlist = db.get_playlist(playlist_id)
+        # The playlist and album lookups are independent; run them side by side off the loop
+        playlist, album = await asyncio.gather(
+            run_read(AlbumsDatabase.get_playlist, playlist_id),
+            run_read(AlbumsDatabase.get_album_by_id, request.album_id)
+        )
         if not playlist:
             raise HTTPException(status_code=404, detail="Playlist not found")
-        
-        # Get album details
-        album = db.get_album_by_id(request.album_id)
         if not album:
             raise HTTPException(status_code=404, detail="Album not found")
         
         # Get the platform URL
-        platform_url = album.get(f'{request.platform}_url')
-        if not platform_url or platform_url == 'N/A' or platform_url == '':
-            raise HTTPException(
-                status_code=400, 
-                detail=f"No {request.platform} link available for this album"
-            )
-        
-        # Initialize scraper for verification
-        scraper = MetalArchivesScraper(headless=True)
-        await scraper.initialize()
+        platform_url = _get_platform_url(album, request.platform)
         
-        try:
-            # Create verifier
-            verifier = PlatformVerifier(scraper.page)
-            
-            # Verify based on platform
-            if request.platform == 'youtube':
-                result = await verifier.verify_youtube_album(
-                    youtube_url=platform_url,
-                    album_name=album['album_name'],
-                    band_name=album['band_name'],
-                    min_similarity=75  # Configurable threshold
-                )
-            elif request.platform == 'bandcamp':
-                result = await verifier.verify_bandcamp_album(
-                    bandcamp_url=platform_url,
-                    album_name=album['album_name'],
-                    album_type=album.get('type', 'album'),
-                    min_similarity=75
-                )
-            else:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Platform '{request.platform}' not supported for playback. Only 'youtube' and 'bandcamp' are supported."
-                )
-            
-            # Check if album was found
-            if not result.get('found'):
-                error_msg = result.get('error', 'Album not found on platform')
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Album not found on {request.platform}. {error_msg}"
-                )
-            
-            # Add to playlist with verified URL
+        cached = await run_read(
+            AlbumsDatabase.get_cached_verification, album['album_id'], request.platform,
+            platform_url, config.PLAYLIST_VERIFICATION_CACHE_DAYS
+        )
+        if cached:
             item_id = db.add_playlist_item_verified(
                 playlist_id=playlist_id,
                 album_id=request.album_id,
                 platform=request.platform,
-                playable_url=result['embed_url'],
-                verification_status='verified',
-                verification_score=result['match_score'],
-                verified_title=result['title'],
-                embed_type=result.get('type', 'video'),
+                playable_url=cached['embed_url'],
+                verification_score=cached['match_score'],
+                verified_title=cached['title'],
+                embed_type=cached['type'],
                 track_number=request.track_number
             )
-            
             return {
                 "id": item_id,
                 "verified": True,
-                "match_score": result['match_score'],
-                "found_title": result['title'],
-                "embed_url": result['embed_url'],
-                "message": f"Added to playlist (Match: {result['match_score']}%)"
+                "status": "verified",
+                "match_score": cached['match_score'],
+                "found_title": cached['title'],
+                "embed_url": cached['embed_url'],
+                "message": "Added to playlist"
             }
-            
-        finally:
-            await scraper.close()
+        
+        item_id = db.add_playlist_item_pending(
+            playlist_id=playlist_id,
+            album_id=request.album_id,
+            platform=request.platform,
+            track_number=request.track_number
+        )
+        
+        background_tasks.add_task(
+            _verify_and_update_playlist_item, item_id, album, request.platform, platform_url
+        )
+        
+        return {
+            "id": item_id,
+            "verified": False,
+            "status": "pending",
+            "message": "Added to playlist, verification in progress"
+        }
             
     except HTTPException:
         raise
@@ -2301,6 +2808,111 @@ async def add_playlist_item(
         logger.error(f"Error adding playlist item: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/playlists/{playlist_id}/items/{item_id}/status")
+async def get_playlist_item_status(playlist_id: int, item_id: int):
+    """Get the verification status of a playlist item."""
+    try:
+        item = db.get_playlist_item(playlist_id, item_id)
+        if not item:
+            raise HTTPException(status_code=404, detail="Playlist item not found")
+        
+        return {
+            "id": item['id'],
+            "status": item['verification_status'],
+            "verified": item['verification_status'] == 'verified',
+            "match_score": item['verification_score'],
+            "found_title": item['verified_title'],
+            "embed_url": item['playable_url']
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching playlist item status: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch playlist item status")
+
+@app.post("/api/playlists/{playlist_id}/items/batch")
+async def add_playlist_items_batch(playlist_id: int, items: List[PlaylistItemCreate]):
+    """
+    Add several items to a playlist with verification.
+    Verifies them concurrently on the shared browser pool (bounded by
+    PLAYLIST_VERIFY_CONCURRENCY), then inserts every
+    verified item in a single statement. Items that fail verification are
+    reported individually and do not abort the batch.
+    """
+    if not items:
+        raise HTTPException(status_code=400, detail="No items provided")
+    
+    try:
+        # Check if playlist exists
+        playlist = db.get_playlist(playlist_id)
+        if not playlist:
+            raise HTTPException(status_code=404, detail="Playlist not found")
+        
+        # Resolve albums and platform URLs up front so invalid items never touch the browser
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        pending = []
+        for index, item in enumerate(items):
+            try:
+                album = db.get_album_by_id(item.album_id)
+                if not album:
+                    raise HTTPException(status_code=404, detail="Album not found")
+                pending.append((index, item, album, _get_platform_url(album, item.platform)))
+            except HTTPException as e:
+                results[index] = {"album_id": item.album_id, "verified": False, "error": e.detail}
+        
+        verified_rows = []
+        if pending:
+            async def verify(index: int, item: PlaylistItemCreate, album: Dict[str, Any], platform_url: str):
+                try:
+                    result = await _verify_playlist_album(album, item.platform, platform_url)
+                    verified_rows.append((index, item, result))
+                except HTTPException as e:
+                    results[index] = {"album_id": item.album_id, "verified": False, "error": e.detail}
+                except Exception as e:
+                    logger.error(f"Error verifying playlist item {item.album_id}: {e}")
+                    results[index] = {"album_id": item.album_id, "verified": False, "error": str(e)}
+            
+            await asyncio.gather(*(verify(*entry) for entry in pending))
+        
+        # Keep request order for playlist positions
+        verified_rows.sort(key=lambda row: row[0])
+        item_ids = db.add_playlist_items_verified_batch(playlist_id, [
+            {
+                'album_id': item.album_id,
+                'platform': item.platform,
+                'playable_url': result['embed_url'],
+                'verification_status': 'verified',
+                'verification_score': result['match_score'],
+                'verified_title': result['title'],
+                'embed_type': result.get('type', 'video'),
+                'track_number': item.track_number
+            }
+            for _, item, result in verified_rows
+        ])
+        
+        for item_id, (index, item, result) in zip(item_ids, verified_rows):
+            results[index] = {
+                "id": item_id,
+                "album_id": item.album_id,
+                "verified": True,
+                "match_score": result['match_score'],
+                "found_title": result['title'],
+                "embed_url": result['embed_url']
+            }
+        
+        return {
+            "added": len(item_ids),
+            "failed": len(items) - len(item_ids),
+            "results": results,
+            "message": f"Added {len(item_ids)} of {len(items)} items to playlist"
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error adding playlist items: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.delete("/api/playlists/{playlist_id}/items/{item_id}")
 async def delete_playlist_item(playlist_id: int, item_id: int):
     """Remove item from playlist."""
@@ -2329,11 +2941,40 @@ async def reorder_playlist(playlist_id: int, request: ReorderRequest):
         logger.error(f"Error reordering playlist: {e}")
         raise HTTPException(status_code=500, detail="Failed to reorder playlist")
 
+# Serialized playable-links bodies per album. Kept apart from response_cache so
+# browsing many albums doesn't evict the shared endpoints' entries; cleared by
+# invalidate_album_caches() whenever album links can change.
+playable_links_cache: Dict[str, tuple] = {}  # album_id -> (body, etag, expires_at)
+PLAYABLE_LINKS_CACHE_TTL = 3600  # seconds
+PLAYABLE_LINKS_CACHE_MAX_ENTRIES = 1024
+
+def _playable_links_response(request: Request, body: bytes, etag: str, cache_status: str) -> Response:
+    """304 if the client already has this body, else the body with its validators"""
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache", "X-Cache": cache_status}
+    )
+
 @app.get("/api/albums/{album_id}/playable-links")
-async def get_playable_links(album_id: str):
-    """Get all playable links for an album."""
+async def get_playable_links(album_id: str, request: Request):
+    """
+    Get all playable links for an album. Supports conditional requests via ETag.
+    Responses are cached per album until they expire or album data changes.
+    """
+    _invalidate_on_external_writes()
+    cached = playable_links_cache.get(album_id)
+    if cached is not None:
+        body, etag, expires_at = cached
+        if time.monotonic() < expires_at:
+            return _playable_links_response(request, body, etag, "HIT")
+        del playable_links_cache[album_id]
+    
+    generation = album_cache_generation
     try:
-        album = db.get_album_by_id(album_id)
+        album = await run_read(AlbumsDatabase.get_album_by_id, album_id)
         if not album:
             raise HTTPException(status_code=404, detail="Album not found")
         
@@ -2357,12 +2998,23 @@ async def get_playable_links(album_id: str):
         else:
             links['bandcamp'] = {'available': False}
         
-        return {
+        body = orjson.dumps({
             "album_id": album_id,
             "album_name": album['album_name'],
             "band_name": album['band_name'],
             "playable_links": links
-        }
+        })
+        # Album rows are rewritten (resetting created_at) whenever their links change
+        etag = _compute_etag(album_id, album.get('created_at'), album.get('playable_verification_date'))
+        
+        # Not cached if an invalidation ran while the album was being read (it may be stale)
+        if generation == album_cache_generation:
+            # Evict the oldest entry (dicts keep insertion order) when full
+            if len(playable_links_cache) >= PLAYABLE_LINKS_CACHE_MAX_ENTRIES:
+                playable_links_cache.pop(next(iter(playable_links_cache)))
+            playable_links_cache[album_id] = (body, etag, time.monotonic() + PLAYABLE_LINKS_CACHE_TTL)
+        
+        return _playable_links_response(request, body, etag, "MISS")
         
     except HTTPException:
         raise
@@ -2370,64 +3022,217 @@ async def get_playable_links(album_id: str):
         logger.error(f"Error getting playable links: {e}")
         raise HTTPException(status_code=500, detail="Failed to get playable links")
 
+# Number of playlist items serialized per streamed chunk
+PLAYLIST_STREAM_CHUNK_SIZE = 100
+
+# Serialized dynamic playlist bodies, keyed on query params + player settings
+dynamic_playlist_cache: Dict[tuple, tuple] = {}  # key -> (body, expires_at)
+DYNAMIC_PLAYLIST_CACHE_TTL = 300  # 5 minutes, for periods reaching today or later
+DYNAMIC_PLAYLIST_PAST_CACHE_TTL = 86400  # 1 day, for periods entirely in the past
+DYNAMIC_PLAYLIST_CACHE_MAX_ENTRIES = 256
+
+# Bumped on every invalidation; part of the dynamic playlist ETag so clients
+# revalidate after album data or player settings change (the start time keeps
+# ETags from before a restart from matching)
+ALBUM_CACHE_EPOCH = int(time.time())
+album_cache_generation = 0
+
+@functools.lru_cache(maxsize=1024)
+def period_to_range(period_type: str, period_key: str) -> tuple:
+    """
+    (start_date, end_date) in YYYY-MM-DD for a day ("2024-01-15"), week
+    ("2024-W01") or month ("2024-01") period. Raises ValueError if invalid.
+    """
+    if period_type == 'day':
+        return period_key, period_key
+    if period_type == 'week':
+        year, week = period_key.split('-W')
+        first_day = datetime.strptime(f'{year}-W{week}-1', '%Y-W%W-%w')
+        last_day = first_day + timedelta(days=6)
+        return first_day.strftime('%Y-%m-%d'), last_day.strftime('%Y-%m-%d')
+    if period_type == 'month':
+        year, month = map(int, period_key.split('-'))
+        last_day = monthrange(year, month)[1]
+        return f'{year}-{month:02d}-01', f'{year}-{month:02d}-{last_day:02d}'
+    raise ValueError("Invalid period_type. Must be day, week, or month")
+
+def _get_cached_dynamic_playlist(cache_key: tuple) -> Optional[bytes]:
+    """Return a cached playlist body if it is still fresh"""
+    cached = dynamic_playlist_cache.get(cache_key)
+    if cached is None:
+        return None
+    body, expires_at = cached
+    if time.time() >= expires_at:
+        del dynamic_playlist_cache[cache_key]
+        return None
+    return body
+
+def invalidate_album_caches():
+    """Drop cached responses and playlists (call after album data or player settings change)"""
+    global album_cache_generation
+    if response_cache or dynamic_playlist_cache or playable_links_cache:
+        logger.info(
+            f"🎵 [CACHE] Invalidating {len(response_cache)} cached responses, "
+            f"{len(playable_links_cache)} cached playable links "
+            f"and {len(dynamic_playlist_cache)} cached dynamic playlists"
+        )
+    response_cache.clear()
+    playable_links_cache.clear()
+    dynamic_playlist_cache.clear()
+    album_cache_generation += 1
+
+# PRAGMA data_version last seen on the main connection (None until first checked)
+album_data_version: Optional[int] = None
+
+def _invalidate_on_external_writes():
+    """
+    Invalidate the album caches if another connection committed since the last
+    check, e.g. verify_albums.py / verify_recent_albums.py running as separate
+    processes. A single cheap pragma on the main connection.
+    """
+    global album_data_version
+    data_version = db.get_data_version()
+    if album_data_version is not None and data_version != album_data_version:
+        logger.info("🎵 [CACHE] Database changed by another connection")
+        invalidate_album_caches()
+    album_data_version = data_version
+
+async def _cache_dynamic_playlist_stream(stream, cache_key: tuple, ttl: int, generation: int):
+    """
+    Pass a streamed playlist through while keeping a copy of the body for the cache.
+    The body is only stored if no invalidation happened since the request started
+    (`generation` is album_cache_generation at that time), so stale data isn't cached.
+    """
+    parts = []
+    async for part in stream:
+        parts.append(part)
+        yield part
+    
+    if generation != album_cache_generation:
+        return
+    
+    # Evict the oldest entry (dicts keep insertion order) when full
+    if len(dynamic_playlist_cache) >= DYNAMIC_PLAYLIST_CACHE_MAX_ENTRIES:
+        dynamic_playlist_cache.pop(next(iter(dynamic_playlist_cache)))
+    dynamic_playlist_cache[cache_key] = (b''.join(parts), time.time() + ttl)
+
+def _build_playlist_item(album: sqlite3.Row, youtube_enabled: bool, bandcamp_enabled: bool) -> Dict[str, Any]:
+    """Transform an album row into a sidebar player item (hot loop: plain row indexing, no dict copies)"""
+    platforms = {}
+    
+    # Add YouTube embed if available AND enabled
+    youtube_embed_url = album['youtube_embed_url']
+    if youtube_embed_url and youtube_enabled:
+        platforms['youtube'] = {
+            'embed_url': youtube_embed_url,
+            'verified_title': album['youtube_verified_title'],
+            'verification_score': album['youtube_verification_score'],
+            'embed_type': album['youtube_embed_type']
+        }
+    
+    # Add Bandcamp embed if available AND enabled
+    bandcamp_embed_url = album['bandcamp_embed_url']
+    if bandcamp_embed_url and bandcamp_enabled:
+        platforms['bandcamp'] = {
+            'embed_url': bandcamp_embed_url,
+            'verified_title': album['bandcamp_verified_title'],
+            'verification_score': album['bandcamp_verification_score']
+        }
+    
+    return {
+        'album_id': album['album_id'],
+        'title': album['album_name'],
+        'artist': album['band_name'],
+        'type': album['type'],
+        'release_date': album['release_date'],
+        'genre': album['genre'],
+        'cover_art': album['cover_art'],
+        'cover_path': album['cover_path'],
+        'album_url': album['album_url'],
+        'platforms': platforms
+    }
+
+def _stream_dynamic_playlist(
+    albums,
+    metadata: Dict[str, Any],
+    youtube_enabled: bool,
+    bandcamp_enabled: bool,
+    connection: sqlite3.Connection
+):
+    """
+    Yield the dynamic playlist as a JSON object, items first, metadata last.
+    
+    Items are serialized in chunks so the client can start parsing while rows
+    are still being read; total_albums is only known once the cursor is drained,
+    which is why the metadata is written after the items array.
+    
+    A plain generator: it is iterated in the threadpool (blocking row reads
+    stay off the event loop) and closes the request's reader connection.
+    """
+    try:
+        yield b'{"items":['
+        
+        total_albums = 0
+        skipped_albums = 0
+        chunk = []
+        for album in albums:
+            item = _build_playlist_item(album, youtube_enabled, bandcamp_enabled)
+            if not item['platforms']:
+                skipped_albums += 1
+                continue
+        
+            chunk.append(orjson.dumps(item))
+            total_albums += 1
+            if len(chunk) >= PLAYLIST_STREAM_CHUNK_SIZE:
+                yield (b',' if total_albums > len(chunk) else b'') + b','.join(chunk)
+                chunk = []
+        
+        if chunk:
+            yield (b',' if total_albums > len(chunk) else b'') + b','.join(chunk)
+        
+        if skipped_albums > 0:
+            logger.info(f"   ⏭️  Skipped {skipped_albums} albums (no enabled platforms available)")
+        logger.info(f"   ✓ Returning {total_albums} playable items out of {total_albums + skipped_albums} total albums")
+        
+        metadata['total_albums'] = total_albums
+        # Splice the metadata object's members after the items array
+        yield b'],' + orjson.dumps(metadata)[1:]
+    finally:
+        connection.close()
+
 @app.get("/api/playlist/dynamic")
 async def get_dynamic_playlist(
+    request: Request,
     period_type: str = Query(..., description="day, week, or month"),
     period_key: str = Query(..., description="Date or period identifier"),
     genres: Optional[str] = Query(None, description="Comma-separated genre filters"),
     search: Optional[str] = Query(None, description="Search query"),
-    shuffle: bool = Query(False, description="Shuffle playlist order")
+    shuffle: bool = Query(False, description="Shuffle playlist order"),
+    limit: Optional[int] = Query(None, ge=1, description="Return at most this many albums")
 ):
     """
     Generate dynamic playlist for a period with filters.
     Returns albums with verified playable URLs ready for sidebar player.
+    The response body is streamed as albums are read from the database;
+    shuffling and limit are applied in SQL, so only the returned rows are read.
+    Unshuffled playlists support conditional requests via ETag.
     """
     logger.info(f"🎵 Dynamic playlist request: {period_type} = {period_key}")
-    logger.info(f"   Filters: genres={genres}, search={search}, shuffle={shuffle}")
+    logger.info(f"   Filters: genres={genres}, search={search}, shuffle={shuffle}, limit={limit}")
     
     try:
         # Parse genre filters
         genre_filters = [g.strip() for g in genres.split(',')] if genres else None
         
         # Calculate date range based on period type
+        try:
+            start_date, end_date = period_to_range(period_type, period_key)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         if period_type == 'day':
-            albums = db.get_albums_for_dynamic_playlist(
-                release_date=period_key,
-                genre_filters=genre_filters,
-                search_query=search,
-                only_playable=True
-            )
-        elif period_type == 'week':
-            # Period key format: "2024-W01"
-            from datetime import datetime, timedelta
-            year, week = period_key.split('-W')
-            # Calculate start and end of week
-            first_day = datetime.strptime(f'{year}-W{week}-1', '%Y-W%W-%w')
-            last_day = first_day + timedelta(days=6)
-            
-            albums = db.get_albums_for_dynamic_playlist(
-                start_date=first_day.strftime('%Y-%m-%d'),
-                end_date=last_day.strftime('%Y-%m-%d'),
-                genre_filters=genre_filters,
-                search_query=search,
-                only_playable=True
-            )
-        elif period_type == 'month':
-            # Period key format: "2024-01"
-            from datetime import datetime
-            from calendar import monthrange
-            year, month = map(int, period_key.split('-'))
-            last_day = monthrange(year, month)[1]
-            
-            albums = db.get_albums_for_dynamic_playlist(
-                start_date=f'{year}-{month:02d}-01',
-                end_date=f'{year}-{month:02d}-{last_day:02d}',
-                genre_filters=genre_filters,
-                search_query=search,
-                only_playable=True
-            )
+            date_filters = {'release_date': start_date}
         else:
-            raise HTTPException(status_code=400, detail="Invalid period_type. Must be day, week, or month")
+            date_filters = {'start_date': start_date, 'end_date': end_date}
         
         # Get player settings to filter by enabled platforms
         bandcamp_enabled = db.get_setting('player_bandcamp_enabled')
@@ -2441,68 +3246,65 @@ async def get_dynamic_playlist(
         
         logger.info(f"   Player settings: Bandcamp={bandcamp_enabled}, YouTube={youtube_enabled}")
         
-        # Shuffle if requested
-        if shuffle:
-            import random
-            random.shuffle(albums)
-        
-        # Transform to playable format
-        playlist_items = []
-        skipped_albums = 0
-        for album in albums:
-            item = {
-                'album_id': album['album_id'],
-                'title': album['album_name'],
-                'artist': album['band_name'],
-                'type': album.get('type', 'Full-length'),
-                'release_date': album['release_date'],
-                'genre': album.get('genre'),
-                'cover_art': album.get('cover_art'),
-                'cover_path': album.get('cover_path'),
-                'album_url': album.get('album_url'),
-                'platforms': {}
-            }
-            
-            # Add YouTube embed if available AND enabled
-            if album.get('youtube_embed_url') and youtube_enabled:
-                item['platforms']['youtube'] = {
-                    'embed_url': album['youtube_embed_url'],
-                    'verified_title': album.get('youtube_verified_title'),
-                    'verification_score': album.get('youtube_verification_score'),
-                    'embed_type': album.get('youtube_embed_type', 'video')
-                }
-            
-            # Add Bandcamp embed if available AND enabled
-            if album.get('bandcamp_embed_url') and bandcamp_enabled:
-                item['platforms']['bandcamp'] = {
-                    'embed_url': album['bandcamp_embed_url'],
-                    'verified_title': album.get('bandcamp_verified_title'),
-                    'verification_score': album.get('bandcamp_verification_score')
-                }
+        # Shuffled playlists must differ per request, so only ordered ones are cached
+        cache_key = None
+        headers = None
+        _invalidate_on_external_writes()
+        generation = album_cache_generation
+        if not shuffle:
+            cache_key = (period_type, period_key, genres, search, limit, bool(youtube_enabled), bool(bandcamp_enabled))
+            etag = _compute_etag('dynamic-playlist', ALBUM_CACHE_EPOCH, generation, *cache_key)
+            if _etag_matches(request, etag):
+                return _not_modified(etag)
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
             
-            # Only include if at least one ENABLED platform is available
-            if item['platforms']:
-                playlist_items.append(item)
-            else:
-                skipped_albums += 1
-        
-        if skipped_albums > 0:
-            logger.info(f"   ⏭️  Skipped {skipped_albums} albums (no enabled platforms available)")
-        
-        logger.info(f"   ✓ Returning {len(playlist_items)} playable items out of {len(albums)} total albums")
+            cached_body = _get_cached_dynamic_playlist(cache_key)
+            if cached_body is not None:
+                logger.info(f"   🎵 [CACHE HIT] Returning cached playlist")
+                return Response(content=cached_body, media_type="application/json", headers=headers)
+        
+        # Its own reader connection: the cursor is drained across threadpool threads
+        # while the response streams, and is never used by two requests at once
+        reader_db = db.reader(check_same_thread=False)
+        try:
+            albums = await asyncio.to_thread(
+                reader_db.iter_albums_for_dynamic_playlist,
+                **date_filters,
+                genre_filters=genre_filters,
+                search_query=search,
+                only_playable=True,
+                youtube_enabled=bool(youtube_enabled),
+                bandcamp_enabled=bool(bandcamp_enabled),
+                shuffle=shuffle,
+                limit=limit
+            )
+        except BaseException:
+            reader_db.connection.close()
+            raise
         
-        return {
+        metadata = {
             'period_type': period_type,
             'period_key': period_key,
-            'total_albums': len(playlist_items),
             'filters': {
                 'genres': genre_filters,
                 'search': search,
-                'shuffle': shuffle
-            },
-            'items': playlist_items
+                'shuffle': shuffle,
+                'limit': limit
+            }
         }
         
+        stream = iterate_in_threadpool(_stream_dynamic_playlist(
+            albums, metadata, youtube_enabled, bandcamp_enabled, reader_db.connection
+        ))
+        if cache_key is not None:
+            # Past periods rarely change, so keep them longer (every change, including
+            # writes by other processes, invalidates through invalidate_album_caches())
+            is_past = end_date < date.today().isoformat()
+            ttl = DYNAMIC_PLAYLIST_PAST_CACHE_TTL if is_past else DYNAMIC_PLAYLIST_CACHE_TTL
+            stream = _cache_dynamic_playlist_stream(stream, cache_key, ttl, generation)
+        
+        return StreamingResponse(stream, media_type="application/json", headers=headers)
+        
     except HTTPException:
         raise
     except Exception as e:
@@ -2519,15 +3321,43 @@ async def serve_frontend():
     else:
         return {"message": "Metal Albums API", "frontend": "not_built", "api_docs": "/docs", "admin_endpoints": ["/api/admin/scrape", "/api/admin/scrape/status", "/api/admin/summary"]}
 
-# Mount static files for React build
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that adds a Cache-Control header to every file response.
+    
+    Starlette already emits ETag/Last-Modified and answers If-None-Match with
+    304, so the header only decides how long browsers may skip revalidation.
+    """
+    
+    def __init__(self, *args, cache_control: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_control = cache_control
+    
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = self.cache_control
+        return response
+
+# Mount static files for React build (CRA emits content-hashed filenames)
 frontend_build_path = Path(__file__).parent / "frontend" / "build"
 if frontend_build_path.exists():
-    app.mount("/static", StaticFiles(directory=str(frontend_build_path / "static")), name="static")
+    app.mount(
+        "/static",
+        CachedStaticFiles(
+            directory=str(frontend_build_path / "static"),
+            cache_control="public, max-age=31536000, immutable"
+        ),
+        name="static"
+    )
 
 # Mount covers directory for album cover images
+# Covers keep their filename across re-scrapes, so they revalidate daily via ETag
 covers_path = Path(__file__).parent / "covers"
 if covers_path.exists():
-    app.mount("/covers", StaticFiles(directory=str(covers_path)), name="covers")
+    app.mount(
+        "/covers",
+        CachedStaticFiles(directory=str(covers_path), cache_control="public, max-age=86400"),
+        name="covers"
+    )
 
 class WebServer:
     """Web server wrapper for integration with orchestrator"""
@@ -2539,17 +3369,26 @@ class WebServer:
         self.thread = None
     
     def start(self):
-        """Start the web server in a separate thread"""
+        """Start the web server in a separate thread
+        
+        Runs a single worker on uvloop with the httptools parser (both come with
+        uvicorn[standard]). Multiple workers are not an option here: they need
+        the main thread, and scraping status, caches and the download queue live
+        in this process.
+        """
         def run_server():
             config = uvicorn.Config(
                 app, 
                 host=self.host, 
                 port=self.port, 
                 log_level="info",
-                access_log=False
+                access_log=False,
+                loop="uvloop",
+                http="httptools"
             )
             self.server = uvicorn.Server(config)
-            asyncio.run(self.server.serve())
+            # Server.run() installs the configured event loop before serving
+            self.server.run()
         
         self.thread = threading.Thread(target=run_server, daemon=True)
         self.thread.start()
@@ -2562,5 +3401,5 @@ class WebServer:
         logger.info("🌐 Web server stopped")
 
 if __name__ == "__main__":
-    # Run server directly
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Run server directly on uvloop + httptools (installed by uvicorn[standard])
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
@@ -4,14 +4,25 @@ YouTube Cache Manager
 Manages YouTube audio cache with LRU (Least Recently Used) eviction policy.
 """
 
-import json
+import heapq
 import logging
+import os
+import time
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Optional, List, Tuple
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# How long a cached file that was seen on disk is trusted to still be there
+# before get_cached_file() stats it again
+FILE_EXISTS_RECHECK_SECONDS = 60
+
+BYTES_PER_MB = 1024 * 1024
+BYTES_PER_GB = 1024 * 1024 * 1024
+
 
 class YouTubeCacheManager:
     """Manages YouTube audio cache with size limits and LRU eviction."""
@@ -27,99 +38,153 @@ class YouTubeCacheManager:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
         
-        self.max_size_bytes = int(max_size_gb * 1024 * 1024 * 1024)
+        self.max_size_bytes = int(max_size_gb * BYTES_PER_GB)
         self.metadata_file = self.cache_dir / "cache_metadata.json"
         
         # Load or initialize metadata
         self.metadata = self._load_metadata()
+        # Set by access-time updates, which are only written out by flush()
+        self._dirty = False
+        # video_id -> time.monotonic() when its file was last seen on disk
+        self._seen_at: Dict[str, float] = {}
         
         # Clean up orphaned files (files without metadata entries)
         self._cleanup_orphaned_files()
         
+        # Running total of size_bytes in metadata, kept in step with every change
+        self._total_size = 0
+        self.reconcile()
+        
         logger.info(f"📦 [CACHE] Initialized with max size: {max_size_gb:.2f} GB ({self.max_size_bytes:,} bytes)")
     
     def _load_metadata(self) -> Dict:
         """Load cache metadata from JSON file."""
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                    logger.info(f"📦 [CACHE] Loaded metadata for {len(metadata)} cached files")
-                    return metadata
+                with open(self.metadata_file, 'rb') as f:
+                    metadata = orjson.loads(f.read())
+                self._migrate_timestamps(metadata)
+                logger.info(f"📦 [CACHE] Loaded metadata for {len(metadata)} cached files")
+                return metadata
             except Exception as e:
                 logger.error(f"📦 [CACHE] Error loading metadata: {e}")
                 return {}
         return {}
     
+    @staticmethod
+    def _migrate_timestamps(metadata: Dict):
+        """Convert ISO (naive UTC) timestamps from older metadata files to epoch seconds."""
+        for entry in metadata.values():
+            for key in ('last_accessed', 'download_date'):
+                value = entry.get(key)
+                if isinstance(value, str):
+                    entry[key] = int(datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp())
+    
     def _save_metadata(self):
-        """Save cache metadata to JSON file."""
+        """Save cache metadata to JSON file (atomically, via a temp file)."""
+        tmp_file = self.metadata_file.with_name(self.metadata_file.name + '.tmp')
         try:
-            with open(self.metadata_file, 'w') as f:
-                json.dump(self.metadata, f, indent=2)
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(self.metadata))
+            os.replace(tmp_file, self.metadata_file)
+            self._dirty = False
         except Exception as e:
             logger.error(f"📦 [CACHE] Error saving metadata: {e}")
     
+    def flush(self):
+        """Write out buffered metadata changes (access times, added files), if any."""
+        if self._dirty:
+            self._save_metadata()
+    
     def _cleanup_orphaned_files(self):
         """Remove files that exist but aren't in metadata."""
         try:
-            all_files = set(f.name for f in self.cache_dir.iterdir() if f.is_file() and f.name != 'cache_metadata.json')
-            tracked_files = set(entry['filename'] for entry in self.metadata.values())
-            orphaned = all_files - tracked_files
-            
-            if orphaned:
-                logger.info(f"📦 [CACHE] Found {len(orphaned)} orphaned files, cleaning up...")
-                for filename in orphaned:
+            keep = {entry['filename'] for entry in self.metadata.values()}
+            keep.update((self.metadata_file.name, self.metadata_file.name + '.tmp'))
+            orphaned = 0
+            # scandir's is_file() uses the dirent type, so untracked names are the only per-file work
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name in keep or not entry.is_file():
+                        continue
+                    orphaned += 1
                     try:
-                        (self.cache_dir / filename).unlink()
-                        logger.info(f"📦 [CACHE] Deleted orphaned file: {filename}")
+                        os.unlink(entry.path)
+                        logger.info(f"📦 [CACHE] Deleted orphaned file: {entry.name}")
                     except Exception as e:
-                        logger.error(f"📦 [CACHE] Error deleting {filename}: {e}")
+                        logger.error(f"📦 [CACHE] Error deleting {entry.name}: {e}")
+            
+            if orphaned:
+                logger.info(f"📦 [CACHE] Cleaned up {orphaned} orphaned files")
         except Exception as e:
             logger.error(f"📦 [CACHE] Error during orphan cleanup: {e}")
     
-    def get_total_size(self) -> int:
-        """Calculate total cache size in bytes."""
+    def reconcile(self):
+        """
+        Sync metadata with the files on disk: drop entries whose file is gone,
+        correct recorded sizes, and recompute the total. Stats every file, so
+        it runs at startup rather than on each size check.
+        """
         total = 0
-        for video_id, entry in self.metadata.items():
+        for video_id, entry in list(self.metadata.items()):
             file_path = self.cache_dir / entry['filename']
-            if file_path.exists():
-                total += file_path.stat().st_size
-            else:
-                # File missing, remove from metadata
+            try:
+                entry['size_bytes'] = file_path.stat().st_size
+            except FileNotFoundError:
                 logger.warning(f"📦 [CACHE] File missing for {video_id}, removing from metadata")
                 del self.metadata[video_id]
+                continue
+            total += entry['size_bytes']
         
+        self._total_size = total
         self._save_metadata()
-        return total
+    
+    def _remove_entry(self, video_id: str) -> Optional[Dict]:
+        """Drop a metadata entry and its size from the running total."""
+        entry = self.metadata.pop(video_id, None)
+        self._seen_at.pop(video_id, None)
+        if entry:
+            self._total_size -= entry.get('size_bytes', 0)
+        return entry
+    
+    def get_total_size(self) -> int:
+        """Total cache size in bytes (from metadata; see reconcile())."""
+        return self._total_size
     
     def get_cache_stats(self) -> Dict:
         """Get cache statistics."""
-        total_size = self.get_total_size()
-        file_count = len(self.metadata)
+        total_size = self._total_size
+        max_size = self.max_size_bytes
+        available = max(0, max_size - total_size)
         
         return {
             'total_size_bytes': total_size,
-            'total_size_mb': total_size / (1024 * 1024),
-            'total_size_gb': total_size / (1024 * 1024 * 1024),
-            'max_size_bytes': self.max_size_bytes,
-            'max_size_gb': self.max_size_bytes / (1024 * 1024 * 1024),
-            'usage_percent': (total_size / self.max_size_bytes * 100) if self.max_size_bytes > 0 else 0,
-            'file_count': file_count,
-            'available_bytes': max(0, self.max_size_bytes - total_size),
-            'available_gb': max(0, (self.max_size_bytes - total_size) / (1024 * 1024 * 1024))
+            'total_size_mb': total_size / BYTES_PER_MB,
+            'total_size_gb': total_size / BYTES_PER_GB,
+            'max_size_bytes': max_size,
+            'max_size_gb': max_size / BYTES_PER_GB,
+            'usage_percent': (total_size / max_size * 100) if max_size > 0 else 0,
+            'file_count': len(self.metadata),
+            'available_bytes': available,
+            'available_gb': available / BYTES_PER_GB
         }
     
-    def _get_lru_files(self) -> List[Tuple[str, Dict]]:
-        """Get files sorted by last access time (oldest first)."""
-        items = []
-        for video_id, entry in self.metadata.items():
-            items.append((video_id, entry))
+    def _iter_lru_files(self) -> Iterator[Tuple[str, Dict]]:
+        """
+        Yield files by last access time (oldest first).
         
-        # Sort by last_accessed (oldest first)
-        items.sort(key=lambda x: x[1]['last_accessed'])
-        return items
+        Heap-ordered, so a cleanup that only frees a few files doesn't sort
+        the whole cache; safe to remove entries while iterating.
+        """
+        heap = [(entry['last_accessed'], video_id) for video_id, entry in self.metadata.items()]
+        heapq.heapify(heap)
+        while heap:
+            _, video_id = heapq.heappop(heap)
+            entry = self.metadata.get(video_id)
+            if entry is not None:
+                yield video_id, entry
     
-    def cleanup_if_needed(self, new_file_size_estimate: int = 10 * 1024 * 1024):
+    def cleanup_if_needed(self, new_file_size_estimate: int = 10 * BYTES_PER_MB):
         """
         Remove LRU files if cache would exceed limit.
         
@@ -129,46 +194,44 @@ class YouTubeCacheManager:
         current_size = self.get_total_size()
         
         if current_size + new_file_size_estimate <= self.max_size_bytes:
-            logger.info(f"📦 [CACHE] Space available: {(self.max_size_bytes - current_size) / (1024*1024):.2f} MB")
+            logger.debug(f"📦 [CACHE] Space available: {(self.max_size_bytes - current_size) / BYTES_PER_MB:.2f} MB")
             return
         
-        logger.info(f"📦 [CACHE] Cache cleanup needed. Current: {current_size / (1024*1024):.2f} MB, Max: {self.max_size_bytes / (1024*1024):.2f} MB")
-        
-        # Get files sorted by LRU
-        lru_files = self._get_lru_files()
+        logger.info(f"📦 [CACHE] Cache cleanup needed. Current: {current_size / BYTES_PER_MB:.2f} MB, Max: {self.max_size_bytes / BYTES_PER_MB:.2f} MB")
         
         # Delete files until we have enough space
         target_size = self.max_size_bytes - new_file_size_estimate
         deleted_count = 0
         freed_space = 0
         
-        for video_id, entry in lru_files:
+        for video_id, entry in self._iter_lru_files():
             if current_size <= target_size:
                 break
             
             file_path = self.cache_dir / entry['filename']
-            if file_path.exists():
-                try:
-                    file_size = file_path.stat().st_size
-                    file_path.unlink()
-                    current_size -= file_size
-                    freed_space += file_size
-                    deleted_count += 1
-                    logger.info(f"📦 [CACHE] Deleted LRU file: {entry['filename']} ({file_size / (1024*1024):.2f} MB)")
-                except Exception as e:
-                    logger.error(f"📦 [CACHE] Error deleting {entry['filename']}: {e}")
+            file_size = entry.get('size_bytes', 0)
+            try:
+                file_path.unlink()
+                freed_space += file_size
+                deleted_count += 1
+                logger.debug(f"📦 [CACHE] Deleted LRU file: {entry['filename']} ({file_size / BYTES_PER_MB:.2f} MB)")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.error(f"📦 [CACHE] Error deleting {entry['filename']}: {e}")
             
             # Remove from metadata
-            del self.metadata[video_id]
+            self._remove_entry(video_id)
+            current_size = self._total_size
         
         self._save_metadata()
-        logger.info(f"📦 [CACHE] Cleanup complete: Deleted {deleted_count} files, freed {freed_space / (1024*1024):.2f} MB")
+        logger.info(f"📦 [CACHE] Cleanup complete: Deleted {deleted_count} files, freed {freed_space / BYTES_PER_MB:.2f} MB")
     
     def mark_accessed(self, video_id: str):
-        """Update last_accessed timestamp for a file."""
+        """Update last_accessed timestamp for a file (saved on the next flush/save)."""
         if video_id in self.metadata:
-            self.metadata[video_id]['last_accessed'] = datetime.utcnow().isoformat()
-            self._save_metadata()
+            self.metadata[video_id]['last_accessed'] = int(time.time())
+            self._dirty = True
             logger.debug(f"📦 [CACHE] Updated access time for {video_id}")
     
     def add_file(self, video_id: str, filename: str, size_bytes: int):
@@ -180,15 +243,19 @@ class YouTubeCacheManager:
             filename: Name of cached file
             size_bytes: Size of file in bytes
         """
-        now = datetime.utcnow().isoformat()
+        now = int(time.time())
+        self._remove_entry(video_id)  # Re-download replaces the old entry
+        self._total_size += size_bytes
         self.metadata[video_id] = {
             'filename': filename,
             'size_bytes': size_bytes,
             'last_accessed': now,
             'download_date': now
         }
-        self._save_metadata()
-        logger.info(f"📦 [CACHE] Added {filename} to cache ({size_bytes / (1024*1024):.2f} MB)")
+        # Saved by the next flush like access times: a file whose entry is lost
+        # in a crash is an orphan, removed at startup and downloaded again
+        self._dirty = True
+        logger.info(f"📦 [CACHE] Added {filename} to cache ({size_bytes / BYTES_PER_MB:.2f} MB)")
     
     def get_cached_file(self, video_id: str) -> Optional[Path]:
         """
@@ -200,18 +267,33 @@ class YouTubeCacheManager:
         Returns:
             Path to cached file or None if not found
         """
-        if video_id in self.metadata:
-            file_path = self.cache_dir / self.metadata[video_id]['filename']
-            if file_path.exists():
-                self.mark_accessed(video_id)
-                return file_path
-            else:
-                # File missing, remove from metadata
+        entry = self.metadata.get(video_id)
+        if entry is None:
+            return None
+        
+        file_path = self.cache_dir / entry['filename']
+        now = time.monotonic()
+        seen_at = self._seen_at.get(video_id)
+        if seen_at is None or now - seen_at >= FILE_EXISTS_RECHECK_SECONDS:
+            if not file_path.exists():
+                # File missing, remove from metadata (saved on the next flush/save)
                 logger.warning(f"📦 [CACHE] Cached file missing for {video_id}, removing from metadata")
-                del self.metadata[video_id]
-                self._save_metadata()
+                self._remove_entry(video_id)
+                self._dirty = True
+                return None
+            self._seen_at[video_id] = now
         
-        return None
+        self.mark_accessed(video_id)
+        return file_path
+    
+    def which_cached(self, video_ids: Iterable[str]) -> Set[str]:
+        """
+        Return the ids among video_ids that have a cache entry.
+        
+        A metadata lookup only: files aren't checked on disk and access times
+        aren't updated (get_cached_file() does both when a track is played).
+        """
+        return {video_id for video_id in video_ids if video_id in self.metadata}
     
     def clear_cache(self):
         """Clear entire cache (delete all files and metadata)."""
@@ -228,6 +310,8 @@ class YouTubeCacheManager:
                     logger.error(f"📦 [CACHE] Error deleting {entry['filename']}: {e}")
         
         self.metadata = {}
+        self._seen_at.clear()
+        self._total_size = 0
         self._save_metadata()
         logger.info(f"📦 [CACHE] Cache cleared: Deleted {deleted_count} files")
     
@@ -238,11 +322,11 @@ class YouTubeCacheManager:
         Args:
             new_max_size_gb: New maximum size in gigabytes
         """
-        old_size_gb = self.max_size_bytes / (1024 * 1024 * 1024)
-        self.max_size_bytes = int(new_max_size_gb * 1024 * 1024 * 1024)
+        old_size_gb = self.max_size_bytes / BYTES_PER_GB
+        self.max_size_bytes = int(new_max_size_gb * BYTES_PER_GB)
         
         logger.info(f"📦 [CACHE] Max size updated: {old_size_gb:.2f} GB → {new_max_size_gb:.2f} GB")
         
-        # If new size is smaller, cleanup immediately
-        if new_max_size_gb < old_size_gb:
+        # Only a limit below what is cached now needs a cleanup (one metadata save)
+        if self._total_size > self.max_size_bytes:
             self.cleanup_if_needed(0)
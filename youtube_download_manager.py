@@ -5,29 +5,214 @@ Manages parallel YouTube audio downloads with queue, retry logic, and comprehens
 """
 
 import asyncio
+import atexit
+import itertools
 import logging
+import multiprocessing
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Optional, Set, Callable
+from typing import Any, Dict, Optional, Set, Callable, Tuple
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 import yt_dlp
 
 logger = logging.getLogger(__name__)
 
+# Dedicated threads for blocking yt-dlp info probes, so they never queue up in
+# (and starve) the default executor used by asyncio.to_thread elsewhere.
+# Downloads run in each manager's process pool instead (see below).
+YTDLP_MAX_WORKERS = 24
+YTDLP_EXECUTOR = ThreadPoolExecutor(max_workers=YTDLP_MAX_WORKERS, thread_name_prefix="ytdlp")
+atexit.register(YTDLP_EXECUTOR.shutdown, wait=False)
 
-class DownloadStatus(Enum):
-    """Status of a download task."""
-    QUEUED = "queued"
-    DOWNLOADING = "downloading"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    CANCELLED = "cancelled"
 
+# Seconds a download socket may sit idle before yt-dlp gives up on the read
+DOWNLOAD_SOCKET_TIMEOUT = 30
+# Extra time the server waits past download_timeout for the pool process to
+# abort the download itself (a stalled read can take one socket timeout)
+DOWNLOAD_TIMEOUT_GRACE = DOWNLOAD_SOCKET_TIMEOUT + 15
 
-@dataclass
+
+def _download_options(outtmpl: str) -> Dict:
+    """yt-dlp options for audio downloads into the cache"""
+    return {
+        # Prefer smaller audio formats: opus (best compression), m4a, then fallback
+        'format': 'bestaudio[ext=opus]/bestaudio[ext=m4a]/bestaudio[ext=webm]/bestaudio/best',
+        'outtmpl': outtmpl,
+        'quiet': False,
+        'no_warnings': False,
+        'logger': logger,
+        # Enhanced extractor args to bypass YouTube blocks
+        'extractor_args': {
+            'youtube': {
+                'player_client': ['android', 'web'],  # Try android client first, fallback to web
+                'player_skip': ['webpage', 'configs'],  # Skip unnecessary fetches
+            }
+        },
+        'http_headers': {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        },
+        'nocheckcertificate': True,
+        'geo_bypass': True,
+        'prefer_free_formats': True,
+        'postprocessors': [],
+        # A stalled connection errors out instead of hanging the pool process
+        'socket_timeout': DOWNLOAD_SOCKET_TIMEOUT,
+        # Retry settings
+        'retries': 3,
+        'fragment_retries': 5,
+        'skip_unavailable_fragments': True,
+        # Throughput: 64 KiB initial read/write buffer (yt-dlp starts at 1 KiB and
+        # grows it), ranged 10 MiB HTTP requests, and parallel DASH/HLS fragments
+        'buffersize': 64 * 1024,
+        'http_chunk_size': 10 * 1024 * 1024,
+        'concurrent_fragment_downloads': 4,
+    }
+
+# Downloads are written as <id>.dl.<ext> and renamed when complete
+DOWNLOAD_TMP_MARKER = '.dl.'
+
+# One YoutubeDL per output template, built once per worker process
+_process_ytdlp: Dict[str, yt_dlp.YoutubeDL] = {}
+# The current download's deadline and final file, as reported by yt-dlp
+# (a pool process runs one download at a time)
+_current_download: Dict[str, Any] = {}
+
+def _download_progress(progress: Dict[str, Any]):
+    """
+    yt-dlp progress hook: remember where the finished file landed and its
+    size, and abort the download once it runs past its deadline
+    """
+    if progress['status'] == 'finished':
+        _current_download['path'] = progress['filename']
+        _current_download['size'] = progress.get('total_bytes') or progress.get('downloaded_bytes')
+    elif time.monotonic() > _current_download['deadline']:
+        raise yt_dlp.utils.DownloadCancelled(f"Download timeout after {_current_download['timeout']}s")
+
+def _ytdlp_download(video_url: str, outtmpl: str, timeout: float) -> Optional[Tuple[str, int]]:
+    """
+    Download a video's audio (runs in a pool process); (path, size) of the
+    file, or None. yt-dlp writes <id>.dl.<ext>, which is renamed to <id>.<ext>
+    only once it is non-empty, so a cache file name never points at an
+    incomplete download. The download aborts itself after `timeout` seconds,
+    so a slow one doesn't keep running (and holding a pool process) after
+    the server has given up on it.
+    
+    Errors are re-raised as a plain RuntimeError with the original message:
+    yt-dlp's DownloadError keeps exc_info (a traceback), which can't be
+    pickled back to the server, so the real reason would otherwise be lost.
+    """
+    try:
+        return _ytdlp_download_in_process(video_url, outtmpl, timeout)
+    except Exception as e:
+        raise RuntimeError(str(e)) from None
+
+def _ytdlp_download_in_process(video_url: str, outtmpl: str, timeout: float) -> Optional[Tuple[str, int]]:
+    """Body of _ytdlp_download; may raise exceptions that can't be pickled"""
+    ydl = _process_ytdlp.get(outtmpl)
+    if ydl is None:
+        options = dict(_download_options(outtmpl), progress_hooks=[_download_progress])
+        ydl = _process_ytdlp[outtmpl] = yt_dlp.YoutubeDL(options)
+    _current_download.clear()
+    _current_download['timeout'] = timeout
+    _current_download['deadline'] = time.monotonic() + timeout
+    if ydl.extract_info(video_url, download=True) is None:
+        return None
+    path = _current_download.get('path')
+    if path is None:
+        return None
+    size = _current_download['size'] or os.path.getsize(path)
+    if size == 0:
+        os.unlink(path)
+        return path, 0
+    
+    directory, name = os.path.split(path)
+    video_id, _, ext = name.partition(DOWNLOAD_TMP_MARKER)
+    final_path = os.path.join(directory, f"{video_id}.{ext}")
+    os.replace(path, final_path)
+    return final_path, size
+
+def _init_download_process(level: int, log_format: Optional[str]):
+    """
+    Pool process initializer: log like the server. forkserver children don't
+    inherit its logging setup, so yt-dlp's messages (passed to this module's
+    logger) would otherwise be dropped or hit the bare stderr fallback.
+    """
+    logging.basicConfig(level=level, format=log_format or logging.BASIC_FORMAT)
+
+def _download_process_context():
+    """
+    Start method for download processes. yt-dlp's extraction (signature and
+    JS challenge solving) is CPU-bound Python that would otherwise hold the
+    server's GIL. forkserver children fork from a clean server that has only
+    imported this module, so they neither inherit the web server's threads
+    nor re-import it; elsewhere the platform default is used.
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return None
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload([__name__])
+    return context
+
+
+def _remove_partial_files(cache_dir: Path, video_id: str, log_prefix: str):
+    """
+    Delete a video's leftover partial/fragment files (blocking; run in a thread).
+    One scandir pass; filtering on DirEntry names avoids building a Path for
+    every cached file.
+    """
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.startswith(video_id):
+                continue
+            if '.part' in name or '.ytdl' in name or 'Frag' in name or DOWNLOAD_TMP_MARKER in name:
+                try:
+                    os.unlink(entry.path)
+                    logger.debug("%s Cleaned up: %s", log_prefix, name)
+                except Exception as e:
+                    logger.warning(f"{log_prefix} Could not delete {name}: {e}")
+
+def _remove_failed_files(cache_file: Path, log_prefix: str):
+    """Delete whatever a failed download left under the video's name (blocking; run in a thread)"""
+    for ext in ['.webm', '.m4a', '.mp4', '.opus', '.ogg']:
+        for failed_file in (cache_file.with_suffix(ext), cache_file.with_suffix(DOWNLOAD_TMP_MARKER[:-1] + ext)):
+            try:
+                failed_file.unlink()
+            except OSError:
+                continue
+            logger.debug("%s Cleaned up failed file: %s", log_prefix, failed_file.name)
+
+
+# Queue priorities (lower is served first); FIFO within a priority
+DOWNLOAD_PRIORITY_HIGH = 0  # Playing and upcoming tracks
+DOWNLOAD_PRIORITY_NORMAL = 10
+
+RETRY_JITTER_SECONDS = 5  # Random extra delay added to each retry's backoff
+
+
+class DownloadStatus(IntEnum):
+    """Status of a download task (int-valued so comparisons and counting stay cheap)."""
+    QUEUED = 0
+    DOWNLOADING = 1
+    COMPLETED = 2
+    FAILED = 3
+    CANCELLED = 4
+    
+    @property
+    def label(self) -> str:
+        """Lowercase name used in API responses and logs, e.g. 'queued'"""
+        return self.name.lower()
+
+
+@dataclass(slots=True)
 class DownloadTask:
-    """Represents a YouTube download task."""
+    """Represents a YouTube download task (started_at/completed_at are time.time() values)."""
     video_id: str
     video_url: str
     cache_file: Path
@@ -35,9 +220,14 @@ class DownloadTask:
     attempts: int = 0
     max_attempts: int = 3
     error: Optional[str] = None
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    started_at: Optional[float] = None
+    completed_at: Optional[float] = None
+    # time.monotonic() at the start of the current attempt, for the logged duration
+    started_monotonic: float = 0.0
     file_size_bytes: int = 0
+    priority: int = DOWNLOAD_PRIORITY_NORMAL
+    # Resolved with the cached file's Path on success, or None once it has failed for good
+    done: Optional[asyncio.Future] = None
 
 
 class YouTubeDownloadManager:
@@ -50,7 +240,8 @@ class YouTubeDownloadManager:
         cache_dir: Path,
         youtube_cache_manager,
         max_parallel: int = 3,
-        download_timeout: int = 300
+        download_timeout: int = 300,
+        queue_high_watermark: int = 100
     ):
         """
         Initialize download manager.
@@ -60,26 +251,40 @@ class YouTubeDownloadManager:
             youtube_cache_manager: YouTubeCacheManager instance for LRU management
             max_parallel: Maximum number of parallel downloads
             download_timeout: Timeout for individual downloads in seconds
+            queue_high_watermark: Queue length at which background playlist
+                tracks stop being queued (priority tracks always are)
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
         self.youtube_cache = youtube_cache_manager
         self.max_parallel = max(1, min(10, max_parallel))  # Clamp between 1-10
         self.download_timeout = download_timeout
+        self.queue_high_watermark = max(1, queue_high_watermark)
+        # Written as <video_id>.dl.<ext>, then renamed to <video_id>.<ext> (see DownloadTask.cache_file)
+        self._outtmpl = str(self.cache_dir / f'%(id)s{DOWNLOAD_TMP_MARKER}%(ext)s')
+        self._pool: Optional[ProcessPoolExecutor] = None
         
         # Download tracking
         self.active_downloads: Dict[str, DownloadTask] = {}
-        self.download_queue: asyncio.Queue = asyncio.Queue()
-        self.download_locks: Dict[str, asyncio.Lock] = {}
-        self.download_semaphore = asyncio.Semaphore(self.max_parallel)
+        # Tasks in active_downloads per status, kept in step by _set_status()
+        self._status_counts: Counter = Counter()
+        # One worker per parallel download; the worker count is the concurrency limit.
+        # Entries are (priority, sequence, task); the sequence keeps FIFO order per priority.
+        self.download_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._queue_seq = itertools.count()
         
         # Statistics
         self.total_downloads = 0
         self.successful_downloads = 0
         self.failed_downloads = 0
         
-        # Worker tasks
-        self.workers: list[asyncio.Task] = []
+        # Worker tasks by worker id; ids >= max_parallel retire after their current download.
+        # They run in the supervisor's TaskGroup, so none outlives stop_workers() or dies unlogged.
+        self.workers: Dict[int, asyncio.Task] = {}
+        self._supervisor: Optional[asyncio.Task] = None
+        self._task_group: Optional[asyncio.TaskGroup] = None
+        # Pending backoff timers that put failed tasks back on the queue
+        self._retry_timers: Set[asyncio.Task] = set()
         self.running = False
         
         logger.info(
@@ -93,26 +298,78 @@ class YouTubeDownloadManager:
             return
         
         self.running = True
-        self.workers = [
-            asyncio.create_task(self._download_worker(i))
-            for i in range(self.max_parallel)
-        ]
+        self._reset_pool()
+        self._supervisor = asyncio.create_task(self._supervise_workers())
         logger.info(f"🔧 [DOWNLOAD-MGR] Started {self.max_parallel} worker tasks")
     
+    async def _supervise_workers(self):
+        """
+        Own the worker tasks in a TaskGroup until stop_workers() cancels this task.
+        If a worker dies of an error its own handler didn't catch, the group
+        cancels the others; the error is logged and a fresh set is started.
+        """
+        while self.running:
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    self._task_group = task_group
+                    self._spawn_workers()
+                    # Keep the group open for workers spawned by update_max_parallel()
+                    await asyncio.Event().wait()
+            except* Exception as errors:
+                for error in errors.exceptions:
+                    logger.error(f"🔧 [DOWNLOAD-MGR] Worker crashed: {error!r}", exc_info=error)
+                logger.warning("🔧 [DOWNLOAD-MGR] Restarting download workers")
+                await asyncio.sleep(1)
+            finally:
+                self._task_group = None
+    
+    def _spawn_workers(self):
+        """Start a worker for every id below max_parallel that has none running"""
+        if self._task_group is None:
+            # Not supervised yet; the supervisor spawns them as soon as it starts
+            return
+        for worker_id in range(self.max_parallel):
+            worker = self.workers.get(worker_id)
+            if worker is None or worker.done():
+                self.workers[worker_id] = self._task_group.create_task(self._download_worker(worker_id))
+    
     async def stop_workers(self):
         """Stop all background worker tasks."""
         self.running = False
         
-        # Cancel all workers
-        for worker in self.workers:
-            worker.cancel()
-        
-        # Wait for workers to finish
-        await asyncio.gather(*self.workers, return_exceptions=True)
+        # Cancel pending retries, then the supervisor (its TaskGroup cancels
+        # the workers and waits for them before the supervisor finishes)
+        for timer in self._retry_timers:
+            timer.cancel()
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+            try:
+                await self._supervisor
+            except asyncio.CancelledError:
+                pass
+            self._supervisor = None
         self.workers.clear()
         
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        
         logger.info("🔧 [DOWNLOAD-MGR] Stopped all worker tasks")
     
+    def _reset_pool(self):
+        """Replace the download process pool (downloads already running finish in the old one)"""
+        old_pool = self._pool
+        root = logging.getLogger()
+        formatter = root.handlers[0].formatter if root.handlers else None
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_parallel,
+            mp_context=_download_process_context(),
+            initializer=_init_download_process,
+            initargs=(root.getEffectiveLevel(), getattr(formatter, '_fmt', None))
+        )
+        if old_pool is not None:
+            old_pool.shutdown(wait=False)
+    
     async def _download_worker(self, worker_id: int):
         """
         Background worker that processes download tasks from the queue.
@@ -123,31 +380,39 @@ class YouTubeDownloadManager:
         logger.info(f"👷 [WORKER-{worker_id}] Started")
         
         while self.running:
+            if worker_id >= self.max_parallel:
+                logger.info(f"👷 [WORKER-{worker_id}] Retiring (max_parallel lowered)")
+                break
+            
             try:
                 # Get next task from queue (with timeout to allow checking running flag)
                 try:
-                    task = await asyncio.wait_for(
+                    priority, _, task = await asyncio.wait_for(
                         self.download_queue.get(),
                         timeout=1.0
                     )
                 except asyncio.TimeoutError:
                     continue
                 
+                if priority != task.priority:
+                    # Superseded by the entry queued when the task was promoted
+                    self.download_queue.task_done()
+                    continue
+                
                 # Process the download
                 logger.info(
                     f"👷 [WORKER-{worker_id}] Processing {task.video_id} "
                     f"(attempt {task.attempts + 1}/{task.max_attempts})"
                 )
                 
-                async with self.download_semaphore:
-                    await self._execute_download(task, worker_id)
+                await self._execute_download(task, worker_id)
                 
                 # Mark task as done
                 self.download_queue.task_done()
                 
             except asyncio.CancelledError:
                 logger.info(f"👷 [WORKER-{worker_id}] Cancelled")
-                break
+                raise
             except Exception as e:
                 logger.error(f"👷 [WORKER-{worker_id}] Unexpected error: {e}")
         
@@ -162,85 +427,39 @@ class YouTubeDownloadManager:
             worker_id: ID of the worker executing this download
         """
         task.attempts += 1
-        task.status = DownloadStatus.DOWNLOADING
-        task.started_at = datetime.utcnow()
+        self._set_status(task, DownloadStatus.DOWNLOADING)
+        task.started_at = time.time()
+        task.started_monotonic = time.monotonic()
         
         log_prefix = f"⬇️  [WORKER-{worker_id}|{task.video_id}]"
         
         try:
             logger.info(f"{log_prefix} Starting download (attempt {task.attempts}/{task.max_attempts})")
             
-            # Clean up any partial downloads
-            for pattern in [f"{task.video_id}*"]:
-                for old_file in self.cache_dir.glob(pattern):
-                    if '.part' in old_file.name or '.ytdl' in old_file.name or 'Frag' in old_file.name:
-                        try:
-                            old_file.unlink()
-                            logger.debug(f"{log_prefix} Cleaned up: {old_file.name}")
-                        except Exception as e:
-                            logger.warning(f"{log_prefix} Could not delete {old_file.name}: {e}")
+            # Clean up any partial downloads (a directory scan, so off the event loop)
+            await asyncio.to_thread(_remove_partial_files, self.cache_dir, task.video_id, log_prefix)
             
             # Cleanup cache if needed (estimate 10MB for new file)
             self.youtube_cache.cleanup_if_needed(10 * 1024 * 1024)
             
-            # Download with yt-dlp
-            def download_audio():
-                ydl_opts = {
-                    # Prefer smaller audio formats: opus (best compression), m4a, then fallback
-                    'format': 'bestaudio[ext=opus]/bestaudio[ext=m4a]/bestaudio[ext=webm]/bestaudio/best',
-                    'outtmpl': str(task.cache_file.with_suffix('.%(ext)s')),
-                    'quiet': False,
-                    'no_warnings': False,
-                    'logger': logger,
-                    # Enhanced extractor args to bypass YouTube blocks
-                    'extractor_args': {
-                        'youtube': {
-                            'player_client': ['android', 'web'],  # Try android client first, fallback to web
-                            'player_skip': ['webpage', 'configs'],  # Skip unnecessary fetches
-                        }
-                    },
-                    'http_headers': {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    },
-                    'nocheckcertificate': True,
-                    'geo_bypass': True,
-                    'prefer_free_formats': True,
-                    'postprocessors': [],
-                    # Retry settings
-                    'retries': 3,
-                    'fragment_retries': 5,
-                    'skip_unavailable_fragments': True,
-                }
-                
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    return ydl.extract_info(task.video_url, download=True)
-            
-            # Run download with timeout
-            info = await asyncio.wait_for(
-                asyncio.to_thread(download_audio),
-                timeout=self.download_timeout
+            # Download with yt-dlp in the process pool; the process enforces
+            # download_timeout itself, the grace only catches a hung process
+            downloaded = await asyncio.wait_for(
+                asyncio.get_running_loop().run_in_executor(
+                    self._pool, _ytdlp_download, task.video_url, self._outtmpl, self.download_timeout
+                ),
+                timeout=self.download_timeout + DOWNLOAD_TIMEOUT_GRACE
             )
             
-            if not info:
-                raise Exception("yt-dlp returned no info")
+            if not downloaded:
+                raise Exception("yt-dlp reported no downloaded file")
             
-            # Find the downloaded file
-            cache_file = task.cache_file
-            if not cache_file.exists():
-                for ext in ['.webm', '.m4a', '.mp4', '.opus', '.ogg']:
-                    alt_file = cache_file.with_suffix(ext)
-                    if alt_file.exists():
-                        cache_file = alt_file
-                        logger.debug(f"{log_prefix} Found file with extension: {ext}")
-                        break
+            # The file yt-dlp wrote (whatever extension the chosen format has)
+            file_path, file_size = downloaded
+            cache_file = Path(file_path)
             
-            if not cache_file.exists():
-                raise Exception("Downloaded file not found")
-            
-            # Verify file is not empty
-            file_size = cache_file.stat().st_size
+            # Verify file is not empty (the pool process already deleted it)
             if file_size == 0:
-                cache_file.unlink()
                 raise Exception("Downloaded file is empty")
             
             file_size_mb = file_size / 1024 / 1024
@@ -250,67 +469,100 @@ class YouTubeDownloadManager:
             self.youtube_cache.add_file(task.video_id, cache_file.name, file_size)
             
             # Mark as completed
-            task.status = DownloadStatus.COMPLETED
-            task.completed_at = datetime.utcnow()
+            task.cache_file = cache_file
+            self._set_status(task, DownloadStatus.COMPLETED)
+            task.completed_at = time.time()
             
             # Update statistics
             self.total_downloads += 1
             self.successful_downloads += 1
             
-            duration = (task.completed_at - task.started_at).total_seconds()
+            duration = time.monotonic() - task.started_monotonic
             logger.info(
                 f"{log_prefix} ✅ Download completed: {cache_file.name} "
                 f"({file_size_mb:.2f} MB in {duration:.1f}s)"
             )
             
+        except asyncio.CancelledError:
+            if self.running:
+                # The supervisor is restarting the workers: the interrupted attempt
+                # doesn't count, and the new workers pick the task up again
+                task.attempts -= 1
+                self._set_status(task, DownloadStatus.QUEUED)
+                self.download_queue.put_nowait((task.priority, next(self._queue_seq), task))
+                logger.info(f"{log_prefix} Interrupted, queued again")
+            else:
+                # Shutting down: released below so nothing waits on it forever
+                self._set_status(task, DownloadStatus.CANCELLED)
+            raise
+            
         except asyncio.TimeoutError:
-            task.status = DownloadStatus.FAILED
+            self._set_status(task, DownloadStatus.FAILED)
             task.error = f"Download timeout after {self.download_timeout}s"
             logger.error(f"{log_prefix} ❌ Timeout after {self.download_timeout}s")
             
-            # Retry if attempts remaining
-            if task.attempts < task.max_attempts:
-                logger.info(f"{log_prefix} Retrying... ({task.attempts}/{task.max_attempts})")
-                await self.download_queue.put(task)
-            else:
-                self.total_downloads += 1
-                self.failed_downloads += 1
-                logger.error(f"{log_prefix} ❌ Failed after {task.max_attempts} attempts")
+            if self.running:
+                # The pool process is hung past its own deadline: move later downloads
+                # (including the retry) to fresh processes so it can't hold a slot
+                self._reset_pool()
+            
+            # The timeout itself was the wait, so retry almost straight away
+            self._retry_or_give_up(task, log_prefix, 1)
             
         except Exception as e:
-            task.status = DownloadStatus.FAILED
+            self._set_status(task, DownloadStatus.FAILED)
             task.error = str(e)
             logger.error(f"{log_prefix} ❌ Error: {e}")
             
+            if isinstance(e, BrokenProcessPool) and self.running:
+                # A download process died (e.g. OOM-killed); later downloads need a new pool
+                logger.warning(f"{log_prefix} Download process pool broke, restarting it")
+                self._reset_pool()
+            
             # Clean up failed files
-            for ext in ['.webm', '.m4a', '.mp4', '.opus', '.ogg']:
-                failed_file = task.cache_file.with_suffix(ext)
-                if failed_file.exists():
-                    try:
-                        failed_file.unlink()
-                        logger.debug(f"{log_prefix} Cleaned up failed file: {failed_file.name}")
-                    except:
-                        pass
+            await asyncio.to_thread(_remove_failed_files, task.cache_file, log_prefix)
             
-            # Retry if attempts remaining
-            if task.attempts < task.max_attempts:
-                # Exponential backoff before retry
-                backoff_delay = min(2 ** task.attempts, 30)  # Max 30 seconds
-                logger.info(
-                    f"{log_prefix} Retrying in {backoff_delay}s... "
-                    f"({task.attempts}/{task.max_attempts})"
-                )
-                await asyncio.sleep(backoff_delay)
-                await self.download_queue.put(task)
-            else:
-                self.total_downloads += 1
-                self.failed_downloads += 1
-                logger.error(f"{log_prefix} ❌ Failed after {task.max_attempts} attempts: {e}")
+            # Exponential backoff before retry
+            self._retry_or_give_up(task, log_prefix, min(2 ** task.attempts, 30))  # Max 30 seconds
         
         finally:
-            # Remove from active downloads
-            if task.video_id in self.active_downloads:
-                del self.active_downloads[task.video_id]
+            # Remove from active downloads once finished for good (retries stay tracked
+            # so the video isn't queued a second time while it waits)
+            if (task.status in (DownloadStatus.COMPLETED, DownloadStatus.CANCELLED)
+                    or task.attempts >= task.max_attempts):
+                if self.active_downloads.pop(task.video_id, None) is not None:
+                    self._status_counts[task.status] -= 1
+                if task.done is not None and not task.done.done():
+                    task.done.set_result(task.cache_file if task.status == DownloadStatus.COMPLETED else None)
+    
+    def _set_status(self, task: DownloadTask, status: DownloadStatus):
+        """Change a tracked task's status, keeping the per-status counts in step"""
+        if task.video_id in self.active_downloads:
+            self._status_counts[task.status] -= 1
+            self._status_counts[status] += 1
+        task.status = status
+    
+    def _retry_or_give_up(self, task: DownloadTask, log_prefix: str, base_delay: float):
+        """Schedule a retry of a failed task if it has attempts left, otherwise count it as failed"""
+        if task.attempts >= task.max_attempts:
+            self.total_downloads += 1
+            self.failed_downloads += 1
+            logger.error(f"{log_prefix} ❌ Failed after {task.max_attempts} attempts: {task.error}")
+            return
+        # Jitter keeps videos that failed together (e.g. on a YouTube 429) from retrying together
+        delay = base_delay + random.uniform(0, RETRY_JITTER_SECONDS)
+        logger.info(f"{log_prefix} Retrying in {delay:.1f}s... ({task.attempts}/{task.max_attempts})")
+        self._schedule_retry(task, delay)
+    
+    def _schedule_retry(self, task: DownloadTask, delay: float):
+        """Put a failed task back on the queue after a delay, without holding up the worker"""
+        timer = asyncio.create_task(self._requeue_later(task, delay))
+        self._retry_timers.add(timer)
+        timer.add_done_callback(self._retry_timers.discard)
+    
+    async def _requeue_later(self, task: DownloadTask, delay: float):
+        await asyncio.sleep(delay)
+        await self._enqueue(task)
     
     async def download_video(
         self,
@@ -322,7 +574,7 @@ class YouTubeDownloadManager:
         
         Args:
             video_id: YouTube video ID
-            priority: If True, add to front of queue
+            priority: If True, download ahead of non-priority videos
             
         Returns:
             Path to cached file if already available, None if queued for download
@@ -330,12 +582,19 @@ class YouTubeDownloadManager:
         # Check if already cached
         cached_file = self.youtube_cache.get_cached_file(video_id)
         if cached_file:
-            logger.debug(f"📦 [DOWNLOAD-MGR] {video_id} already cached")
+            logger.debug("📦 [DOWNLOAD-MGR] %s already cached", video_id)
             return cached_file
         
         # Check if already downloading or queued
-        if video_id in self.active_downloads:
-            logger.debug(f"⏳ [DOWNLOAD-MGR] {video_id} already in queue/downloading")
+        task = self.active_downloads.get(video_id)
+        if task is not None:
+            if priority and task.priority != DOWNLOAD_PRIORITY_HIGH and task.status == DownloadStatus.QUEUED:
+                # Now wanted for playback: queue it again ahead of the background entries
+                task.priority = DOWNLOAD_PRIORITY_HIGH
+                logger.info(f"🔥 [DOWNLOAD-MGR] Promoting queued {video_id} to priority")
+                await self._enqueue(task)
+            else:
+                logger.debug("⏳ [DOWNLOAD-MGR] %s already in queue/downloading", video_id)
             return None
         
         # Create download task
@@ -345,22 +604,30 @@ class YouTubeDownloadManager:
         task = DownloadTask(
             video_id=video_id,
             video_url=video_url,
-            cache_file=cache_file
+            cache_file=cache_file,
+            priority=DOWNLOAD_PRIORITY_HIGH if priority else DOWNLOAD_PRIORITY_NORMAL,
+            done=asyncio.get_running_loop().create_future()
         )
         
         self.active_downloads[video_id] = task
+        self._status_counts[task.status] += 1
         
         # Add to queue
         if priority:
-            # For priority, we'd need a priority queue - for now just add normally
             logger.info(f"🔥 [DOWNLOAD-MGR] Queuing {video_id} (priority)")
         else:
-            logger.info(f"➕ [DOWNLOAD-MGR] Queuing {video_id}")
+            # Background queuing runs per playlist track; download_playlist logs the summary
+            logger.debug("➕ [DOWNLOAD-MGR] Queuing %s", video_id)
         
-        await self.download_queue.put(task)
+        await self._enqueue(task)
         
         return None
     
+    async def _enqueue(self, task: DownloadTask):
+        """Queue a task at its priority (retries keep the priority they were queued with)"""
+        self._set_status(task, DownloadStatus.QUEUED)
+        await self.download_queue.put((task.priority, next(self._queue_seq), task))
+    
     async def download_playlist(
         self,
         video_ids: list[str],
@@ -389,26 +656,40 @@ class YouTubeDownloadManager:
         for i in range(current_index + 1, min(current_index + 3, len(video_ids))):
             await self.download_video(video_ids[i], priority=True)
         
-        # Queue remaining tracks in background
+        # Queue remaining tracks in background, while the queue is below its high watermark.
+        # Cached tracks are skipped with one batch lookup instead of a download_video() call each.
+        cached = self.youtube_cache.which_cached(video_ids)
         for i, video_id in enumerate(video_ids):
-            if i < current_index or i >= current_index + 3:
+            if (i < current_index or i >= current_index + 3) and video_id not in cached:
+                if self.download_queue.qsize() >= self.queue_high_watermark:
+                    logger.info(
+                        f"📋 [DOWNLOAD-MGR] Queue at high watermark ({self.queue_high_watermark}), "
+                        f"not queuing the rest of the playlist"
+                    )
+                    break
                 await self.download_video(video_id, priority=False)
     
+    async def wait_for_download(self, video_id: str, timeout: float) -> Optional[Path]:
+        """
+        Wait up to `timeout` seconds for a queued or running download to finish.
+        Every caller shares the one in-flight download; returns the cached
+        file, or None if it failed, timed out, or was never queued.
+        """
+        task = self.active_downloads.get(video_id)
+        if task is None or task.done is None:
+            return self.youtube_cache.get_cached_file(video_id)
+        try:
+            # shield: a caller giving up must not cancel the shared future
+            return await asyncio.wait_for(asyncio.shield(task.done), timeout)
+        except asyncio.TimeoutError:
+            return None
+    
     def get_download_status(self, video_id: str) -> Optional[DownloadTask]:
         """Get status of a download task."""
         return self.active_downloads.get(video_id)
     
     def get_statistics(self) -> Dict:
         """Get download statistics."""
-        active_count = len([
-            t for t in self.active_downloads.values()
-            if t.status == DownloadStatus.DOWNLOADING
-        ])
-        queued_count = len([
-            t for t in self.active_downloads.values()
-            if t.status == DownloadStatus.QUEUED
-        ])
-        
         return {
             'total_downloads': self.total_downloads,
             'successful_downloads': self.successful_downloads,
@@ -417,22 +698,27 @@ class YouTubeDownloadManager:
                 self.successful_downloads / self.total_downloads * 100
                 if self.total_downloads > 0 else 0
             ),
-            'active_downloads': active_count,
-            'queued_downloads': queued_count,
+            'active_downloads': self._status_counts[DownloadStatus.DOWNLOADING],
+            'queued_downloads': self._status_counts[DownloadStatus.QUEUED],
             'max_parallel': self.max_parallel,
         }
     
     def update_max_parallel(self, new_max: int):
         """
-        Update maximum parallel downloads.
-        Note: Requires restart of workers to take effect.
+        Update maximum parallel downloads, effective immediately.
+        Extra workers are started on an increase; on a decrease the surplus
+        workers finish their current download and then exit.
         
         Args:
             new_max: New maximum parallel downloads (1-10)
         """
         old_max = self.max_parallel
         self.max_parallel = max(1, min(10, new_max))
-        self.download_semaphore = asyncio.Semaphore(self.max_parallel)
+        if self.max_parallel == old_max:
+            return
+        if self.running:
+            self._reset_pool()
+            self._spawn_workers()
         
         logger.info(
             f"🔧 [DOWNLOAD-MGR] Max parallel downloads updated: {old_max} → {self.max_parallel}"